@@ -0,0 +1,101 @@
+"""
+Load generator for the durable job queue.
+
+Run `python benchmarks/queue_load.py --jobs 500 --processes 1 2 4` from the repo
+root. Each run enqueues `ResearchScholarOrchestrator.run` jobs for synthetic
+students (as a burst, or at `--rate` jobs/s), drains them with a worker pool,
+and prints throughput plus queue-wait / run / end-to-end latency percentiles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from run_benchmarks import DEFAULT_QUERY, BenchContext, catalog, parse_scale  # noqa: E402
+
+from research_scholar.jobs import (  # noqa: E402
+    JobQueue,
+    QueueFull,
+    WorkerPool,
+    enqueue_report,
+    load_report,
+)
+
+
+def run_load(
+    ctx: BenchContext,
+    jobs: int,
+    processes: int,
+    rate: Optional[float] = None,
+    max_depth: Optional[int] = None,
+) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp, catalog(ctx):
+        path = Path(tmp) / "jobs.db"
+        rejected = 0
+        # Workers fork after the synthetic catalog is installed, so they search it too.
+        with JobQueue(path, max_depth=max_depth) as queue, WorkerPool(path, processes, poll_interval=0.01) as pool:
+            job_ids: List[int] = []
+            started = time.perf_counter()
+            for index in range(jobs):
+                if rate:
+                    time.sleep(max(0.0, started + index / rate - time.perf_counter()))
+                profile = ctx.students[index % len(ctx.students)]
+                try:
+                    job_ids.append(
+                        enqueue_report(queue, DEFAULT_QUERY, profile, limit=10, block=rate is None)
+                    )
+                except QueueFull:
+                    rejected += 1
+            pool.drain()
+            report = load_report(queue, job_ids)
+    return {"processes": processes, "rate": rate, "rejected": rejected, **report}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the ResearchScholar job queue.")
+    parser.add_argument("--scale", type=parse_scale, default=1_000, help="Catalog size.")
+    parser.add_argument("--jobs", type=int, default=200, help="Report jobs per run.")
+    parser.add_argument(
+        "--processes", type=int, nargs="+", default=[1, 2, 4], help="Worker counts to compare."
+    )
+    parser.add_argument(
+        "--rate", type=float, default=None, help="Open-loop arrival rate in jobs/s (default: burst)."
+    )
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        default=None,
+        help="Queue depth limit; bursts block on it, open-loop arrivals are rejected.",
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the synthetic data.")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the reports.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    ctx = BenchContext(scale=args.scale, seed=args.seed, profiles=min(args.jobs, 1000))
+    reports = []
+    for processes in args.processes:
+        report = run_load(ctx, args.jobs, processes, args.rate, args.max_depth)
+        reports.append(report)
+        print(
+            f"{processes:>2} workers  {report['throughput_per_s']:>9.1f} jobs/s  "
+            f"e2e p50 {report['end_to_end_ms']['p50']:>9.1f} ms  "
+            f"p99 {report['end_to_end_ms']['p99']:>9.1f} ms  rejected {report['rejected']}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
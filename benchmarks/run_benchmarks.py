@@ -0,0 +1,501 @@
+"""
+Benchmark harness for the ResearchScholar pipeline.
+
+Run `python benchmarks/run_benchmarks.py --scale 10k --output bench.json` from the
+repo root. Pass `--baseline previous.json` to fail (exit 1) when any benchmark's
+median time regresses by more than `--tolerance`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+AGENT_ROOT = PROJECT_ROOT / "my-agent"
+if str(AGENT_ROOT) not in sys.path:
+    sys.path.append(str(AGENT_ROOT))
+
+from research_scholar import serialization, tools  # noqa: E402
+from research_scholar.batch import BatchRunner  # noqa: E402
+from research_scholar.cv_parser import extract_profile_from_text  # noqa: E402
+from research_scholar.llm_backends import FakeLatencyLLM, LatencyModel, ReplayLLM  # noqa: E402
+from research_scholar.dedup import ScholarshipDeduplicator  # noqa: E402
+from research_scholar.orchestrator import ResearchScholarOrchestrator  # noqa: E402
+from research_scholar.profile_index import ProfileIndex  # noqa: E402
+from research_scholar.profile_loader import iter_profile_chunks  # noqa: E402
+from research_scholar.reminders import ReminderScheduler  # noqa: E402
+from research_scholar.report_query import ReportQuery  # noqa: E402
+from research_scholar.store import ReportStore  # noqa: E402
+from research_scholar.synthetic import (  # noqa: E402
+    generate_profiles,
+    generate_scholarships,
+    generate_universities,
+    iter_profiles,
+)
+
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+DEFAULT_QUERY = "scholarships for women in computer science building social impact startups"
+
+
+@dataclass
+class BenchContext:
+    scale: int
+    seed: int
+    profiles: int
+    llm_latency: float = 0.005
+    # Temp dirs and open stores a benchmark keeps across its timed runs;
+    # `run_benchmark` closes them once the benchmark finishes.
+    resources: ExitStack = field(default_factory=ExitStack, repr=False)
+
+    def __post_init__(self) -> None:
+        self.scholarships = generate_scholarships(self.scale, self.seed)
+        self.universities = generate_universities(max(1, self.scale // 10), self.seed)
+        self.students = generate_profiles(self.profiles, self.seed)
+        self.scholarship_payloads = [opp.to_payload() for opp in self.scholarships]
+
+
+@dataclass
+class BenchResult:
+    name: str
+    items: int
+    repeat: int
+    min_s: float
+    median_s: float
+    mean_s: float
+    items_per_s: float
+
+
+# A benchmark receives the shared context and returns (callable, items processed per call).
+Benchmark = Callable[[BenchContext], Tuple[Callable[[], Any], int]]
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    def register(func: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = func
+        return func
+
+    return register
+
+
+@contextmanager
+def catalog(ctx: BenchContext) -> Iterator[None]:
+    """Swap the module-level catalogs in `tools` for the synthetic ones."""
+    saved = tools.SCHOLARSHIP_DB, tools.UNIVERSITY_DB
+    tools.set_catalog(ctx.scholarships, ctx.universities)
+    try:
+        yield
+    finally:
+        tools.set_catalog(*saved)
+
+
+def _student_payload(ctx: BenchContext) -> Dict[str, Any]:
+    return ctx.students[0].to_payload()
+
+
+def _ranked(ctx: BenchContext) -> List[Dict[str, Any]]:
+    eligibility = tools.matcher_filter_tool(
+        {"profile": _student_payload(ctx), "scholarships": ctx.scholarship_payloads}
+    )
+    return tools.ranker_score_tool(eligibility)["ranked"]
+
+
+@benchmark("tools.seeker_search")
+def bench_seeker(ctx: BenchContext):
+    payload = {"query": DEFAULT_QUERY, "limit": ctx.scale, "profile": _student_payload(ctx)}
+    return (lambda: tools.seeker_search_tool(payload)), ctx.scale
+
+
+@benchmark("tools.matcher_filter")
+def bench_matcher(ctx: BenchContext):
+    payload = {"profile": _student_payload(ctx), "scholarships": ctx.scholarship_payloads}
+    return (lambda: tools.matcher_filter_tool(payload)), ctx.scale
+
+
+@benchmark("tools.ranker_score")
+def bench_ranker(ctx: BenchContext):
+    payload = tools.matcher_filter_tool(
+        {"profile": _student_payload(ctx), "scholarships": ctx.scholarship_payloads}
+    )
+    return (lambda: tools.ranker_score_tool(payload)), ctx.scale
+
+
+@benchmark("tools.writer_materials")
+def bench_writer(ctx: BenchContext):
+    payload = {"profile": _student_payload(ctx), "ranked": _ranked(ctx), "top_n": ctx.scale}
+    return (lambda: tools.writer_materials_tool(payload)), ctx.scale
+
+
+@benchmark("tools.tracker_schedule")
+def bench_tracker(ctx: BenchContext):
+    payload = {"ranked": _ranked(ctx), "top_n": ctx.scale}
+    return (lambda: tools.tracker_schedule_tool(payload)), ctx.scale
+
+
+@benchmark("tools.verifier_checklist")
+def bench_verifier(ctx: BenchContext):
+    ranked = _ranked(ctx)
+    materials = tools.writer_materials_tool(
+        {"profile": _student_payload(ctx), "ranked": ranked, "top_n": ctx.scale}
+    )["materials"]
+    payload = {"ranked": ranked, "materials": materials, "top_n": ctx.scale}
+    return (lambda: tools.verifier_checklist_tool(payload)), ctx.scale
+
+
+@benchmark("tools.university_match")
+def bench_university(ctx: BenchContext):
+    payload = {"profile": _student_payload(ctx), "top_n": 3}
+    return (lambda: tools.university_match_tool(payload)), len(ctx.universities)
+
+
+@benchmark("pipeline.run")
+def bench_pipeline(ctx: BenchContext):
+    orchestrator = ResearchScholarOrchestrator()
+    profile = ctx.students[0]
+    return (lambda: orchestrator.run(DEFAULT_QUERY, profile, limit=10)), 1
+
+
+@benchmark("pipeline.batch")
+def bench_batch(ctx: BenchContext):
+    orchestrator = ResearchScholarOrchestrator()
+
+    def run_batch() -> None:
+        for profile in ctx.students:
+            orchestrator.run(DEFAULT_QUERY, profile, limit=10)
+
+    return run_batch, len(ctx.students)
+
+
+@benchmark("pipeline.batch_bounded")
+def bench_batch_bounded(ctx: BenchContext):
+    """`pipeline.batch` through `BatchRunner`: spilled reports plus merged rankings."""
+    runner = BatchRunner(memory_budget_mb=16)
+
+    def run_batch() -> None:
+        with tempfile.TemporaryDirectory(prefix="bench-batch-") as directory:
+            result = runner.run(ctx.students, DEFAULT_QUERY, limit=10, output_dir=directory)
+            for _ in result.iter_scholarship_applicants(top_k=10):
+                pass
+
+    return run_batch, len(ctx.students)
+
+
+@benchmark("reverse.eligible_students")
+def bench_reverse_match(ctx: BenchContext):
+    """Match 100 scholarships against a student base of `scale` profiles."""
+    index = ProfileIndex(generate_profiles(ctx.scale, ctx.seed))
+    scholarships = ctx.scholarships[:100]
+    return (lambda: [index.eligible_students(opp) for opp in scholarships]), len(scholarships)
+
+
+@benchmark("reminders.schedule_and_fire")
+def bench_reminders(ctx: BenchContext):
+    """Schedule 4 milestones x 3 scholarships for `scale // 12` students, then fire all."""
+    payloads = ctx.scholarship_payloads
+    reports = []
+    for index, student in enumerate(generate_profiles(max(1, ctx.scale // 12), ctx.seed)):
+        ranked = [{"scholarship": payloads[(index + k) % len(payloads)]} for k in range(3)]
+        tracker = tools.tracker_schedule_tool({"ranked": ranked, "top_n": 3})
+        reports.append({"profile": {"email": student.email}, "tracker": tracker})
+
+    def schedule_and_fire() -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            with ReminderScheduler(Path(tmp) / "reminders.db") as scheduler:
+                scheduler.schedule_reports(reports)
+                scheduler.fire_due([], today="9999-12-31", batch_size=5000)
+
+    return schedule_and_fire, len(reports) * 12
+
+
+@benchmark("reports.page_query")
+def bench_report_pages(ctx: BenchContext):
+    """Walk every 50-row page of a filtered, sorted `scale`-scholarship report."""
+    with catalog(ctx):
+        report = ResearchScholarOrchestrator().run("", ctx.students[0], limit=ctx.scale)
+    tmp = ctx.resources.enter_context(tempfile.TemporaryDirectory(prefix="bench-reports-"))
+    store = ctx.resources.enter_context(ReportStore(Path(tmp) / "reports.db"))
+    report_id = store.save_report(report)
+    query = ReportQuery(store)
+
+    def walk_pages() -> int:
+        pages, cursor = 0, None
+        while True:
+            body = query.items(
+                report_id,
+                "scholarships",
+                filters={"amount__gte": 5000},
+                sort="-score,deadline",
+                limit=50,
+                cursor=cursor,
+                fields=["id", "title", "amount", "deadline", "score"],
+            ).body
+            pages += 1
+            cursor = body["next_cursor"]
+            if cursor is None:
+                return pages
+
+    return walk_pages, len(report["ranker"]["ranked"])
+
+
+@benchmark("dedup.ingest")
+def bench_dedup(ctx: BenchContext):
+    """Ingest the catalog plus a 10% re-listed copy from a second source."""
+    relisted = [
+        dataclasses.replace(opp, id=f"MIRROR-{opp.id}", title=f"{opp.title} 2025")
+        for opp in ctx.scholarships[: max(1, ctx.scale // 10)]
+    ]
+    records = [(opp, "primary") for opp in ctx.scholarships] + [(opp, "mirror") for opp in relisted]
+
+    def ingest() -> None:
+        ScholarshipDeduplicator().add_many(records)
+
+    return ingest, len(records)
+
+
+DASHBOARD_FILTER = {
+    "and": [
+        {"facet": "effort_level", "value": "low"},
+        {"facet": "major", "value": "computer science"},
+        {"facet": "amount", "gte": 5000},
+        {"facet": "citizenship", "value": "australia"},
+    ]
+}
+
+
+@benchmark("facets.dashboard_counts")
+def bench_facet_counts(ctx: BenchContext):
+    """Count a four-facet dashboard query and aggregate every facet within it."""
+    payload = {"filters": DASHBOARD_FILTER}
+    with catalog(ctx):
+        tools.catalog_facets()  # build the index outside the timed runs
+    return (lambda: tools.facet_counts_tool(payload)), ctx.scale
+
+
+@benchmark("facets.filtered_seeker")
+def bench_filtered_seeker(ctx: BenchContext):
+    payload = {
+        "query": DEFAULT_QUERY,
+        "limit": ctx.scale,
+        "profile": _student_payload(ctx),
+        "filters": DASHBOARD_FILTER,
+    }
+    with catalog(ctx):
+        tools.catalog_facets()
+    return (lambda: tools.seeker_search_tool(payload)), ctx.scale
+
+
+@benchmark("profiles.bulk_load")
+def bench_bulk_load(ctx: BenchContext):
+    """Stream and validate `scale` JSONL profiles in 10k-row chunks."""
+    tmp = ctx.resources.enter_context(tempfile.TemporaryDirectory(prefix="bench-profiles-"))
+    path = Path(tmp) / "profiles.jsonl"
+    with path.open("wb") as fh:
+        for profile in iter_profiles(ctx.scale, ctx.seed):
+            fh.write(serialization.dumps(profile.to_payload()) + b"\n")
+
+    def load() -> None:
+        for _ in iter_profile_chunks(path):
+            pass
+
+    return load, ctx.scale
+
+
+@benchmark("cache.seeker_warm")
+def bench_seeker_warm(ctx: BenchContext):
+    payloads = [
+        {"query": DEFAULT_QUERY, "limit": 10, "profile": student.to_payload()}
+        for student in ctx.students
+    ]
+    return (lambda: [tools.seeker_search_tool(payload) for payload in payloads]), len(payloads)
+
+
+@benchmark("cache.matcher_warm")
+def bench_matcher_warm(ctx: BenchContext):
+    scholarships = ctx.scholarship_payloads[:50]
+    payloads = [
+        {"profile": student.to_payload(), "scholarships": scholarships}
+        for student in ctx.students
+    ]
+    return (lambda: [tools.matcher_filter_tool(payload) for payload in payloads]), len(payloads)
+
+
+def _cv_texts(ctx: BenchContext) -> List[str]:
+    return [
+        f"{student.name}\n{student.email}\n{student.academic_level} in {student.major}, "
+        f"GPA {student.gpa}\nBased in {student.location}\n" + "\n".join(student.experiences)
+        for student in ctx.students[:50]
+    ]
+
+
+def _fake_llm(ctx: BenchContext) -> FakeLatencyLLM:
+    latency = LatencyModel("lognormal", mean=ctx.llm_latency, spread=0.3, seed=ctx.seed)
+    return FakeLatencyLLM(latency=latency)
+
+
+@benchmark("llm.cv_extract.serial")
+def bench_cv_serial(ctx: BenchContext):
+    texts, llm = _cv_texts(ctx), _fake_llm(ctx)
+    return (lambda: [extract_profile_from_text(text, llm=llm) for text in texts]), len(texts)
+
+
+@benchmark("llm.cv_extract.threads")
+def bench_cv_threads(ctx: BenchContext):
+    texts, llm = _cv_texts(ctx), _fake_llm(ctx)
+
+    def run_concurrently() -> None:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda text: extract_profile_from_text(text, llm=llm), texts))
+
+    return run_concurrently, len(texts)
+
+
+@benchmark("llm.cv_extract.replay")
+def bench_cv_replay(ctx: BenchContext):
+    texts = _cv_texts(ctx)
+    tmp = ctx.resources.enter_context(tempfile.TemporaryDirectory(prefix="bench-replay-"))
+    replay = ReplayLLM(tmp, delegate=_fake_llm(ctx))
+    for text in texts:  # record once; timed runs are pure cache hits
+        extract_profile_from_text(text, llm=replay)
+    return (lambda: [extract_profile_from_text(text, llm=replay) for text in texts]), len(texts)
+
+
+def run_benchmark(name: str, ctx: BenchContext, repeat: int) -> BenchResult:
+    timings: List[float] = []
+    with ctx.resources, catalog(ctx):
+        func, items = BENCHMARKS[name](ctx)
+        warm = name.startswith("cache.")
+        tools.clear_result_caches()
+        if warm:
+            func()
+        for _ in range(repeat):
+            if not warm:
+                tools.clear_result_caches()
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+    median = statistics.median(timings)
+    return BenchResult(
+        name=name,
+        items=items,
+        repeat=repeat,
+        min_s=min(timings),
+        median_s=median,
+        mean_s=statistics.fmean(timings),
+        items_per_s=items / median if median else float("inf"),
+    )
+
+
+def find_regressions(
+    results: List[Dict[str, Any]], baseline: List[Dict[str, Any]], tolerance: float
+) -> List[str]:
+    previous = {entry["name"]: entry for entry in baseline}
+    regressions: List[str] = []
+    for entry in results:
+        before = previous.get(entry["name"])
+        if before and entry["items"] == before["items"]:
+            if entry["median_s"] > before["median_s"] * (1 + tolerance):
+                regressions.append(
+                    f"{entry['name']}: {before['median_s']:.4f}s -> {entry['median_s']:.4f}s"
+                )
+    return regressions
+
+
+def parse_scale(value: str) -> int:
+    return SCALES[value.lower()] if value.lower() in SCALES else int(value)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the ResearchScholar pipeline.")
+    parser.add_argument(
+        "--scale",
+        type=parse_scale,
+        default=SCALES["1k"],
+        help="Catalog size: 1k, 10k, 100k, 1m, or an explicit integer.",
+    )
+    parser.add_argument("--profiles", type=int, default=100, help="Students in batch runs.")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the synthetic data.")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark.")
+    parser.add_argument(
+        "--llm-latency",
+        type=float,
+        default=0.005,
+        help="Median simulated LLM latency in seconds for llm.* benchmarks.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        help="Run benchmarks whose name starts with this prefix (repeatable).",
+    )
+    parser.add_argument("--output", type=Path, help="Write machine-readable results here.")
+    parser.add_argument("--baseline", type=Path, help="Previous results to compare against.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed median slowdown versus the baseline (0.2 = 20%%).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    ctx = BenchContext(
+        scale=args.scale, seed=args.seed, profiles=args.profiles, llm_latency=args.llm_latency
+    )
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.only or any(name.startswith(prefix) for prefix in args.only)
+    ]
+
+    results = []
+    for name in names:
+        result = run_benchmark(name, ctx, args.repeat)
+        results.append(asdict(result))
+        print(
+            f"{result.name:<28} median {result.median_s * 1000:10.2f} ms  "
+            f"{result.items_per_s:14,.0f} items/s"
+        )
+
+    report = {
+        "meta": {
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "scale": args.scale,
+            "profiles": args.profiles,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "llm_latency": args.llm_latency,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"Results written to {args.output.resolve()}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())["results"]
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,106 @@
+"""
+Scaling benchmark for the sharded catalog.
+
+Run `python benchmarks/shard_scaling.py --scale 100k --shards 1 2 4` from the repo
+root. For each shard count it starts a `ShardedCatalog`, runs `--queries`
+exhaustive rank requests (every matching scholarship scored, top-k merged) plus
+university matches, and prints throughput, latency percentiles and the speedup
+over one shard. Shards are processes, so the speedup is bounded by the cores
+available (`cpu_count` is reported alongside). `--clients N` issues the requests
+from N threads at once, so shards work on different requests concurrently.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from run_benchmarks import DEFAULT_QUERY, BenchContext, parse_scale  # noqa: E402
+
+from research_scholar.jobs import _percentile  # noqa: E402
+from research_scholar.sharding import ShardedCatalog  # noqa: E402
+
+
+def run_shards(
+    ctx: BenchContext, shards: int, queries: int, top_k: int, clients: int = 1
+) -> Dict[str, Any]:
+    with ShardedCatalog(ctx.scholarships, ctx.universities, shards=shards, timeout=60.0) as sharded:
+        sharded.health(timeout=60.0)  # wait until every shard has built its index
+
+        def query(index: int) -> Tuple[float, bool]:
+            profile = ctx.students[index % len(ctx.students)]
+            began = time.perf_counter()
+            ranked = sharded.rank(DEFAULT_QUERY, profile, limit=top_k, exhaustive=True)
+            universities = sharded.universities(profile, top_n=top_k)
+            partial = bool(ranked.get("partial") or universities.get("partial"))
+            return time.perf_counter() - began, partial
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            results = list(pool.map(query, range(queries)))
+        elapsed = time.perf_counter() - started
+    latencies: List[float] = [latency for latency, _ in results]
+    partial = sum(flag for _, flag in results)
+    return {
+        "shards": shards,
+        "clients": clients,
+        "queries": queries,
+        "partial": partial,
+        "seconds": round(elapsed, 3),
+        "throughput_per_s": round(queries / elapsed, 2),
+        "latency_ms": {
+            "p50": round(statistics.median(latencies) * 1000, 2),
+            "p99": round(_percentile(latencies, 99) * 1000, 2),
+        },
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark scatter-gather over catalog shards.")
+    parser.add_argument("--scale", type=parse_scale, default=100_000, help="Catalog size.")
+    parser.add_argument("--queries", type=int, default=50, help="Requests per shard count.")
+    parser.add_argument(
+        "--shards", type=int, nargs="+", default=[1, 2, 4], help="Shard counts to compare."
+    )
+    parser.add_argument("--top-k", type=int, default=10, help="Results kept per request.")
+    parser.add_argument("--clients", type=int, default=1, help="Threads issuing requests.")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for the synthetic data.")
+    parser.add_argument("--output", type=Path, help="Optional JSON file for the reports.")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    ctx = BenchContext(scale=args.scale, seed=args.seed, profiles=min(args.queries, 1000))
+    print(
+        f"cpu_count {os.cpu_count()}  catalog {args.scale}  queries {args.queries}  "
+        f"clients {args.clients}"
+    )
+    reports = []
+    for shards in args.shards:
+        report = run_shards(ctx, shards, args.queries, args.top_k, args.clients)
+        report["speedup"] = round(
+            report["throughput_per_s"] / reports[0]["throughput_per_s"] if reports else 1.0, 2
+        )
+        reports.append(report)
+        print(
+            f"{shards:>2} shards  {report['throughput_per_s']:>8.2f} req/s  "
+            f"p50 {report['latency_ms']['p50']:>9.1f} ms  p99 {report['latency_ms']['p99']:>9.1f} ms  "
+            f"speedup {report['speedup']:.2f}x  partial {report['partial']}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(reports, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
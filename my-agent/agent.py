@@ -7,18 +7,20 @@ Run `python agent.py --profile profiles/sample_profile.json --query "..."`.
 from __future__ import annotations
 
 import argparse
-import json
 from pathlib import Path
-from typing import Any, Dict
 
+from research_scholar import serialization
+from research_scholar.batch import BatchRunner
 from research_scholar.models import StudentProfile
 from research_scholar.orchestrator import ResearchScholarOrchestrator
+from research_scholar.profile_loader import LoadReport, iter_profile_chunks, parse_profile
+from research_scholar.reminders import ReminderScheduler
+from research_scholar.store import ReportStore
 
 
 def load_profile(profile_path: Path) -> StudentProfile:
-    with profile_path.open() as fh:
-        data: Dict[str, Any] = json.load(fh)
-    return StudentProfile.from_dict(data)
+    # Validates every field up front instead of failing inside a pipeline stage.
+    return parse_profile(profile_path.read_bytes())
 
 
 def parse_args() -> argparse.Namespace:
@@ -47,22 +49,102 @@ def parse_args() -> argparse.Namespace:
         type=Path,
         help="Optional path to save the JSON report.",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON report (compact output is the default).",
+    )
+    parser.add_argument(
+        "--dedupe",
+        action="store_true",
+        help="Reference scholarships/universities by id with one shared catalog section.",
+    )
+    parser.add_argument(
+        "--store",
+        type=Path,
+        help="Optional SQLite database where the profile and report are persisted.",
+    )
+    parser.add_argument(
+        "--reminders",
+        type=Path,
+        help="Optional SQLite database where tracker milestones are scheduled as reminders.",
+    )
+    parser.add_argument(
+        "--cohort",
+        type=Path,
+        help="Run a whole cohort (.jsonl or .csv of profiles) instead of --profile.",
+    )
+    parser.add_argument(
+        "--batch-dir",
+        type=Path,
+        help="Directory for cohort reports and per-scholarship rankings (default: a temp dir).",
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=float,
+        default=256.0,
+        help="Approximate memory held by in-flight cohort reports.",
+    )
     return parser.parse_args()
 
 
+def print_load_report(report: LoadReport, max_errors: int = 10) -> None:
+    print(f"Profiles loaded: {report.loaded}, rejected: {report.rejected}")
+    for error in report.errors[:max_errors]:
+        print(f"  line {error.line}, {error.field}: {error.message}")
+    if len(report.errors) > max_errors:
+        print(f"  ... {len(report.errors) - max_errors} more errors")
+
+
+def run_cohort(args: argparse.Namespace) -> None:
+    load_report = LoadReport()
+    profiles = (
+        profile
+        for chunk in iter_profile_chunks(args.cohort, chunk_size=1000, report=load_report)
+        for profile in chunk
+    )
+    store = ReportStore(args.store) if args.store else None
+    try:
+        runner = BatchRunner(memory_budget_mb=args.memory_budget_mb, store=store)
+        result = runner.run(profiles, args.query, limit=args.limit, output_dir=args.batch_dir)
+    finally:
+        if store is not None:
+            store.close()
+    print_load_report(load_report)
+    print(serialization.dumps(result.stats.to_payload(), pretty=True).decode("utf-8"))
+    print(f"Reports: {result.reports_path.resolve()}")
+    print(f"Rankings: {result.rankings_path.resolve()}")
+
+
 def main() -> None:
     args = parse_args()
+    if args.cohort:
+        run_cohort(args)
+        return
     profile = load_profile(args.profile)
     orchestrator = ResearchScholarOrchestrator()
     result = orchestrator.run(query=args.query, profile=profile, limit=args.limit)
 
+    report = serialization.dedupe_report(result) if args.dedupe else result
+    encoded = serialization.dumps(report, pretty=args.pretty)
+
     print("=== ResearchScholar Report ===")
-    print(json.dumps(result, indent=2))
+    print(encoded.decode("utf-8"))
 
     if args.output:
-        args.output.write_text(json.dumps(result, indent=2))
+        args.output.write_bytes(encoded)
         print(f"\nReport saved to {args.output.resolve()}")
 
+    if args.store:
+        with ReportStore(args.store) as store:
+            report_id = store.save_report(result)
+        print(f"Report #{report_id} stored in {args.store.resolve()}")
+
+    if args.reminders:
+        with ReminderScheduler(args.reminders) as scheduler:
+            count = scheduler.schedule_report(result)
+        print(f"{count} milestone reminders scheduled in {args.reminders.resolve()}")
+
 
 if __name__ == "__main__":
     main()
@@ -24,6 +24,11 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_CV_MODEL,
         help="LLM model identifier used for structured extraction.",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the saved profile JSON (compact output is the default).",
+    )
     return parser.parse_args()
 
 
@@ -32,7 +37,9 @@ def main() -> None:
     args.output.parent.mkdir(parents=True, exist_ok=True)
 
     print(f"Parsing CV PDF: {args.pdf}")
-    profile_payload = parse_cv_to_json(args.pdf, args.output, model=args.model)
+    profile_payload = parse_cv_to_json(
+        args.pdf, args.output, model=args.model, pretty=args.pretty
+    )
 
     print(f"Profile saved to {args.output.resolve()}")
     print("=== Extracted Profile ===")
@@ -1,5 +1,6 @@
 from .models import ApplicationMaterial, ScholarshipOpportunity, StudentProfile, UniversityProgram
 from .orchestrator import ResearchScholarOrchestrator
+from .store import ReportStore
 
 __all__ = [
     "ApplicationMaterial",
@@ -7,5 +8,6 @@ __all__ = [
     "StudentProfile",
     "UniversityProgram",
     "ResearchScholarOrchestrator",
+    "ReportStore",
 ]
 
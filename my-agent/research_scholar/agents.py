@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
 from connectonion import Agent
 
+from .llm_backends import resolve_llm
 from .tools import (
     cv_parse_tool,
     matcher_filter_tool,
@@ -16,83 +21,179 @@ from .tools import (
 DEFAULT_MODEL = "co/gpt-4o-mini"
 
 
-def build_agent(name: str, system_prompt: str, tool, model: str = DEFAULT_MODEL) -> Agent:
+def build_agent(
+    name: str, system_prompt: str, tool, model: str = DEFAULT_MODEL, llm: Any = None
+) -> Agent:
+    # A supplied `llm` reuses that client (and its HTTP connection pool)
+    # instead of creating a fresh one for this agent.
     return Agent(
         name=name,
         system_prompt=system_prompt,
         tools=[tool],
         model=model,
+        llm=llm,
     )
 
 
-def build_seeker_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_seeker_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "scholarship-seeker",
         "Locate scholarships that match the query and call the search tool.",
         seeker_search_tool,
         model,
+        llm,
     )
 
 
-def build_matcher_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_matcher_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "scholarship-matcher",
         "Compare student profile to eligibility criteria and explain fits.",
         matcher_filter_tool,
         model,
+        llm,
     )
 
 
-def build_ranker_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_ranker_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "scholarship-ranker",
         "Score scholarships by fit, award amount, effort, and urgency.",
         ranker_score_tool,
         model,
+        llm,
     )
 
 
-def build_writer_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_writer_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "scholarship-writer",
         "Draft essays, CV bullets, and LOR prompts for each scholarship.",
         writer_materials_tool,
         model,
+        llm,
     )
 
 
-def build_tracker_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_tracker_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "scholarship-tracker",
         "Produce milestone schedules and reminders for deadlines.",
         tracker_schedule_tool,
         model,
+        llm,
     )
 
 
-def build_verifier_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_verifier_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "scholarship-verifier",
         "Validate application packets and highlight missing artifacts.",
         verifier_checklist_tool,
         model,
+        llm,
     )
 
 
-def build_cv_parser_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_cv_parser_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "cv-parser",
         "Extract structured student profiles from PDF resumes and save them.",
         cv_parse_tool,
         model,
+        llm,
     )
 
 
-def build_university_match_agent(model: str = DEFAULT_MODEL) -> Agent:
+def build_university_match_agent(model: str = DEFAULT_MODEL, llm: Any = None) -> Agent:
     return build_agent(
         "university-matchmaker",
         "Recommend inclusive university programs using demographics and interests.",
         university_match_tool,
         model,
+        llm,
     )
 
+
+ROLE_BUILDERS: Dict[str, Callable[..., Agent]] = {
+    "seeker": build_seeker_agent,
+    "matcher": build_matcher_agent,
+    "ranker": build_ranker_agent,
+    "writer": build_writer_agent,
+    "tracker": build_tracker_agent,
+    "verifier": build_verifier_agent,
+    "cv_parser": build_cv_parser_agent,
+    "university": build_university_match_agent,
+}
+
+
+class AgentPool:
+    """Process-wide registry of lazily built agents keyed by (role, model).
+
+    All agents for one model share a single LLM client. `get` returns the
+    calling thread's own cached handle and `lease` checks out an agent
+    exclusively, so concurrent requests never share conversation state.
+    """
+
+    def __init__(self, builders: Optional[Dict[str, Callable[..., Agent]]] = None) -> None:
+        self._builders = dict(builders or ROLE_BUILDERS)
+        self._lock = threading.Lock()
+        self._llms: Dict[str, Any] = {}
+        # Per-thread {(role, model): Agent}; a stale generation means `clear`
+        # ran since the thread last built its agents.
+        self._local = threading.local()
+        self._generation = 0
+        self._idle: Dict[Tuple[str, str], List[Agent]] = {}
+        self.built = 0
+
+    def _build(self, role: str, model: str) -> Agent:
+        if role not in self._builders:
+            raise KeyError(f"Unknown agent role '{role}'.")
+        llm = self._llms.get(model) or resolve_llm(model)
+        agent = self._builders[role](model, llm=llm)
+        self._llms.setdefault(model, agent.llm)
+        self.built += 1
+        return agent
+
+    def get(self, role: str, model: str = DEFAULT_MODEL) -> Agent:
+        local = self._local
+        if getattr(local, "generation", None) != self._generation:
+            local.agents, local.generation = {}, self._generation
+        key = (role, model)
+        if key not in local.agents:
+            with self._lock:
+                local.agents[key] = self._build(role, model)
+        return local.agents[key]
+
+    @contextmanager
+    def lease(self, role: str, model: str = DEFAULT_MODEL) -> Iterator[Agent]:
+        key = (role, model)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            agent = idle.pop() if idle else self._build(role, model)
+        try:
+            yield agent
+        finally:
+            with self._lock:
+                self._idle.setdefault(key, []).append(agent)
+
+    def llm(self, model: str = DEFAULT_MODEL) -> Any:
+        return self._llms.get(model)
+
+    def set_llm(self, model: str, llm: Any) -> None:
+        """Use `llm` for every agent built for `model` from now on."""
+        with self._lock:
+            self._llms[model] = llm
+
+    def clear(self) -> None:
+        with self._lock:
+            self._llms.clear()
+            self._idle.clear()
+            self._generation += 1
+
+
+_DEFAULT_POOL = AgentPool()
+
+
+def get_agent_pool() -> AgentPool:
+    return _DEFAULT_POOL
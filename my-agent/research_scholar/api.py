@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException, Request, Response
+
+from .report_query import QueryError, QueryResult, ReportQuery
+from .store import DEFAULT_STORE_PATH, ReportStore
+
+# Query parameters with a meaning of their own; every other parameter on a
+# collection endpoint is a filter such as `amount__gte=5000`.
+_RESERVED_PARAMS = {"sort", "limit", "cursor", "fields"}
+
+
+def _respond(result: QueryResult, response: Response):
+    response.headers["ETag"] = result.etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    if result.status == 304:
+        return Response(status_code=304, headers=dict(response.headers))
+    return result.body
+
+
+def create_app(store_path: Path | str = DEFAULT_STORE_PATH) -> FastAPI:
+    """Dashboard read API over a `ReportStore` database.
+
+    Run with `uvicorn --factory research_scholar.api:create_app`.
+    """
+    app = FastAPI(title="ResearchScholar reports")
+    query = ReportQuery(ReportStore(store_path, check_same_thread=False))
+    app.state.report_query = query
+
+    def _report_id(email: str) -> int:
+        report_id = query.latest_report_id(email)
+        if report_id is None:
+            raise HTTPException(status_code=404, detail=f"No report for {email}")
+        return report_id
+
+    def _summary(report_id: int, request: Request, response: Response, within_days: int, today):
+        try:
+            result = query.summary(
+                report_id, within_days, today, request.headers.get("if-none-match")
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from None
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Unknown report {report_id}") from None
+        return _respond(result, response)
+
+    def _items(report_id: int, collection: str, request: Request, response: Response):
+        params = request.query_params
+        fields = params.get("fields")
+        try:
+            result = query.items(
+                report_id,
+                collection,
+                filters={k: v for k, v in params.items() if k not in _RESERVED_PARAMS},
+                sort=params.get("sort"),
+                limit=int(params.get("limit", 20)),
+                cursor=params.get("cursor"),
+                fields=fields.split(",") if fields else None,
+                if_none_match=request.headers.get("if-none-match"),
+            )
+        except (QueryError, ValueError) as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from None
+        except KeyError:
+            raise HTTPException(status_code=404, detail=f"Unknown report {report_id}") from None
+        return _respond(result, response)
+
+    @app.get("/reports/{report_id}/summary")
+    def report_summary(
+        report_id: int,
+        request: Request,
+        response: Response,
+        within_days: int = 10,
+        today: Optional[str] = None,
+    ):
+        return _summary(report_id, request, response, within_days, today)
+
+    @app.get("/reports/{report_id}/{collection}")
+    def report_items(report_id: int, collection: str, request: Request, response: Response):
+        return _items(report_id, collection, request, response)
+
+    @app.get("/students/{email}/summary")
+    def student_summary(
+        email: str,
+        request: Request,
+        response: Response,
+        within_days: int = 10,
+        today: Optional[str] = None,
+    ):
+        return _summary(_report_id(email), request, response, within_days, today)
+
+    @app.get("/students/{email}/{collection}")
+    def student_items(email: str, collection: str, request: Request, response: Response):
+        return _items(_report_id(email), collection, request, response)
+
+    return app
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import gzip
+import heapq
+import itertools
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from . import serialization
+from .models import StudentProfile
+
+# A ranking row is [scholarship_id, -score, rank, student_email]: sorting rows
+# as plain lists groups them by scholarship with the best applicant first.
+RankingRow = List[Any]
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes (0 where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", "rb") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _open(path: Path, mode: str) -> IO[bytes]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "b", compresslevel=1)
+    return path.open(mode + "b")
+
+
+def _write_rows(path: Path, rows: Iterable[Any]) -> int:
+    written = 0
+    with _open(path, "w") as fh:
+        for row in rows:
+            fh.write(serialization.dumps(row) + b"\n")
+            written += 1
+    return written
+
+
+def _read_rows(path: Path) -> Iterator[Any]:
+    with _open(path, "r") as fh:
+        for line in fh:
+            yield serialization.loads(line)
+
+
+def external_merge(
+    runs: List[Path], output: Path, fan_in: int = 64, key: Optional[Callable] = None
+) -> Path:
+    """Merge sorted JSON-lines runs into `output`, at most `fan_in` files at a time.
+
+    Each pass streams rows through `heapq.merge`, so memory stays at one row
+    per open run no matter how large the inputs are. Consumes `runs`.
+    """
+    if not runs:
+        _write_rows(output, [])
+        return output
+    generation = 0
+    while len(runs) > fan_in:
+        merged: List[Path] = []
+        for start in range(0, len(runs), fan_in):
+            group = runs[start : start + fan_in]
+            target = output.with_name(f"{output.stem}.merge{generation}-{start}{output.suffix}")
+            _write_rows(target, heapq.merge(*(_read_rows(path) for path in group), key=key))
+            for path in group:
+                path.unlink()
+            merged.append(target)
+        runs, generation = merged, generation + 1
+    _write_rows(output, heapq.merge(*(_read_rows(path) for path in runs), key=key))
+    for path in runs:
+        path.unlink()
+    return output
+
+
+@dataclass
+class BatchStats:
+    reports: int = 0
+    chunks: int = 0
+    chunk_sizes: List[int] = field(default_factory=list)
+    report_bytes_estimate: float = 0.0
+    peak_traced_bytes: int = 0
+    max_rss_bytes: int = 0  # sampled after every chunk
+    seconds: float = 0.0
+
+    def to_payload(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BatchResult:
+    """Spilled outputs of one batch run; every reader streams from disk."""
+
+    directory: Path
+    reports_path: Path
+    rankings_path: Path
+    stats: BatchStats
+
+    def iter_reports(self) -> Iterator[Dict[str, Any]]:
+        for report in _read_rows(self.reports_path):
+            yield serialization.expand_report(report)
+
+    def iter_rankings(self) -> Iterator[Dict[str, Any]]:
+        """Applicant rows ordered by scholarship id, then score (best first)."""
+        for scholarship_id, negative_score, rank, email in _read_rows(self.rankings_path):
+            yield {
+                "scholarship_id": scholarship_id,
+                "student_email": email,
+                "score": -negative_score,
+                "rank": rank,
+            }
+
+    def iter_scholarship_applicants(
+        self, top_k: Optional[int] = None
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """(scholarship_id, best applicants) pairs; holds one scholarship's group at a time."""
+        for scholarship_id, rows in itertools.groupby(
+            self.iter_rankings(), key=lambda row: row["scholarship_id"]
+        ):
+            yield scholarship_id, list(itertools.islice(rows, top_k))
+
+
+class BatchRunner:
+    """Runs a cohort through `ResearchScholarOrchestrator.run` within a memory budget.
+
+    Reports are produced in chunks. Each chunk is spilled as deduplicated JSON
+    lines (gzip when `compress=True`), optionally bulk-saved to a
+    `ReportStore`, and its ranking rows are sorted into a run file; runs are
+    combined at the end with an external merge. The chunk size adapts to the
+    per-report memory observed with tracemalloc so that one chunk's reports
+    fit in `memory_budget_mb`. Tracing slows allocation, so only every
+    `probe_every`-th chunk is traced.
+    """
+
+    def __init__(
+        self,
+        orchestrator=None,
+        memory_budget_mb: float = 256.0,
+        min_chunk: int = 4,
+        max_chunk: int = 4096,
+        probe_every: int = 8,
+        compress: bool = False,
+        merge_fan_in: int = 64,
+        store=None,
+    ) -> None:
+        if orchestrator is None:
+            from .orchestrator import ResearchScholarOrchestrator
+
+            orchestrator = ResearchScholarOrchestrator()
+        self.orchestrator = orchestrator
+        self.budget_bytes = memory_budget_mb * 1024 * 1024
+        self.min_chunk = min_chunk
+        self.max_chunk = max_chunk
+        self.probe_every = max(1, probe_every)
+        self.compress = compress
+        self.merge_fan_in = merge_fan_in
+        self.store = store
+
+    def run(
+        self,
+        profiles: Iterable[StudentProfile],
+        query: str,
+        limit: int = 5,
+        output_dir: Optional[Path | str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> BatchResult:
+        directory = Path(output_dir or tempfile.mkdtemp(prefix="research-scholar-batch-"))
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = ".jsonl.gz" if self.compress else ".jsonl"
+        reports_path = directory / f"reports{suffix}"
+        runs_dir = directory / "runs"
+        runs_dir.mkdir(exist_ok=True)
+        stats = BatchStats()
+        started = time.perf_counter()
+
+        runs: List[Path] = []
+        chunk_size = self.min_chunk
+        profiles = iter(profiles)
+        with _open(reports_path, "w") as reports_out:
+            while True:
+                chunk = list(itertools.islice(profiles, chunk_size))
+                if not chunk:
+                    break
+                probe = stats.chunks % self.probe_every == 0
+                reports = self._run_chunk(chunk, query, limit, filters, probe, stats)
+                runs.append(self._spill(reports, reports_out, runs_dir / f"run{len(runs):06d}{suffix}"))
+                stats.chunks += 1
+                stats.chunk_sizes.append(len(chunk))
+                stats.reports += len(reports)
+                del reports
+                stats.max_rss_bytes = max(stats.max_rss_bytes, current_rss())
+                chunk_size = self._next_chunk_size(chunk_size, stats.report_bytes_estimate)
+
+        rankings_path = external_merge(
+            runs, directory / f"rankings{suffix}", fan_in=self.merge_fan_in
+        )
+        shutil.rmtree(runs_dir, ignore_errors=True)
+        stats.seconds = time.perf_counter() - started
+        return BatchResult(directory, reports_path, rankings_path, stats)
+
+    def _run_chunk(
+        self,
+        chunk: List[StudentProfile],
+        query: str,
+        limit: int,
+        filters: Optional[Dict[str, Any]],
+        probe: bool,
+        stats: BatchStats,
+    ) -> List[Dict[str, Any]]:
+        tracing = probe and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0] if probe else 0
+        try:
+            reports = [
+                self.orchestrator.run(query, profile, limit=limit, filters=filters)
+                for profile in chunk
+            ]
+            if probe:
+                current, peak = tracemalloc.get_traced_memory()
+                per_report = max(current - baseline, 1) / len(chunk)
+                previous = stats.report_bytes_estimate
+                # Smooth across probes; the first probe seeds the estimate.
+                stats.report_bytes_estimate = (
+                    per_report if not previous else 0.5 * previous + 0.5 * per_report
+                )
+                stats.peak_traced_bytes = max(stats.peak_traced_bytes, peak - baseline)
+        finally:
+            if tracing:
+                tracemalloc.stop()
+        return reports
+
+    def _spill(self, reports: List[Dict[str, Any]], reports_out: IO[bytes], run_path: Path) -> Path:
+        rankings: List[RankingRow] = []
+        for report in reports:
+            reports_out.write(serialization.dumps(serialization.dedupe_report(report)) + b"\n")
+            email = report["profile"]["email"]
+            for rank, entry in enumerate(report.get("ranker", {}).get("ranked", []), 1):
+                rankings.append([entry["scholarship"]["id"], -entry["score"], rank, email])
+        if self.store is not None:
+            self.store.save_reports(reports)
+        rankings.sort()
+        _write_rows(run_path, rankings)
+        return run_path
+
+    def _next_chunk_size(self, current: int, report_bytes: float) -> int:
+        if report_bytes <= 0:
+            return min(self.max_chunk, current * 2)
+        # Leave headroom for the ranking rows and serialization buffers.
+        fitted = int(0.8 * self.budget_bytes / report_bytes)
+        # Grow at most 2x per chunk so one optimistic probe cannot overshoot.
+        return max(self.min_chunk, min(self.max_chunk, fitted, current * 2))
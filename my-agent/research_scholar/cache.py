@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from . import serialization
+
+_MISSING = object()
+_EXPIRED = object()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+
+class ResultCache:
+    """Thread-safe LRU cache with optional TTL and an optional SQLite disk tier.
+
+    Keys are hashable tuples; values must be JSON-serializable when `path` is
+    set. Cached values are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        path: Optional[Path | str] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[sqlite3.Connection] = None
+        if path is not None:
+            self._disk = sqlite3.connect(str(path), check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value BLOB NOT NULL)"
+            )
+            if ttl is not None:
+                with self._disk:
+                    self._disk.execute("DELETE FROM cache WHERE stored_at < ?", (clock() - ttl,))
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and self.clock() - stored_at > self.ttl
+
+    @staticmethod
+    def _disk_key(key: Hashable) -> str:
+        return hashlib.sha256(serialization.dumps(key)).hexdigest()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._entries.move_to_end(key)
+                    self.stats.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.stats.expirations += 1
+            stored_at, value = self._disk_get(key)
+            if value is _MISSING or value is _EXPIRED:
+                if value is _EXPIRED and entry is None:
+                    self.stats.expirations += 1
+                self.stats.misses += 1
+                return default
+            self.stats.hits += 1
+            self.stats.disk_hits += 1
+            self._remember(key, value, stored_at)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._remember(key, value)
+            if self._disk is not None:
+                with self._disk:
+                    self._disk.execute(
+                        "INSERT OR REPLACE INTO cache (key, stored_at, value) VALUES (?, ?, ?)",
+                        (self._disk_key(key), self.clock(), serialization.dumps(value)),
+                    )
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                with self._disk:
+                    self._disk.execute("DELETE FROM cache")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remember(self, key: Hashable, value: Any, stored_at: Optional[float] = None) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (self.clock() if stored_at is None else stored_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _disk_get(self, key: Hashable) -> Tuple[float, Any]:
+        if self._disk is None:
+            return 0.0, _MISSING
+        row = self._disk.execute(
+            "SELECT stored_at, value FROM cache WHERE key = ?", (self._disk_key(key),)
+        ).fetchone()
+        if row is None:
+            return 0.0, _MISSING
+        if self._expired(row[0]):
+            return 0.0, _EXPIRED
+        return row[0], serialization.loads(row[1])
@@ -6,6 +6,8 @@ from typing import Any, Dict, List
 
 from connectonion import llm_do
 from pydantic import BaseModel, Field, ConfigDict
+from . import serialization
+from .llm_backends import resolve_llm
 from .models import StudentProfile
 
 
@@ -96,7 +98,9 @@ def extract_pdf_text(pdf_path: Path) -> str:
     return "\n\n".join(filter(None, contents)).strip()
 
 
-def extract_profile_from_text(cv_text: str, model: str = DEFAULT_CV_MODEL) -> ExtractedProfile:
+def extract_profile_from_text(
+    cv_text: str, model: str = DEFAULT_CV_MODEL, llm: Any = None
+) -> ExtractedProfile:
     if not cv_text.strip():
         raise ValueError("CV text is empty. Unable to extract profile.")
 
@@ -105,6 +109,7 @@ def extract_profile_from_text(cv_text: str, model: str = DEFAULT_CV_MODEL) -> Ex
         system_prompt=CV_SYSTEM_PROMPT,
         output=ExtractedProfile,
         model=model,
+        llm=llm or resolve_llm(model),
         temperature=0.1,
     )
     return profile
@@ -117,14 +122,19 @@ def parse_cv_pdf(pdf_path: Path, model: str = DEFAULT_CV_MODEL) -> ExtractedProf
     return extract_profile_from_text(cv_text, model=model)
 
 
-def save_profile_json(profile: ExtractedProfile, output_path: Path) -> Path:
+def save_profile_json(profile: ExtractedProfile, output_path: Path, pretty: bool = False) -> Path:
     payload = profile.to_student_profile_payload()
-    output_path.write_text(profile.model_dump_json(indent=2))
+    output_path.write_bytes(serialization.dumps(payload, pretty=pretty))
     return output_path
 
 
-def parse_cv_to_json(pdf_path: Path, output_path: Path, model: str = DEFAULT_CV_MODEL) -> Dict[str, Any]:
+def parse_cv_to_json(
+    pdf_path: Path,
+    output_path: Path,
+    model: str = DEFAULT_CV_MODEL,
+    pretty: bool = False,
+) -> Dict[str, Any]:
     profile = parse_cv_pdf(pdf_path, model=model)
-    save_profile_json(profile, output_path)
+    save_profile_json(profile, output_path, pretty=pretty)
     return profile.to_student_profile_payload()
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import List
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List
 
+from .dedup import deduplicate_scholarships
 from .models import ScholarshipOpportunity, UniversityProgram
 
 
@@ -65,6 +67,39 @@ def load_demo_scholarships() -> List[ScholarshipOpportunity]:
     ]
 
 
+@dataclass
+class AggregatedCatalog:
+    """Merged scholarships plus, per canonical id, the source listings behind it."""
+
+    records: List[ScholarshipOpportunity]
+    provenance: Dict[str, List[Dict[str, Any]]]
+
+    def merged(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Only the canonical records built from more than one listing, for auditing."""
+        return {key: sources for key, sources in self.provenance.items() if len(sources) > 1}
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "records": [record.to_payload() for record in self.records],
+            "provenance": self.provenance,
+        }
+
+
+def aggregate_scholarships(
+    sources: Dict[str, Iterable[ScholarshipOpportunity]], threshold: float = 0.6
+) -> AggregatedCatalog:
+    """Merge several source catalogs, collapsing near-duplicate listings.
+
+    Pass `.records` to `tools.set_catalog`; `.provenance` records which
+    source listings (source, id, title, url) each record was merged from.
+    """
+    canonical = deduplicate_scholarships(sources, threshold)
+    return AggregatedCatalog(
+        records=[entry.record for entry in canonical],
+        provenance={entry.record.id: entry.sources for entry in canonical},
+    )
+
+
 def load_demo_universities() -> List[UniversityProgram]:
     """Return a small catalog of inclusive university programs."""
     return [
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import random
+import re
+import threading
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field, fields, replace
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import ScholarshipOpportunity
+
+try:  # Optional vectorized signatures; results are identical to the pure-Python path.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+_MASK64 = (1 << 64) - 1
+_MAX_HASH = (1 << 32) - 1
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def _shingle_text(opp: ScholarshipOpportunity) -> str:
+    text = f"{opp.title} {opp.sponsor} {opp.description}".lower()
+    return _NON_ALNUM.sub(" ", text).strip()
+
+
+def shingles(text: str, size: int = 4) -> Set[str]:
+    """Character `size`-grams; short texts fall back to the whole string."""
+    if len(text) <= size:
+        return {text}
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def _hash32(shingle: str) -> int:
+    return zlib.crc32(shingle.encode("utf-8"))
+
+
+class MinHasher:
+    """Seeded multiply-shift hash permutations producing fixed-length MinHash signatures.
+
+    Each permutation maps a 32-bit shingle hash `h` to `((a * h + b) mod 2**64) >> 32`.
+    """
+
+    def __init__(self, num_perm: int = 120, seed: int = 1, use_numpy: bool = True) -> None:
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._perms = [(rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(num_perm)]
+        self._vectorized = use_numpy and np is not None
+        if self._vectorized:
+            self._a = np.array([a for a, _ in self._perms], dtype=np.uint64)[:, None]
+            self._b = np.array([b for _, b in self._perms], dtype=np.uint64)[:, None]
+
+    def signature(self, tokens: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [_hash32(token) for token in tokens]
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        if self._vectorized:
+            values = np.array(hashes, dtype=np.uint64)[None, :]
+            permuted = (self._a * values + self._b) >> np.uint64(32)  # uint64 wraps mod 2**64
+            return tuple(int(v) for v in permuted.min(axis=1))
+        return tuple(
+            min(((a * h + b) & _MASK64) >> 32 for h in hashes) for a, b in self._perms
+        )
+
+
+def estimated_jaccard(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+@dataclass
+class CanonicalScholarship:
+    record: ScholarshipOpportunity
+    sources: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {**self.record.to_payload(), "sources": self.sources}
+
+
+class ScholarshipDeduplicator:
+    """Incremental near-duplicate detection with MinHash signatures and LSH banding.
+
+    Each incoming record is hashed into `bands` buckets of `rows` signature
+    values; only canonical records sharing a bucket are compared, so ingestion
+    cost stays proportional to the number of candidates, not the catalog size.
+    The default 24 bands x 5 rows finds pairs at Jaccard 0.6 with ~86%
+    probability (0.7: >99%) while pairs at 0.2 collide less than 1% of the time.
+    Candidates whose estimated Jaccard similarity reaches `threshold` are
+    merged into the first-seen canonical record, keeping per-source provenance.
+    Re-ingesting a `(source, id)` with changed fields takes it out of its
+    canonical record (rebuilt from the remaining sources) and matches it again.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        num_perm: int = 120,
+        bands: int = 24,
+        shingle_size: int = 4,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands.")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self._hasher = MinHasher(num_perm, seed)
+        self._lock = threading.Lock()
+        self._buckets: List[Dict[Tuple[int, ...], List[str]]] = [
+            defaultdict(list) for _ in range(bands)
+        ]
+        # One signature store: matrix rows with numpy, so a bucket's candidates
+        # are verified in one vectorized comparison; a dict of tuples otherwise.
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._row_of: Dict[str, int] = {}
+        self._next_row = 0
+        self._matrix = np.zeros((1024, num_perm), dtype=np.uint64) if np is not None else None
+        self._canonical: Dict[str, CanonicalScholarship] = {}
+        self._alias: Dict[Tuple[str, str], str] = {}
+        # Latest version ingested per (source, id), to spot changed re-ingests
+        # and to rebuild a canonical record when one of its sources changes.
+        self._seen: Dict[Tuple[str, str], ScholarshipOpportunity] = {}
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def signature(self, opp: ScholarshipOpportunity) -> Tuple[int, ...]:
+        return self._hasher.signature(shingles(_shingle_text(opp), self.shingle_size))
+
+    def add(self, opp: ScholarshipOpportunity, source: str = "unknown") -> str:
+        """Ingest one record and return the id of its canonical scholarship."""
+        signature = self.signature(opp)
+        key = (source, opp.id)
+        with self._lock:
+            if key in self._alias:
+                if self._seen[key] == opp:
+                    return self._alias[key]
+                self._detach(key)
+            match_id = self._best_match(opp, signature)
+            provenance = {"source": source, "id": opp.id, "title": opp.title, "url": opp.url}
+            if match_id is None:
+                match_id = opp.id if opp.id not in self._canonical else f"{source}:{opp.id}"
+                self._canonical[match_id] = CanonicalScholarship(
+                    record=replace(opp, id=match_id), sources=[provenance]
+                )
+                self._store_signature(match_id, signature)
+                self._index(match_id, signature)
+            else:
+                canonical = self._canonical[match_id]
+                canonical.record = _fill_missing(canonical.record, opp)
+                canonical.sources.append(provenance)
+            self._alias[key] = match_id
+            self._seen[key] = opp
+            return match_id
+
+    def add_many(self, records: Iterable[Tuple[ScholarshipOpportunity, str]]) -> List[str]:
+        return [self.add(opp, source) for opp, source in records]
+
+    def canonical(self) -> List[CanonicalScholarship]:
+        return list(self._canonical.values())
+
+    def canonical_records(self) -> List[ScholarshipOpportunity]:
+        return [entry.record for entry in self._canonical.values()]
+
+    def resolve(self, source: str, record_id: str) -> Optional[str]:
+        return self._alias.get((source, record_id))
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [signature[band * self.rows : (band + 1) * self.rows] for band in range(self.bands)]
+
+    def _best_match(
+        self, opp: ScholarshipOpportunity, signature: Tuple[int, ...]
+    ) -> Optional[str]:
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+        if not candidates:
+            return None
+        if self._matrix is not None:
+            ordered = list(candidates)
+            rows = self._matrix[[self._row_of[c] for c in ordered]]
+            scores = (rows == np.array(signature, dtype=np.uint64)).mean(axis=1)
+            for index in np.argsort(-scores, kind="stable"):
+                if scores[index] < self.threshold:
+                    return None
+                if _compatible(opp, self._canonical[ordered[index]].record):
+                    return ordered[index]
+            return None
+        best_id, best_score = None, self.threshold
+        for candidate in candidates:
+            if not _compatible(opp, self._canonical[candidate].record):
+                continue
+            score = estimated_jaccard(signature, self._signatures[candidate])
+            if score >= best_score:
+                best_id, best_score = candidate, score
+        return best_id
+
+    def _detach(self, key: Tuple[str, str]) -> None:
+        """Remove one source from its canonical record, rebuilding it from the rest."""
+        canonical_id = self._alias.pop(key)
+        del self._seen[key]
+        canonical = self._canonical[canonical_id]
+        canonical.sources = [p for p in canonical.sources if (p["source"], p["id"]) != key]
+        self._unindex(canonical_id)
+        if not canonical.sources:
+            del self._canonical[canonical_id]
+            self._signatures.pop(canonical_id, None)
+            self._row_of.pop(canonical_id, None)
+            return
+        members = [self._seen[(p["source"], p["id"])] for p in canonical.sources]
+        record = replace(members[0], id=canonical_id)
+        for other in members[1:]:
+            record = _fill_missing(record, other)
+        canonical.record = record
+        signature = self.signature(members[0])
+        self._store_signature(canonical_id, signature)
+        self._index(canonical_id, signature)
+
+    def _index(self, canonical_id: str, signature: Tuple[int, ...]) -> None:
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band][key].append(canonical_id)
+
+    def _unindex(self, canonical_id: str) -> None:
+        for band, key in enumerate(self._band_keys(self._signature_of(canonical_id))):
+            bucket = self._buckets[band][key]
+            bucket.remove(canonical_id)
+            if not bucket:
+                del self._buckets[band][key]
+
+    def _signature_of(self, canonical_id: str) -> Tuple[int, ...]:
+        if self._matrix is None:
+            return self._signatures[canonical_id]
+        return tuple(int(v) for v in self._matrix[self._row_of[canonical_id]])
+
+    def _store_signature(self, canonical_id: str, signature: Tuple[int, ...]) -> None:
+        if self._matrix is None:
+            self._signatures[canonical_id] = signature
+            return
+        row = self._row_of.get(canonical_id)
+        if row is None:
+            row, self._next_row = self._next_row, self._next_row + 1
+            if row == len(self._matrix):
+                self._matrix = np.concatenate([self._matrix, np.zeros_like(self._matrix)])
+            self._row_of[canonical_id] = row
+        self._matrix[row] = signature
+
+
+# Eligibility lists that must agree (as sets) when both listings state them.
+_ELIGIBILITY_LISTS = ("majors", "citizenship", "location", "demographics")
+
+
+def _compatible(left: ScholarshipOpportunity, right: ScholarshipOpportunity) -> bool:
+    """Similar text alone is not enough to merge two listings.
+
+    They must not disagree on anything that changes who can apply or what
+    they get. The checked fields are sponsor, currency, deadline, award size
+    (within 25%), minimum GPA and each eligibility list. A field missing on
+    either side does not count as a conflict. Conflicting listings stay
+    separate records rather than one silently replacing the other.
+    """
+    if left.sponsor and right.sponsor and _normalize(left.sponsor) != _normalize(right.sponsor):
+        return False
+    if left.currency and right.currency and left.currency != right.currency:
+        return False
+    if left.deadline and right.deadline and left.deadline != right.deadline:
+        return False
+    if left.amount and right.amount:
+        if abs(left.amount - right.amount) > 0.25 * max(left.amount, right.amount):
+            return False
+    rules, other = left.eligibility or {}, right.eligibility or {}
+    if rules.get("min_gpa") and other.get("min_gpa") and rules["min_gpa"] != other["min_gpa"]:
+        return False
+    for key in _ELIGIBILITY_LISTS:
+        mine, theirs = rules.get(key), other.get(key)
+        if mine and theirs and {_normalize(v) for v in mine} != {_normalize(v) for v in theirs}:
+            return False
+    return True
+
+
+def _normalize(value: str) -> str:
+    return value.lower().strip()
+
+
+def _fill_missing(primary: ScholarshipOpportunity, other: ScholarshipOpportunity):
+    """Keep the canonical record's values, borrowing any field (or eligibility rule) it left empty."""
+    updates = {
+        f.name: getattr(other, f.name)
+        for f in fields(primary)
+        if f.name != "id" and not getattr(primary, f.name) and getattr(other, f.name)
+    }
+    if primary.eligibility and other.eligibility:
+        borrowed = {
+            key: value
+            for key, value in other.eligibility.items()
+            if value and not primary.eligibility.get(key)
+        }
+        if borrowed:
+            updates["eligibility"] = {**primary.eligibility, **borrowed}
+    return replace(primary, **updates) if updates else primary
+
+
+def deduplicate_scholarships(
+    sources: Dict[str, Iterable[ScholarshipOpportunity]], threshold: float = 0.6
+) -> List[CanonicalScholarship]:
+    deduplicator = ScholarshipDeduplicator(threshold=threshold)
+    for source, records in sources.items():
+        for opp in records:
+            deduplicator.add(opp, source)
+    return deduplicator.canonical()
@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import bisect
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .models import ScholarshipOpportunity
+
+try:  # Optional: unpacks bitmaps into positions without a Python-level bit loop.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+ANY = "any"
+
+# Facets whose "any" entries (or empty lists) mean "open to everyone". Matching
+# a value on one of them includes the wildcard postings, exactly as the seeker's
+# location filter and the matcher's major/citizenship rules treat "any".
+WILDCARD_FACETS = ("major", "citizenship", "location", "demographic")
+VALUE_FACETS = WILDCARD_FACETS + ("effort_level", "currency")
+RANGE_FACETS = ("amount", "min_gpa", "deadline")
+
+_CHUNK_BYTES = 8192
+_BYTE_POSITIONS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def _normalize(text: Any) -> str:
+    return str(text).lower().strip()
+
+
+def _facet_values(opp: ScholarshipOpportunity) -> Iterator[Tuple[str, List[Any]]]:
+    """Raw (facet, values) pairs; empty wildcard-facet lists mean "any"."""
+    rules = opp.eligibility
+    yield "major", rules.get("majors") or [ANY]
+    yield "citizenship", rules.get("citizenship") or [ANY]
+    yield "location", rules.get("location", [])
+    yield "demographic", rules.get("demographics") or [ANY]
+    yield "effort_level", [opp.effort_level] if opp.effort_level else []
+    yield "currency", [opp.currency] if opp.currency else []
+
+
+def _range_value(opp: ScholarshipOpportunity, facet: str) -> Any:
+    if facet == "amount":
+        return opp.amount or 0
+    if facet == "min_gpa":
+        return opp.eligibility.get("min_gpa", 0)
+    return opp.deadline
+
+
+def _bitmap(positions: Sequence[int], size: int) -> int:
+    """Pack ascending positions into an int whose bit `i` marks record `i`."""
+    if np is not None and len(positions) > 64:
+        bits = np.zeros(size, dtype=bool)
+        bits[np.asarray(positions, dtype=np.int64)] = True
+        return int.from_bytes(np.packbits(bits, bitorder="little").tobytes(), "little")
+    packed = bytearray((size + 7) // 8)
+    for position in positions:
+        packed[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(packed, "little")
+
+
+def iter_positions(bitmap: int) -> Iterator[int]:
+    """Yield the set bit positions of `bitmap` in ascending order, lazily per chunk."""
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    for start in range(0, len(data), _CHUNK_BYTES):
+        chunk = data[start : start + _CHUNK_BYTES]
+        base = start * 8
+        if np is not None:
+            bits = np.unpackbits(np.frombuffer(chunk, dtype=np.uint8), bitorder="little")
+            for position in np.flatnonzero(bits).tolist():
+                yield base + position
+            continue
+        for offset, byte in enumerate(chunk):
+            if byte:
+                for bit in _BYTE_POSITIONS[byte]:
+                    yield base + offset * 8 + bit
+
+
+# -- filter expressions -----------------------------------------------------------
+
+
+class Expr(ABC):
+    """Filter expression over a `FacetIndex`; combine with `&`, `|` and `~`."""
+
+    def __and__(self, other: "Expr") -> "Expr":
+        return And(self, other)
+
+    def __or__(self, other: "Expr") -> "Expr":
+        return Or(self, other)
+
+    def __invert__(self) -> "Expr":
+        return Not(self)
+
+    @abstractmethod
+    def key(self) -> Tuple[Any, ...]:
+        """Canonical hashable form, used in result-cache keys."""
+
+
+class Term(Expr):
+    """Records carrying `value` for `facet`; `exact=False` also admits "any" postings."""
+
+    def __init__(self, facet: str, value: Any, exact: bool = False) -> None:
+        if facet not in VALUE_FACETS:
+            raise ValueError(f"Unknown facet '{facet}'.")
+        self.facet = facet
+        self.value = _normalize(value)
+        self.exact = exact or facet not in WILDCARD_FACETS
+
+    def key(self) -> Tuple[Any, ...]:
+        return ("term", self.facet, self.value, self.exact)
+
+
+class Range(Expr):
+    """Records whose `facet` value lies in [low, high]; either bound may be None."""
+
+    def __init__(self, facet: str, low: Any = None, high: Any = None) -> None:
+        if facet not in RANGE_FACETS:
+            raise ValueError(f"Unknown range facet '{facet}'.")
+        self.facet = facet
+        self.low = low
+        self.high = high
+
+    def key(self) -> Tuple[Any, ...]:
+        return ("range", self.facet, self.low, self.high)
+
+
+class And(Expr):
+    def __init__(self, *operands: Expr) -> None:
+        self.operands = operands
+
+    def key(self) -> Tuple[Any, ...]:
+        return ("and", *sorted((operand.key() for operand in self.operands), key=repr))
+
+
+class Or(Expr):
+    def __init__(self, *operands: Expr) -> None:
+        self.operands = operands
+
+    def key(self) -> Tuple[Any, ...]:
+        return ("or", *sorted((operand.key() for operand in self.operands), key=repr))
+
+
+class Not(Expr):
+    def __init__(self, operand: Expr) -> None:
+        self.operand = operand
+
+    def key(self) -> Tuple[Any, ...]:
+        return ("not", self.operand.key())
+
+
+def parse_filter(spec: Dict[str, Any]) -> Expr:
+    """Build an expression from its JSON form, e.g. for dashboard or tool payloads.
+
+    `{"and": [...]}`, `{"or": [...]}`, `{"not": {...}}`,
+    `{"facet": "major", "value": "computer science"}` (optionally `"exact": true`),
+    `{"facet": "currency", "in": ["usd", "eur"]}` and
+    `{"facet": "amount", "gte": 5000, "lte": 20000}`.
+    """
+    if "and" in spec:
+        return And(*(parse_filter(item) for item in spec["and"]))
+    if "or" in spec:
+        return Or(*(parse_filter(item) for item in spec["or"]))
+    if "not" in spec:
+        return Not(parse_filter(spec["not"]))
+    facet = spec.get("facet")
+    if facet in RANGE_FACETS:
+        return Range(facet, spec.get("gte"), spec.get("lte"))
+    if "in" in spec:
+        return Or(*(Term(facet, value, spec.get("exact", False)) for value in spec["in"]))
+    if "value" in spec:
+        return Term(facet, spec["value"], spec.get("exact", False))
+    raise ValueError(f"Unsupported filter: {spec!r}")
+
+
+# -- index --------------------------------------------------------------------------
+
+
+class _RangeColumn:
+    """Per-record values plus bitmaps for quantile buckets [bounds[i], bounds[i + 1])."""
+
+    def __init__(self, values: List[Any], buckets: int) -> None:
+        self.values = values
+        ordered = sorted(values)
+        step = max(1, len(ordered) // buckets)
+        self.bounds = sorted(set(ordered[::step])) if ordered else []
+        members: List[List[int]] = [[] for _ in self.bounds]
+        for position, value in enumerate(values):
+            members[bisect.bisect_right(self.bounds, value) - 1].append(position)
+        self.bitmaps = [_bitmap(positions, len(values)) for positions in members]
+
+    def select(self, low: Any, high: Any) -> int:
+        result, edges = 0, []
+        for index, lower in enumerate(self.bounds):
+            upper = self.bounds[index + 1] if index + 1 < len(self.bounds) else None
+            if (high is not None and lower > high) or (
+                low is not None and upper is not None and upper <= low
+            ):
+                continue
+            inside = (low is None or lower >= low) and (
+                high is None or (upper is not None and upper <= high)
+            )
+            if inside:
+                result |= self.bitmaps[index]
+                continue
+            # Edge bucket: check the column values of its members only.
+            for position in iter_positions(self.bitmaps[index]):
+                value = self.values[position]
+                if (low is None or value >= low) and (high is None or value <= high):
+                    edges.append(position)
+        if edges:
+            result |= _bitmap(sorted(edges), len(self.values))
+        return result
+
+    def labels(self) -> List[str]:
+        return [
+            f"{lower}.." + (str(self.bounds[index + 1]) if index + 1 < len(self.bounds) else "")
+            for index, lower in enumerate(self.bounds)
+        ]
+
+
+class FacetIndex:
+    """Bitmap index over a scholarship catalog for faceted filtering and counts.
+
+    Each facet value maps to an int bitset whose bit `i` marks the `i`-th
+    record; numeric and date facets keep quantile bucket bitmaps plus a value
+    column for exact range edges. Filters and counts run as bitwise operations
+    and popcounts without reading the records themselves.
+    """
+
+    def __init__(
+        self, scholarships: Iterable[ScholarshipOpportunity], range_buckets: int = 32
+    ) -> None:
+        self.records = list(scholarships)
+        size = len(self.records)
+        self.universe = (1 << size) - 1
+        positions: Dict[str, Dict[str, List[int]]] = {facet: {} for facet in VALUE_FACETS}
+        normalized: Dict[Any, str] = {}  # catalogs repeat a small vocabulary
+        for position, opp in enumerate(self.records):
+            for facet, raw_values in _facet_values(opp):
+                postings = positions[facet]
+                for raw in raw_values:
+                    value = normalized.get(raw)
+                    if value is None:
+                        value = normalized[raw] = _normalize(raw)
+                    members = postings.setdefault(value, [])
+                    if not members or members[-1] != position:  # duplicate values
+                        members.append(position)
+        self._postings: Dict[str, Dict[str, int]] = {
+            facet: {value: _bitmap(members, size) for value, members in values.items()}
+            for facet, values in positions.items()
+        }
+        self._ranges = {
+            facet: _RangeColumn([_range_value(opp, facet) for opp in self.records], range_buckets)
+            for facet in RANGE_FACETS
+        }
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def values(self, facet: str) -> List[str]:
+        return sorted(self._postings[facet])
+
+    def evaluate(self, expr: Optional[Expr]) -> int:
+        """Bitmap of the records matching `expr` (all records for None)."""
+        if expr is None:
+            return self.universe
+        if isinstance(expr, Term):
+            postings = self._postings[expr.facet]
+            bitmap = postings.get(expr.value, 0)
+            if not expr.exact and expr.value != ANY:
+                bitmap |= postings.get(ANY, 0)
+            return bitmap
+        if isinstance(expr, Range):
+            return self._ranges[expr.facet].select(expr.low, expr.high)
+        if isinstance(expr, And):
+            result = self.universe
+            for operand in expr.operands:
+                result &= self.evaluate(operand)
+                if not result:
+                    break
+            return result
+        if isinstance(expr, Or):
+            result = 0
+            for operand in expr.operands:
+                result |= self.evaluate(operand)
+            return result
+        if isinstance(expr, Not):
+            return self.universe & ~self.evaluate(expr.operand)
+        raise TypeError(f"Unsupported filter expression {expr!r}")
+
+    def count(self, expr: Optional[Expr] = None) -> int:
+        return self.evaluate(expr).bit_count()
+
+    def positions(self, expr: Optional[Expr] = None) -> Iterator[int]:
+        return iter_positions(self.evaluate(expr))
+
+    def select(
+        self, expr: Optional[Expr] = None, limit: Optional[int] = None
+    ) -> List[ScholarshipOpportunity]:
+        selected: List[ScholarshipOpportunity] = []
+        for position in self.positions(expr):
+            if limit is not None and len(selected) >= limit:
+                break
+            selected.append(self.records[position])
+        return selected
+
+    def facet_counts(
+        self, facets: Optional[Iterable[str]] = None, where: Optional[Expr] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Per-value record counts for each facet within the records matching `where`.
+
+        Value facets count raw values (wildcard records under "any"); range
+        facets count their quantile buckets, labelled "low..high".
+        """
+        scope = self.evaluate(where)
+        counts: Dict[str, Dict[str, int]] = {}
+        for facet in facets or VALUE_FACETS + RANGE_FACETS:
+            if facet in self._postings:
+                items = sorted(self._postings[facet].items())
+            elif facet in self._ranges:
+                column = self._ranges[facet]
+                items = zip(column.labels(), column.bitmaps)
+            else:
+                raise ValueError(f"Unknown facet '{facet}'.")
+            counts[facet] = {
+                value: count
+                for value, bitmap in items
+                if (count := (bitmap & scope).bit_count())
+            }
+        return counts
@@ -0,0 +1,512 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import traceback
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from . import serialization
+from .agents import DEFAULT_MODEL
+from .cv_parser import DEFAULT_CV_MODEL
+from .models import StudentProfile
+from .orchestrator import ResearchScholarOrchestrator
+from .tools import cv_parse_tool
+
+DEFAULT_QUEUE_PATH = Path("jobs.db")
+TERMINAL_STATES = ("succeeded", "failed")
+
+# Ready jobs are served from the partial index in (priority, id) order; the
+# second index lets a claim find expired leases without scanning finished jobs.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    available_at REAL NOT NULL,
+    lease_expires REAL,
+    worker TEXT,
+    result BLOB,
+    error TEXT,
+    enqueued_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_ready
+    ON jobs(priority DESC, id) WHERE status = 'queued';
+CREATE INDEX IF NOT EXISTS idx_jobs_leases
+    ON jobs(lease_expires) WHERE status = 'running';
+"""
+
+_JOB_COLUMNS = (
+    "id, kind, payload, priority, status, attempts, max_attempts, worker, "
+    "result, error, enqueued_at, started_at, finished_at"
+)
+
+
+class QueueFull(RuntimeError):
+    """Raised when enqueueing would exceed the queue's `max_depth`."""
+
+
+@dataclass
+class Job:
+    id: int
+    kind: str
+    payload: Dict[str, Any]
+    priority: int
+    status: str
+    attempts: int
+    max_attempts: int
+    worker: Optional[str]
+    result: Any
+    error: Optional[str]
+    enqueued_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+
+    @staticmethod
+    def from_row(row: tuple) -> "Job":
+        values = list(row)
+        values[2] = serialization.loads(values[2])
+        values[8] = serialization.loads(values[8]) if values[8] is not None else None
+        return Job(*values)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATES
+
+    def to_payload(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class JobQueue:
+    """Durable SQLite job queue shared by producers and worker processes.
+
+    Claiming a job leases it for `visibility_timeout` seconds; a job whose
+    worker dies (or stops heartbeating) becomes claimable again once the lease
+    expires. Failures are retried with exponential backoff until
+    `max_attempts`, and `max_depth` bounds the number of unfinished jobs.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_QUEUE_PATH,
+        max_depth: Optional[int] = None,
+        backoff_base: float = 1.0,
+        backoff_max: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        self.max_depth = max_depth
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "JobQueue":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # -- producers ------------------------------------------------------------
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        priority: int = 0,
+        max_attempts: int = 3,
+        block: bool = False,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.05,
+    ) -> int:
+        """Add a job and return its id; higher `priority` runs first.
+
+        When the queue is at `max_depth`, raise `QueueFull` immediately, or with
+        `block=True` wait up to `timeout` seconds for workers to make room.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        encoded = serialization.dumps(payload)
+        while True:
+            job_id = self._try_insert(kind, encoded, priority, max_attempts)
+            if job_id is not None:
+                return job_id
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise QueueFull(f"Job queue {self.path} is at its depth limit of {self.max_depth}.")
+            time.sleep(poll_interval)
+
+    def _try_insert(
+        self, kind: str, payload: bytes, priority: int, max_attempts: int
+    ) -> Optional[int]:
+        now = self.clock()
+        values = (kind, payload, priority, max_attempts, now, now)
+        with self._lock, self._conn:
+            if self.max_depth is None:
+                cursor = self._conn.execute(
+                    "INSERT INTO jobs (kind, payload, priority, max_attempts, available_at, "
+                    "enqueued_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    values,
+                )
+            else:
+                # Check and insert in one statement so concurrent producers
+                # cannot overshoot the depth limit.
+                cursor = self._conn.execute(
+                    "INSERT INTO jobs (kind, payload, priority, max_attempts, available_at, "
+                    "enqueued_at) SELECT ?, ?, ?, ?, ?, ? WHERE (SELECT COUNT(*) FROM jobs "
+                    "WHERE status IN ('queued', 'running')) < ?",
+                    (*values, self.max_depth),
+                )
+            return cursor.lastrowid if cursor.rowcount else None
+
+    # -- workers --------------------------------------------------------------
+
+    def claim(self, worker: str, visibility_timeout: float = 300.0) -> Optional[Job]:
+        """Lease the highest-priority ready job to `worker`, or return None."""
+        now = self.clock()
+        with self._lock, self._conn:
+            self._release_expired(now)
+            row = self._conn.execute(
+                "UPDATE jobs SET status = 'running', attempts = attempts + 1, worker = ?, "
+                "lease_expires = ?, started_at = ? WHERE id = (SELECT id FROM jobs "
+                "WHERE status = 'queued' AND available_at <= ? ORDER BY priority DESC, id "
+                f"LIMIT 1) RETURNING {_JOB_COLUMNS}",
+                (worker, now + visibility_timeout, now, now),
+            ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def _release_expired(self, now: float) -> None:
+        self._conn.execute(
+            "UPDATE jobs SET status = CASE WHEN attempts >= max_attempts THEN 'failed' "
+            "ELSE 'queued' END, error = 'visibility timeout expired', worker = NULL, "
+            "lease_expires = NULL, finished_at = CASE WHEN attempts >= max_attempts "
+            "THEN ? ELSE NULL END WHERE status = 'running' AND lease_expires < ?",
+            (now, now),
+        )
+
+    def heartbeat(self, job: Job, visibility_timeout: float = 300.0) -> bool:
+        """Extend the lease on a running job; False if the worker no longer owns it."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_expires = ? "
+                "WHERE id = ? AND status = 'running' AND worker = ? AND attempts = ?",
+                (self.clock() + visibility_timeout, job.id, job.worker, job.attempts),
+            )
+        return bool(cursor.rowcount)
+
+    def complete(self, job: Job, result: Any) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = 'succeeded', result = ?, error = NULL, "
+                "lease_expires = NULL, finished_at = ? "
+                "WHERE id = ? AND status = 'running' AND worker = ? AND attempts = ?",
+                (serialization.dumps(result), self.clock(), job.id, job.worker, job.attempts),
+            )
+        return bool(cursor.rowcount)
+
+    def fail(self, job: Job, error: str) -> bool:
+        """Record a failed attempt: back off and retry, or give up after `max_attempts`."""
+        now = self.clock()
+        retry = job.attempts < job.max_attempts
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (job.attempts - 1))
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, worker = NULL, lease_expires = NULL, "
+                "available_at = ?, finished_at = ? "
+                "WHERE id = ? AND status = 'running' AND worker = ? AND attempts = ?",
+                (
+                    "queued" if retry else "failed",
+                    error,
+                    now + delay,
+                    None if retry else now,
+                    job.id,
+                    job.worker,
+                    job.attempts,
+                ),
+            )
+        return bool(cursor.rowcount)
+
+    # -- inspection -----------------------------------------------------------
+
+    def get(self, job_id: int) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return Job.from_row(row) if row else None
+
+    def wait(
+        self, job_id: int, timeout: Optional[float] = None, poll_interval: float = 0.05
+    ) -> Job:
+        """Block until a job succeeds or fails; TimeoutError after `timeout` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None:
+                raise KeyError(f"Unknown job {job_id}")
+            if job.done:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Job {job_id} still {job.status} after {timeout}s")
+            time.sleep(poll_interval)
+
+    def depth(self) -> int:
+        """Unfinished (queued or running) jobs, the quantity `max_depth` bounds."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'running')"
+            ).fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        counts = {"queued": 0, "running": 0, "succeeded": 0, "failed": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def timings(self, job_ids: Optional[Iterable[int]] = None) -> List[tuple]:
+        """(enqueued_at, started_at, finished_at) of finished jobs, for load reports."""
+        query = "SELECT enqueued_at, started_at, finished_at FROM jobs WHERE finished_at IS NOT NULL"
+        with self._lock:
+            if job_ids is None:
+                return self._conn.execute(query).fetchall()
+            ids = list(job_ids)
+            return [
+                row
+                for start in range(0, len(ids), 500)
+                for row in self._conn.execute(
+                    f"{query} AND id IN ({','.join('?' * len(ids[start:start + 500]))})",
+                    ids[start : start + 500],
+                )
+            ]
+
+
+# -- job handlers ---------------------------------------------------------------
+
+JobHandler = Callable[[Dict[str, Any]], Any]
+
+
+def _run_cv_parse(payload: Dict[str, Any]) -> Dict[str, Any]:
+    return cv_parse_tool(payload)
+
+
+def _run_report(payload: Dict[str, Any]) -> Dict[str, Any]:
+    orchestrator = ResearchScholarOrchestrator(payload.get("model", DEFAULT_MODEL))
+    profile = StudentProfile.from_dict(payload["profile"])
+    return orchestrator.run(payload["query"], profile, limit=payload.get("limit", 5))
+
+
+# Worker processes look handlers up here by job kind. Register custom kinds at
+# import time so that processes started with "spawn" see them too.
+JOB_HANDLERS: Dict[str, JobHandler] = {"cv_parse": _run_cv_parse, "report": _run_report}
+
+
+def register_handler(kind: str, handler: JobHandler) -> None:
+    JOB_HANDLERS[kind] = handler
+
+
+def enqueue_cv_parse(
+    queue: JobQueue,
+    pdf_path: Path | str,
+    output_path: Path | str,
+    model: str = DEFAULT_CV_MODEL,
+    **options: Any,
+) -> int:
+    payload = {"pdf_path": str(pdf_path), "output_path": str(output_path), "model": model}
+    return queue.enqueue("cv_parse", payload, **options)
+
+
+def enqueue_report(
+    queue: JobQueue,
+    query: str,
+    profile: StudentProfile,
+    limit: int = 5,
+    model: str = DEFAULT_MODEL,
+    **options: Any,
+) -> int:
+    payload = {"query": query, "profile": profile.to_payload(), "limit": limit, "model": model}
+    return queue.enqueue("report", payload, **options)
+
+
+# -- workers --------------------------------------------------------------------
+
+
+class Worker:
+    """Claims and runs jobs from one queue, heartbeating while a handler runs."""
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_QUEUE_PATH,
+        name: Optional[str] = None,
+        visibility_timeout: float = 300.0,
+        poll_interval: float = 0.1,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+    ) -> None:
+        self.queue = JobQueue(path)
+        self.name = name or f"worker-{os.getpid()}"
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.handlers = handlers if handlers is not None else JOB_HANDLERS
+        self.processed = 0
+
+    def run_once(self) -> Optional[Job]:
+        """Run at most one job; returns it (as claimed) or None when nothing is ready."""
+        job = self.queue.claim(self.name, self.visibility_timeout)
+        if job is None:
+            return None
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            self.queue.fail(job, f"No handler registered for job kind '{job.kind}'.")
+            return job
+        stop = threading.Event()
+        beat = threading.Thread(target=self._heartbeat, args=(job, stop), daemon=True)
+        beat.start()
+        try:
+            result = handler(job.payload)
+        except Exception:  # noqa: BLE001 - any handler error is a failed attempt
+            self.queue.fail(job, traceback.format_exc(limit=5))
+        else:
+            self.queue.complete(job, result)
+        finally:
+            stop.set()
+            beat.join()
+        self.processed += 1
+        return job
+
+    def _heartbeat(self, job: Job, stop: threading.Event) -> None:
+        while not stop.wait(self.visibility_timeout / 3):
+            if not self.queue.heartbeat(job, self.visibility_timeout):
+                return
+
+    def run(self, stop: Optional[Any] = None, max_jobs: Optional[int] = None) -> int:
+        """Process jobs until `stop` is set or `max_jobs` have run; returns the count."""
+        while not (stop is not None and stop.is_set()):
+            if max_jobs is not None and self.processed >= max_jobs:
+                break
+            if self.run_once() is None:
+                time.sleep(self.poll_interval)
+        return self.processed
+
+
+def _worker_main(path: str, name: str, visibility_timeout: float, poll_interval: float, stop) -> None:
+    worker = Worker(path, name, visibility_timeout, poll_interval)
+    try:
+        worker.run(stop)
+    finally:
+        worker.queue.close()
+
+
+class WorkerPool:
+    """Runs `processes` workers against one queue file in separate OS processes.
+
+    `stop()` lets each worker finish its current job; a worker killed
+    mid-job leaves its lease to expire so another worker retries it.
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_QUEUE_PATH,
+        processes: Optional[int] = None,
+        visibility_timeout: float = 300.0,
+        poll_interval: float = 0.1,
+        context: Optional[Any] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.processes = processes or os.cpu_count() or 1
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self._context = context or multiprocessing.get_context()
+        self._stop = self._context.Event()
+        self._workers: List[Any] = []
+        JobQueue(self.path).close()  # create the schema before workers race to
+
+    def start(self) -> "WorkerPool":
+        self._stop.clear()
+        for index in range(self.processes):
+            process = self._context.Process(
+                target=_worker_main,
+                args=(
+                    str(self.path),
+                    f"worker-{os.getpid()}-{index}",
+                    self.visibility_timeout,
+                    self.poll_interval,
+                    self._stop,
+                ),
+                daemon=True,
+            )
+            process.start()
+            self._workers.append(process)
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        for process in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self._workers = []
+
+    def drain(self, timeout: Optional[float] = None, poll_interval: float = 0.05) -> None:
+        """Wait until no job is queued or running; TimeoutError after `timeout`."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with JobQueue(self.path) as queue:
+            while queue.depth():
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"{queue.depth()} jobs still pending after {timeout}s")
+                time.sleep(poll_interval)
+
+    def __enter__(self) -> "WorkerPool":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+# -- load reports -----------------------------------------------------------------
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _summary_ms(values: List[float]) -> Dict[str, float]:
+    summary = {f"p{pct}": round(_percentile(values, pct) * 1000, 2) for pct in (50, 95, 99)}
+    summary["max"] = round(max(values, default=0.0) * 1000, 2)
+    return summary
+
+
+def load_report(queue: JobQueue, job_ids: Optional[Iterable[int]] = None) -> Dict[str, Any]:
+    """Throughput plus queue-wait, run-time and end-to-end latency percentiles."""
+    rows = queue.timings(job_ids)
+    wall = max(row[2] for row in rows) - min(row[0] for row in rows) if rows else 0.0
+    return {
+        "jobs": len(rows),
+        "wall_s": round(wall, 3),
+        "throughput_per_s": round(len(rows) / wall, 2) if wall else 0.0,
+        "queue_wait_ms": _summary_ms([started - enqueued for enqueued, started, _ in rows]),
+        "run_ms": _summary_ms([finished - started for _, started, finished in rows]),
+        "end_to_end_ms": _summary_ms([finished - enqueued for enqueued, _, finished in rows]),
+        "status": queue.stats(),
+    }
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from connectonion import LLM
+from connectonion.core.llm import LLMResponse, ToolCall
+from pydantic import BaseModel
+
+# Models registered here are resolved by name wherever the package creates an
+# LLM: `AgentPool` (all ConnectOnion agents) and the CV parser's `llm_do` call.
+# Register a stand-in under e.g. "fake/gpt-4o-mini" and pass that model name to
+# `ResearchScholarOrchestrator`, `parse_cv_to_json`, or `cv_parse_tool`.
+_REGISTRY: Dict[str, LLM] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def register_llm(model: str, llm: LLM) -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY[model] = llm
+
+
+def unregister_llm(model: str) -> None:
+    with _REGISTRY_LOCK:
+        _REGISTRY.pop(model, None)
+
+
+def resolve_llm(model: str) -> Optional[LLM]:
+    return _REGISTRY.get(model)
+
+
+class MissingRecordingError(KeyError):
+    """Raised in replay mode when no recording exists for a prompt."""
+
+
+def prompt_key(model: str, messages: List[Dict[str, Any]], **extra: Any) -> str:
+    """Stable hash of everything that determines an LLM response."""
+    canonical = json.dumps(
+        {"model": model, "messages": messages, **extra},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_fingerprint(schema: Type[BaseModel]) -> str:
+    # JSON-schema generation costs milliseconds per call; schemas are static.
+    return prompt_key("schema", [], schema=schema.model_json_schema())
+
+
+@dataclass
+class LatencyModel:
+    """Seeded delay distribution in seconds: constant, uniform, normal or lognormal."""
+
+    kind: str = "constant"
+    mean: float = 0.0
+    spread: float = 0.0
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        if self.kind not in {"constant", "uniform", "normal", "lognormal"}:
+            raise ValueError(f"Unknown latency distribution '{self.kind}'.")
+        self._rng = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        with self._lock:
+            if self.kind == "uniform":
+                value = self._rng.uniform(self.mean - self.spread, self.mean + self.spread)
+            elif self.kind == "normal":
+                value = self._rng.gauss(self.mean, self.spread)
+            elif self.kind == "lognormal":
+                # `mean` is the median latency, `spread` the sigma of log(latency).
+                value = self.mean * self._rng.lognormvariate(0.0, self.spread)
+            else:
+                value = self.mean
+        return max(0.0, value)
+
+
+class FakeLatencyLLM(LLM):
+    """Offline LLM that sleeps for a sampled latency and returns canned output.
+
+    Text completions come from `responder(messages)`; structured completions
+    from `structured_responder(messages, schema)`, defaulting to the schema's
+    own defaults (e.g. `ExtractedProfile()`).
+    """
+
+    def __init__(
+        self,
+        model: str = "fake/latency",
+        latency: Optional[LatencyModel] = None,
+        responder: Optional[Callable[[List[Dict[str, Any]]], str]] = None,
+        structured_responder: Optional[
+            Callable[[List[Dict[str, Any]], Type[BaseModel]], BaseModel]
+        ] = None,
+    ) -> None:
+        self.model = model
+        self.latency = latency or LatencyModel()
+        self.responder = responder or (lambda messages: "ok")
+        self.structured_responder = structured_responder or (lambda messages, schema: schema())
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _wait(self) -> None:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency.sample())
+
+    def complete(self, messages, tools=None, **kwargs) -> LLMResponse:
+        self._wait()
+        return LLMResponse(content=self.responder(messages), tool_calls=[], raw_response=None)
+
+    def structured_complete(self, messages, output_schema, **kwargs):
+        self._wait()
+        return self.structured_responder(messages, output_schema)
+
+
+class ReplayLLM(LLM):
+    """Record/replay LLM backed by one JSON file per prompt hash in `directory`.
+
+    mode="replay" only serves recordings (MissingRecordingError otherwise),
+    "record" always calls `delegate` and overwrites, and "auto" replays when a
+    recording exists and records otherwise.
+    """
+
+    def __init__(
+        self,
+        directory: Path | str,
+        delegate: Optional[LLM] = None,
+        model: Optional[str] = None,
+        mode: str = "auto",
+    ) -> None:
+        if mode not in {"replay", "record", "auto"}:
+            raise ValueError(f"Unknown replay mode '{mode}'.")
+        if mode != "replay" and delegate is None:
+            raise ValueError(f"ReplayLLM in '{mode}' mode needs a delegate LLM.")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.delegate = delegate
+        self.model = model or getattr(delegate, "model", "replay")
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        if self.mode == "record" or not path.exists():
+            if self.mode == "replay":
+                raise MissingRecordingError(f"No recording for prompt {key} in {self.directory}")
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return json.loads(path.read_text())
+
+    def _save(self, key: str, record: Dict[str, Any]) -> None:
+        # A unique temp file per writer, so concurrent recordings of the same
+        # prompt each replace the target atomically instead of racing.
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, prefix=f"{key}.", suffix=".tmp", delete=False
+        ) as handle:
+            handle.write(json.dumps(record, indent=2, sort_keys=True))
+        os.replace(handle.name, self._path(key))
+
+    def complete(self, messages, tools=None, **kwargs) -> LLMResponse:
+        key = prompt_key(self.model, messages, tools=tools, kind="complete", **kwargs)
+        record = self._lookup(key)
+        if record is None:
+            response = self.delegate.complete(messages, tools=tools, **kwargs)
+            record = {
+                "content": response.content,
+                "tool_calls": [
+                    {"name": call.name, "arguments": call.arguments, "id": call.id}
+                    for call in response.tool_calls
+                ],
+            }
+            self._save(key, record)
+        return LLMResponse(
+            content=record["content"],
+            tool_calls=[ToolCall(**call) for call in record["tool_calls"]],
+            raw_response=None,
+        )
+
+    def structured_complete(self, messages, output_schema, **kwargs):
+        key = prompt_key(
+            self.model,
+            messages,
+            schema=_schema_fingerprint(output_schema),
+            kind="structured",
+            **kwargs,
+        )
+        record = self._lookup(key)
+        if record is None:
+            result = self.delegate.structured_complete(messages, output_schema, **kwargs)
+            record = {"structured": result.model_dump(mode="json")}
+            self._save(key, record)
+        return output_schema.model_validate(record["structured"])
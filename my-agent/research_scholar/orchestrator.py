@@ -1,18 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Dict
-
-from .agents import (
-    build_matcher_agent,
-    build_ranker_agent,
-    build_seeker_agent,
-    build_tracker_agent,
-    build_university_match_agent,
-    build_verifier_agent,
-    build_writer_agent,
-    DEFAULT_MODEL,
-)
+from typing import Any, Dict, Optional, Set
+
+from connectonion import Agent
+
+from .agents import AgentPool, DEFAULT_MODEL, get_agent_pool
 from .models import StudentProfile
+from .sharding import ShardedCatalog
 from .tools import (
     matcher_filter_tool,
     ranker_score_tool,
@@ -27,32 +21,88 @@ from .tools import (
 class ResearchScholarOrchestrator:
     """Coordinates the multi-agent workflow end-to-end."""
 
-    def __init__(self, model: str = DEFAULT_MODEL) -> None:
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        pool: Optional[AgentPool] = None,
+        shards: Optional[ShardedCatalog] = None,
+    ) -> None:
         self.model = model
-        # ConnectOnion Agent handles (for future conversational extensions)
-        self.seeker_agent = build_seeker_agent(model)
-        self.matcher_agent = build_matcher_agent(model)
-        self.ranker_agent = build_ranker_agent(model)
-        self.writer_agent = build_writer_agent(model)
-        self.tracker_agent = build_tracker_agent(model)
-        self.verifier_agent = build_verifier_agent(model)
-        self.university_agent = build_university_match_agent(model)
-
-    def run(self, query: str, profile: StudentProfile, limit: int = 5) -> Dict[str, Any]:
+        # With `shards`, catalog search, ranking and university matching are
+        # scattered to shard processes instead of the in-process catalog.
+        self.shards = shards
+        # ConnectOnion Agent handles (for future conversational extensions) are
+        # built on first access through the pool, one set per thread, since
+        # `Agent.input` keeps per-session state on the agent.
+        self.pool = pool or get_agent_pool()
+
+    @property
+    def seeker_agent(self) -> Agent:
+        return self.pool.get("seeker", self.model)
+
+    @property
+    def matcher_agent(self) -> Agent:
+        return self.pool.get("matcher", self.model)
+
+    @property
+    def ranker_agent(self) -> Agent:
+        return self.pool.get("ranker", self.model)
+
+    @property
+    def writer_agent(self) -> Agent:
+        return self.pool.get("writer", self.model)
+
+    @property
+    def tracker_agent(self) -> Agent:
+        return self.pool.get("tracker", self.model)
+
+    @property
+    def verifier_agent(self) -> Agent:
+        return self.pool.get("verifier", self.model)
+
+    @property
+    def university_agent(self) -> Agent:
+        return self.pool.get("university", self.model)
+
+    def run(
+        self,
+        query: str,
+        profile: StudentProfile,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run every stage for one student and return the combined report.
+
+        With `shards`, a shard that times out or fails leaves its records out
+        of the report, which then carries top-level `partial: True` and
+        `missing_shards`. `ShardError` propagates when no shard answers.
+        """
+        missing_shards: Set[int] = set()
         seeker_payload = {
             "query": query,
             "limit": limit,
             "profile": profile.to_payload(),
+            "filters": filters,
         }
-        seeker_result = seeker_search_tool(seeker_payload)
-
-        matcher_payload = {
-            "profile": profile.to_payload(),
-            "scholarships": seeker_result["scholarships"],
-        }
-        matcher_result = matcher_filter_tool(matcher_payload)
-
-        ranker_result = ranker_score_tool(matcher_result)
+        if self.shards is not None:
+            sharded = self.shards.rank(query, profile, limit=limit, filters=filters)
+            sharded.pop("partial", None)
+            missing_shards.update(sharded.pop("missing_shards", ()))
+            seeker_result = {
+                key: value
+                for key, value in sharded.items()
+                if key not in ("eligibility", "ranked")
+            }
+            matcher_result = {"eligibility": sharded["eligibility"]}
+            ranker_result = {"ranked": sharded["ranked"]}
+        else:
+            seeker_result = seeker_search_tool(seeker_payload)
+            matcher_payload = {
+                "profile": profile.to_payload(),
+                "scholarships": seeker_result["scholarships"],
+            }
+            matcher_result = matcher_filter_tool(matcher_payload)
+            ranker_result = ranker_score_tool(matcher_result)
 
         writer_payload = {
             "profile": profile.to_payload(),
@@ -75,9 +125,14 @@ class ResearchScholarOrchestrator:
             "profile": profile.to_payload(),
             "top_n": 3,
         }
-        university_result = university_match_tool(university_payload)
+        if self.shards is not None:
+            university_result = self.shards.universities(profile, top_n=3)
+            university_result.pop("partial", None)
+            missing_shards.update(university_result.pop("missing_shards", ()))
+        else:
+            university_result = university_match_tool(university_payload)
 
-        return {
+        report = {
             "query": query,
             "profile": profile.to_payload(),
             "seeker": seeker_result,
@@ -88,4 +143,8 @@ class ResearchScholarOrchestrator:
             "verifier": verifier_result,
             "universities": university_result,
         }
+        if missing_shards:
+            report["partial"] = True
+            report["missing_shards"] = sorted(missing_shards)
+        return report
 
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import bisect
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .models import ScholarshipOpportunity, StudentProfile
+from .store import ReportStore
+
+
+def _normalize(text: str) -> str:
+    return text.lower().strip()
+
+
+@dataclass(frozen=True)
+class _IndexedProfile:
+    """The facets reverse matching reads, normalized like the pipeline tools do."""
+
+    email: str
+    gpa: float
+    major: str
+    citizenship: str
+    location: str
+    demographics: Tuple[str, ...]
+
+    @staticmethod
+    def from_profile(profile: StudentProfile) -> "_IndexedProfile":
+        return _IndexedProfile(
+            email=profile.email,
+            gpa=profile.gpa,
+            major=profile.major.lower(),
+            citizenship=profile.citizenship.lower(),
+            location=_normalize(profile.location),
+            demographics=tuple(
+                sorted({_normalize(v) for v in profile.demographics.values() if isinstance(v, str)})
+            ),
+        )
+
+
+@dataclass
+class EligibilityNotification:
+    student_email: str
+    scholarship_id: str
+    title: str
+    deadline: str
+    demographic_match: bool
+
+    def to_payload(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ProfileIndex:
+    """Inverted index over stored student profiles for scholarship → students matching.
+
+    Eligibility mirrors the forward pipeline: the seeker's location filter plus
+    the matcher's GPA, major and citizenship rules. Demographic tags do not
+    reject a student there, so they are only reported as `demographic_match`.
+
+    With `store_path` (set by `from_store`) the last notified eligible set per
+    scholarship lives in that ReportStore database, so a new process does not
+    notify students again; otherwise it is kept in memory.
+    """
+
+    def __init__(
+        self, profiles: Iterable[StudentProfile] = (), store_path: Optional[Path | str] = None
+    ) -> None:
+        self.store_path = store_path
+        self._lock = threading.RLock()
+        self._records: Dict[str, _IndexedProfile] = {}
+        self._by_major: Dict[str, Set[str]] = defaultdict(set)
+        self._by_citizenship: Dict[str, Set[str]] = defaultdict(set)
+        self._by_location: Dict[str, Set[str]] = defaultdict(set)
+        self._by_demographic: Dict[str, Set[str]] = defaultdict(set)
+        self._by_gpa: List[Tuple[float, str]] = []
+        # Last notified eligible set per scholarship when there is no store_path.
+        self._eligible: Dict[str, Set[str]] = {}
+        self.add_many(profiles)
+
+    @classmethod
+    def from_store(cls, store) -> "ProfileIndex":
+        return cls(store.iter_profiles(), store_path=store.path)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, email: str) -> bool:
+        return email in self._records
+
+    # -- maintenance ----------------------------------------------------------
+
+    def add(self, profile: StudentProfile) -> None:
+        self.add_many([profile])
+
+    def add_many(self, profiles: Iterable[StudentProfile]) -> None:
+        with self._lock:
+            fresh: List[Tuple[float, str]] = []
+            for profile in profiles:
+                self._discard(profile.email)
+                record = _IndexedProfile.from_profile(profile)
+                self._records[record.email] = record
+                self._by_major[record.major].add(record.email)
+                self._by_citizenship[record.citizenship].add(record.email)
+                self._by_location[record.location].add(record.email)
+                for tag in record.demographics:
+                    self._by_demographic[tag].add(record.email)
+                fresh.append((record.gpa, record.email))
+            if len(fresh) > 64:
+                self._by_gpa = sorted(self._by_gpa + fresh)
+            else:
+                for entry in fresh:
+                    bisect.insort(self._by_gpa, entry)
+
+    def remove(self, email: str) -> None:
+        with self._lock:
+            self._discard(email)
+            for eligible in self._eligible.values():
+                eligible.discard(email)
+            if self.store_path is not None:
+                with ReportStore(self.store_path) as store:
+                    store.forget_eligibility(email=email)
+
+    def _discard(self, email: str) -> None:
+        record = self._records.pop(email, None)
+        if record is None:
+            return
+        self._by_major[record.major].discard(email)
+        self._by_citizenship[record.citizenship].discard(email)
+        self._by_location[record.location].discard(email)
+        for tag in record.demographics:
+            self._by_demographic[tag].discard(email)
+        position = bisect.bisect_left(self._by_gpa, (record.gpa, email))
+        if position < len(self._by_gpa) and self._by_gpa[position] == (record.gpa, email):
+            del self._by_gpa[position]
+
+    # -- queries --------------------------------------------------------------
+
+    def eligible_students(self, scholarship: ScholarshipOpportunity) -> Set[str]:
+        """Emails of every indexed student the pipeline would accept for `scholarship`."""
+        rules = scholarship.eligibility
+        with self._lock:
+            constraints: List[Set[str]] = []
+
+            majors = [m.lower() for m in rules.get("majors", [])]
+            if majors:
+                constraints.append(self._union(self._by_major, majors))
+
+            citizenships = [c.lower() for c in rules.get("citizenship", [])]
+            if citizenships and "any" not in citizenships:
+                constraints.append(self._union(self._by_citizenship, citizenships))
+
+            locations = [_normalize(loc) for loc in rules.get("location", [])]
+            if "any" not in locations:
+                # Students without a location are never filtered by the seeker.
+                constraints.append(self._union(self._by_location, locations + [""]))
+
+            min_gpa = rules.get("min_gpa", 0)
+            if not constraints:
+                start = bisect.bisect_left(self._by_gpa, (min_gpa, ""))
+                return {email for _, email in self._by_gpa[start:]}
+
+            constraints.sort(key=len)
+            candidates = constraints[0].intersection(*constraints[1:])
+            return {email for email in candidates if self._records[email].gpa >= min_gpa}
+
+    def demographic_matches(self, scholarship: ScholarshipOpportunity) -> Optional[Set[str]]:
+        """Students carrying one of the scholarship's demographic tags (None if it has none)."""
+        tags = [_normalize(tag) for tag in scholarship.eligibility.get("demographics", [])]
+        if not tags:
+            return None
+        with self._lock:
+            return self._union(self._by_demographic, tags)
+
+    def upsert_scholarship(
+        self, scholarship: ScholarshipOpportunity
+    ) -> List[EligibilityNotification]:
+        """Re-match a new or edited scholarship and notify only newly eligible students."""
+        with self._lock:
+            eligible = self.eligible_students(scholarship)
+            if self.store_path is not None:
+                with ReportStore(self.store_path) as store:
+                    new = store.update_eligible_students(scholarship.id, eligible)
+            else:
+                new = eligible - self._eligible.get(scholarship.id, set())
+                self._eligible[scholarship.id] = eligible
+            preferred = self.demographic_matches(scholarship)
+            return [
+                EligibilityNotification(
+                    student_email=email,
+                    scholarship_id=scholarship.id,
+                    title=scholarship.title,
+                    deadline=scholarship.deadline,
+                    demographic_match=preferred is None or email in preferred,
+                )
+                for email in sorted(new)
+            ]
+
+    def remove_scholarship(self, scholarship_id: str) -> None:
+        with self._lock:
+            self._eligible.pop(scholarship_id, None)
+            if self.store_path is not None:
+                with ReportStore(self.store_path) as store:
+                    store.forget_eligibility(scholarship_id=scholarship_id)
+
+    @staticmethod
+    def _union(postings: Dict[str, Set[str]], keys: Iterable[str]) -> Set[str]:
+        result: Set[str] = set()
+        for key in keys:
+            result |= postings.get(key, set())
+        return result
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import csv
+import functools
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+from . import serialization
+from .cv_parser import ExtractedProfile
+from .models import StudentProfile
+from .profile_index import ProfileIndex
+
+DEFAULT_CHUNK_SIZE = 10_000
+_LIST_FIELDS = ("interests", "skills", "experiences", "preferred_countries")
+
+
+class ProfileValidationError(ValueError):
+    """A single profile failed validation; the message lists every bad field."""
+
+
+@dataclass
+class RowError:
+    line: int
+    field: str
+    message: str
+
+    def to_payload(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class LoadReport:
+    """Counts for one bulk load; keeps the first `max_errors` bad-row details."""
+
+    loaded: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    max_errors: int = 1000
+    errors: List[RowError] = field(default_factory=list)
+
+    @property
+    def rows_per_s(self) -> float:
+        rows = self.loaded + self.rejected
+        return rows / self.seconds if self.seconds else 0.0
+
+    def add_error(self, line: int, field_name: str, message: str) -> None:
+        if len(self.errors) < self.max_errors:
+            self.errors.append(RowError(line, field_name, message))
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "rejected": self.rejected,
+            "seconds": round(self.seconds, 3),
+            "rows_per_s": round(self.rows_per_s, 1),
+            "errors": [error.to_payload() for error in self.errors],
+        }
+
+
+# Building a TypeAdapter compiles a pydantic-core validator, which costs far more
+# than validating a chunk; build each one once per process.
+@functools.lru_cache(maxsize=None)
+def _adapter(extracted: bool = False, many: bool = True) -> TypeAdapter:
+    schema = ExtractedProfile if extracted else StudentProfile
+    return TypeAdapter(List[schema] if many else schema)
+
+
+def _describe(error: Dict[str, Any], skip: int) -> Tuple[str, str]:
+    location = ".".join(str(part) for part in error["loc"][skip:]) or "<row>"
+    return location, error["msg"]
+
+
+def parse_profile(data: Any, extracted: bool = False) -> StudentProfile:
+    """Validate one profile mapping (or JSON bytes/str) into a `StudentProfile`."""
+    adapter = _adapter(extracted, many=False)
+    try:
+        if isinstance(data, (bytes, str)):
+            profile = adapter.validate_json(data)
+        else:
+            profile = adapter.validate_python(data)
+    except ValidationError as exc:
+        problems = "; ".join(": ".join(_describe(error, 0)) for error in exc.errors())
+        raise ProfileValidationError(f"Invalid student profile: {problems}") from None
+    return profile.to_student_profile() if extracted else profile
+
+
+# -- row sources ------------------------------------------------------------------
+
+
+def _jsonl_rows(path: Path) -> Iterator[Tuple[int, bytes]]:
+    with path.open("rb") as fh:
+        for line_number, line in enumerate(fh, start=1):
+            line = line.strip()
+            if line:
+                yield line_number, line
+
+
+def _csv_cell(name: str, value: str) -> Any:
+    """CSV cells hold lists as `a;b` and demographics as `key=value;...` (or JSON)."""
+    value = value.strip()
+    if name in _LIST_FIELDS or name == "demographics":
+        if value.startswith(("[", "{")):
+            return serialization.loads(value)
+        parts = [part.strip() for part in value.split(";") if part.strip()]
+        if name == "demographics":
+            return dict(part.split("=", 1) for part in parts if "=" in part)
+        return parts
+    return value
+
+
+def _csv_rows(path: Path) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    with path.open(newline="", encoding="utf-8") as fh:
+        reader = csv.DictReader(fh)
+        for row in reader:
+            # Empty optional cells fall back to the schema defaults.
+            yield reader.line_num, {
+                name: _csv_cell(name, value)
+                for name, value in row.items()
+                if name and value is not None and (value.strip() or name not in _LIST_FIELDS)
+            }
+
+
+def _chunks(rows: Iterator[Tuple[int, Any]], size: int) -> Iterator[List[Tuple[int, Any]]]:
+    chunk: List[Tuple[int, Any]] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# -- chunk validation -------------------------------------------------------------
+
+
+def _validate(adapter: TypeAdapter, raw: List[Any], json_rows: bool) -> List[Any]:
+    if json_rows:
+        # One JSON array per chunk lets pydantic-core parse and validate in a
+        # single pass, skipping the intermediate dicts.
+        return adapter.validate_json(b"[" + b",".join(raw) + b"]")
+    return adapter.validate_python(raw)
+
+
+def _validate_chunk(
+    chunk: List[Tuple[int, Any]], json_rows: bool, extracted: bool, report: LoadReport
+) -> List[StudentProfile]:
+    adapter = _adapter(extracted)
+    raw = [row for _, row in chunk]
+    try:
+        profiles = _validate(adapter, raw, json_rows)
+    except ValidationError:
+        profiles = None
+    if profiles is None or len(profiles) != len(raw):
+        # A bad row fails the whole chunk (and a malformed JSONL line can shift
+        # array positions), so re-validate row by row to keep the good ones.
+        profiles = []
+        for line, row in chunk:
+            try:
+                validated = _validate(adapter, [row], json_rows)
+            except ValidationError as exc:
+                report.rejected += 1
+                for error in exc.errors():
+                    report.add_error(line, *_describe(error, 1))
+                continue
+            if len(validated) != 1:
+                report.rejected += 1
+                report.add_error(line, "<row>", "Expected exactly one JSON object per line")
+                continue
+            profiles.extend(validated)
+    report.loaded += len(profiles)
+    if extracted:
+        return [profile.to_student_profile() for profile in profiles]
+    return profiles
+
+
+# -- public loaders ---------------------------------------------------------------
+
+
+def iter_profile_chunks(
+    path: Path | str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    report: Optional[LoadReport] = None,
+    extracted: bool = False,
+) -> Iterator[List[StudentProfile]]:
+    """Stream validated profiles from a `.jsonl` or `.csv` file in chunks.
+
+    Invalid rows are skipped and recorded in `report` (line number, field,
+    message) instead of aborting the load. With `extracted=True` rows are
+    validated as `ExtractedProfile` (missing fields take its defaults).
+    """
+    path = Path(path)
+    report = report if report is not None else LoadReport()
+    json_rows = path.suffix.lower() != ".csv"
+    rows = _jsonl_rows(path) if json_rows else _csv_rows(path)
+    # Only reading and validating count towards `report.seconds`; the clock
+    # restarts after each yield so the consumer's time between chunks is left out.
+    started = time.perf_counter()
+    for chunk in _chunks(rows, chunk_size):
+        profiles = _validate_chunk(chunk, json_rows, extracted, report)
+        report.seconds += time.perf_counter() - started
+        yield profiles
+        started = time.perf_counter()
+    report.seconds += time.perf_counter() - started
+
+
+def load_profiles(
+    path: Path | str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    report: Optional[LoadReport] = None,
+    extracted: bool = False,
+) -> List[StudentProfile]:
+    return [
+        profile
+        for chunk in iter_profile_chunks(path, chunk_size, report, extracted)
+        for profile in chunk
+    ]
+
+
+def load_profile_index(
+    path: Path | str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    report: Optional[LoadReport] = None,
+    extracted: bool = False,
+) -> ProfileIndex:
+    """Build a `ProfileIndex` chunk by chunk, keeping only its compact matching facets."""
+    index = ProfileIndex()
+    for chunk in iter_profile_chunks(path, chunk_size, report, extracted):
+        index.add_many(chunk)
+    return index
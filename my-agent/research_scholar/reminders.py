@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import sqlite3
+import urllib.request
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Protocol
+
+from . import serialization
+
+DEFAULT_REMINDER_PATH = Path("reminders.db")
+
+# The partial index on pending rows ordered by due date is the scheduler's
+# priority queue: firing reads the head of the index, so a restart never needs
+# to rescan sent reminders or rebuild an in-memory heap.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reminders (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedupe_key TEXT NOT NULL UNIQUE,
+    student_email TEXT NOT NULL,
+    scholarship_id TEXT NOT NULL,
+    label TEXT NOT NULL,
+    due TEXT NOT NULL,
+    deadline TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    fired_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reminders_pending_due
+    ON reminders(due, id) WHERE status = 'pending';
+CREATE INDEX IF NOT EXISTS idx_reminders_student ON reminders(student_email, status);
+CREATE TABLE IF NOT EXISTS reminder_sources (
+    student_email TEXT NOT NULL,
+    report_key TEXT NOT NULL,
+    dedupe_key TEXT NOT NULL,
+    PRIMARY KEY (student_email, report_key, dedupe_key)
+);
+CREATE INDEX IF NOT EXISTS idx_reminder_sources_key ON reminder_sources(dedupe_key);
+"""
+
+
+@dataclass
+class Reminder:
+    id: int
+    student_email: str
+    scholarship_id: str
+    label: str
+    due: str
+    deadline: str
+
+    def to_payload(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ReminderSink(Protocol):
+    def send(self, reminders: List[Reminder]) -> None:
+        ...
+
+
+class FileSink:
+    """Append fired reminders as JSON lines; a local stand-in for Slack/email pushes."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+
+    def send(self, reminders: List[Reminder]) -> None:
+        with self.path.open("ab") as fh:
+            for reminder in reminders:
+                fh.write(serialization.dumps(reminder.to_payload()) + b"\n")
+
+
+class WebhookSink:
+    """POST each batch as `{"reminders": [...]}` to a webhook URL."""
+
+    def __init__(self, url: str, timeout: float = 10.0) -> None:
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, reminders: List[Reminder]) -> None:
+        body = serialization.dumps({"reminders": [r.to_payload() for r in reminders]})
+        request = urllib.request.Request(
+            self.url, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+def _dedupe_key(student_email: str, scholarship_id: str, label: str) -> str:
+    return f"{student_email}|{scholarship_id}|{label}"
+
+
+def _report_key(report: Dict[str, Any]) -> str:
+    # One student's reports are told apart by the query that produced them.
+    return report.get("query", "")
+
+
+class ReminderScheduler:
+    """Persistent milestone reminders built from `tracker_schedule_tool` output."""
+
+    def __init__(self, path: Path | str = DEFAULT_REMINDER_PATH) -> None:
+        self.path = Path(path)
+        self._conn = sqlite3.connect(str(self.path))
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ReminderScheduler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def schedule_report(self, report: Dict[str, Any]) -> int:
+        return self.schedule_reports([report])
+
+    def schedule_reports(self, reports: Iterable[Dict[str, Any]]) -> int:
+        """Upsert every milestone of each report; returns the number of milestones seen.
+
+        Regenerating a report is idempotent: unchanged milestones keep their
+        status, moved ones are re-armed, and pending reminders for milestones
+        that dropped out of that report are cancelled unless another of the
+        student's reports (a different query) still lists them.
+        """
+        scheduled = 0
+        with self._conn:
+            for report in reports:
+                email = report["profile"]["email"]
+                rows = [
+                    (
+                        _dedupe_key(email, schedule["scholarship_id"], milestone["label"]),
+                        email,
+                        schedule["scholarship_id"],
+                        milestone["label"],
+                        milestone["due"],
+                        schedule["deadline"],
+                    )
+                    for schedule in report.get("tracker", {}).get("schedules", [])
+                    for milestone in schedule["milestones"]
+                ]
+                self._conn.executemany(
+                    "INSERT INTO reminders "
+                    "(dedupe_key, student_email, scholarship_id, label, due, deadline) "
+                    "VALUES (?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT(dedupe_key) DO UPDATE SET "
+                    "status = CASE WHEN reminders.due = excluded.due "
+                    "THEN reminders.status ELSE 'pending' END, "
+                    "fired_at = CASE WHEN reminders.due = excluded.due "
+                    "THEN reminders.fired_at ELSE NULL END, "
+                    "due = excluded.due, deadline = excluded.deadline",
+                    rows,
+                )
+                source = (email, _report_key(report))
+                keys = [row[0] for row in rows]
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO reminder_sources "
+                    "(student_email, report_key, dedupe_key) VALUES (?, ?, ?)",
+                    [(*source, key) for key in keys],
+                )
+                stale = (
+                    "student_email = ? AND report_key = ? "
+                    f"AND dedupe_key NOT IN ({','.join('?' * len(keys))})"
+                )
+                dropped = [
+                    key
+                    for (key,) in self._conn.execute(
+                        f"SELECT dedupe_key FROM reminder_sources WHERE {stale}", (*source, *keys)
+                    )
+                ]
+                if dropped:
+                    self._conn.execute(
+                        f"DELETE FROM reminder_sources WHERE {stale}", (*source, *keys)
+                    )
+                    self._conn.execute(
+                        "DELETE FROM reminders WHERE status = 'pending' "
+                        f"AND dedupe_key IN ({','.join('?' * len(dropped))}) "
+                        "AND NOT EXISTS (SELECT 1 FROM reminder_sources "
+                        "WHERE reminder_sources.dedupe_key = reminders.dedupe_key)",
+                        dropped,
+                    )
+                scheduled += len(rows)
+        return scheduled
+
+    def due(self, today: Optional[str] = None, limit: int = 500) -> List[Reminder]:
+        today = today or str(datetime.utcnow().date())
+        rows = self._conn.execute(
+            "SELECT id, student_email, scholarship_id, label, due, deadline FROM reminders "
+            "WHERE status = 'pending' AND due <= ? ORDER BY due, id LIMIT ?",
+            (today, limit),
+        ).fetchall()
+        return [Reminder(*row) for row in rows]
+
+    def fire_due(
+        self,
+        sinks: Iterable[ReminderSink],
+        today: Optional[str] = None,
+        batch_size: int = 500,
+    ) -> int:
+        """Deliver due reminders in batches; a batch is marked sent only after every sink accepts it."""
+        sinks = list(sinks)
+        fired = 0
+        while True:
+            batch = self.due(today, limit=batch_size)
+            if not batch:
+                return fired
+            for sink in sinks:
+                sink.send(batch)
+            now = datetime.utcnow().isoformat(timespec="seconds")
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE reminders SET status = 'sent', fired_at = ? WHERE id = ?",
+                    [(now, reminder.id) for reminder in batch],
+                )
+            fired += len(batch)
+
+    def pending_count(self) -> int:
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM reminders WHERE status = 'pending'"
+        ).fetchone()[0]
@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import base64
+import bisect
+import hashlib
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import serialization
+from .cache import ResultCache
+
+COLLECTIONS = ("scholarships", "universities", "milestones")
+OPERATORS = ("eq", "ne", "gt", "gte", "lt", "lte", "in", "contains")
+MAX_PAGE_SIZE = 200
+
+
+class QueryError(ValueError):
+    """Invalid collection, filter, sort field or cursor in a report query."""
+
+
+# -- precomputation (runs once per stored report) ----------------------------------
+
+
+def flatten_report(report: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+    """One flat row per ranked scholarship, university recommendation and milestone."""
+    readiness = {
+        qa["scholarship_id"]: qa for qa in report.get("verifier", {}).get("qa_reports", [])
+    }
+    scholarships = []
+    for rank, entry in enumerate(report.get("ranker", {}).get("ranked", []), 1):
+        scholarship = entry["scholarship"]
+        qa = readiness.get(scholarship["id"])
+        scholarships.append(
+            {
+                **scholarship,
+                "rank": rank,
+                "score": entry.get("score"),
+                "reasoning": entry.get("reasoning", ""),
+                "ready": qa["ready"] if qa else None,
+                "missing": qa["missing"] if qa else [],
+            }
+        )
+    universities = [
+        {
+            **entry["university"],
+            "rank": rank,
+            "score": entry.get("score"),
+            "reasons": entry.get("fit_reasons", []),
+        }
+        for rank, entry in enumerate(report.get("universities", {}).get("recommendations", []), 1)
+    ]
+    milestones = [
+        {
+            "scholarship_id": schedule["scholarship_id"],
+            "deadline": schedule["deadline"],
+            "label": milestone["label"],
+            "due": milestone["due"],
+        }
+        for schedule in report.get("tracker", {}).get("schedules", [])
+        for milestone in schedule["milestones"]
+    ]
+    return {"scholarships": scholarships, "universities": universities, "milestones": milestones}
+
+
+def summarize_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Dashboard aggregates that do not depend on the current date.
+
+    Deadlines and milestone due dates are stored sorted, so "due within N
+    days" is answered later with two binary searches.
+    """
+    rows = flatten_report(report)
+    award_totals: Dict[str, int] = {}
+    missing: Dict[str, int] = {}
+    ready = not_ready = 0
+    for row in rows["scholarships"]:
+        currency = row.get("currency") or "USD"
+        award_totals[currency] = award_totals.get(currency, 0) + (row.get("amount") or 0)
+        if row["ready"] is True:
+            ready += 1
+        elif row["ready"] is False:
+            not_ready += 1
+            for item in row["missing"]:
+                missing[item] = missing.get(item, 0) + 1
+    return {
+        "counts": {name: len(items) for name, items in rows.items()},
+        "total_award_value": award_totals,
+        "readiness": {"ready": ready, "not_ready": not_ready, "missing": missing},
+        "deadlines": sorted(
+            (
+                {
+                    "date": row["deadline"],
+                    "scholarship_id": row["id"],
+                    "title": row["title"],
+                    "amount": row["amount"],
+                    "currency": row["currency"],
+                }
+                for row in rows["scholarships"]
+            ),
+            key=lambda entry: (entry["date"], entry["scholarship_id"]),
+        ),
+        "milestones": sorted(
+            ({"date": row["due"], **row} for row in rows["milestones"]),
+            key=lambda entry: (entry["date"], entry["scholarship_id"], entry["label"]),
+        ),
+    }
+
+
+def _within(entries: List[Dict[str, Any]], start: str, end: str) -> List[Dict[str, Any]]:
+    dates = [entry["date"] for entry in entries]
+    return entries[bisect.bisect_left(dates, start) : bisect.bisect_right(dates, end)]
+
+
+# -- filtering, sorting and cursors ------------------------------------------------
+
+
+def _coerce(value: Any, like: Any) -> Any:
+    """Query-string values arrive as text; compare them as the field's own type."""
+    if not isinstance(value, str) or like is None or isinstance(like, str):
+        return value
+    if isinstance(like, bool):
+        return value.lower() in {"1", "true", "yes"}
+    if isinstance(like, (int, float)):
+        try:
+            return float(value)
+        except ValueError:
+            raise QueryError(f"Expected a number, got '{value}'.") from None
+    return value
+
+
+def _matches(row: Dict[str, Any], field: str, op: str, expected: Any) -> bool:
+    actual = row.get(field)
+    if op == "in":
+        options = expected.split(",") if isinstance(expected, str) else expected
+        return actual in [_coerce(option, actual) for option in options]
+    if op == "contains":
+        if isinstance(actual, str):
+            return str(expected).lower() in actual.lower()
+        return expected in (actual or [])
+    expected = _coerce(expected, actual)
+    if op == "eq":
+        return actual == expected
+    if op == "ne":
+        return actual != expected
+    if actual is None:
+        return False
+    try:
+        if op == "gt":
+            return actual > expected
+        if op == "gte":
+            return actual >= expected
+        if op == "lt":
+            return actual < expected
+        return actual <= expected
+    except TypeError:
+        return False
+
+
+def _parse_filters(filters: Optional[Dict[str, Any]]) -> List[Tuple[str, str, Any]]:
+    """`{"amount__gte": 5000, "currency": "USD"}` -> [(field, op, value), ...]."""
+    parsed = []
+    for key, value in (filters or {}).items():
+        field, _, op = key.partition("__")
+        op = op or "eq"
+        if op not in OPERATORS:
+            raise QueryError(f"Unknown filter operator '{op}' in '{key}'.")
+        parsed.append((field, op, value))
+    return parsed
+
+
+class _Descending:
+    """Inverts comparisons so descending sort keys stay bisectable."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+
+def _parse_sort(sort: Optional[str]) -> List[Tuple[str, bool]]:
+    return [
+        (part.strip().lstrip("-"), part.strip().startswith("-"))
+        for part in (sort or "").split(",")
+        if part.strip()
+    ]
+
+
+def _sort_key(values: Sequence[Any], order: List[Tuple[str, bool]], position: int) -> Tuple:
+    key: List[Any] = []
+    for value, (_, descending) in zip(values, order):
+        # Missing values sort last in either direction.
+        key.append((value is None, _Descending(value) if descending else value))
+    key.append(position)  # unique tiebreak: the row's position in the report
+    return tuple(key)
+
+
+def _encode_cursor(values: List[Any], position: int) -> str:
+    return base64.urlsafe_b64encode(serialization.dumps([values, position])).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> Tuple[List[Any], int]:
+    try:
+        values, position = serialization.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return list(values), int(position)
+    except Exception:  # noqa: BLE001 - any malformed cursor is a client error
+        raise QueryError("Malformed cursor.") from None
+
+
+def _etag(*parts: Any) -> str:
+    digest = hashlib.sha256(serialization.dumps(list(parts))).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+@dataclass
+class QueryResult:
+    """Response body plus its ETag; `status` is 304 (and `body` None) when unchanged."""
+
+    status: int
+    etag: str
+    body: Optional[Dict[str, Any]] = None
+
+
+class ReportQuery:
+    """Read API over stored reports for dashboards: summaries and paged collections.
+
+    Reports are immutable once stored, so their flattened rows are cached per
+    report id and every response carries an ETag derived from the stored
+    report and the query; pass the client's `If-None-Match` value to get a 304.
+    """
+
+    def __init__(self, store, cache_size: int = 256) -> None:
+        self.store = store
+        self._rows = ResultCache(maxsize=cache_size)
+        self._views = ResultCache(maxsize=cache_size)
+        self._lock = threading.Lock()
+
+    def latest_report_id(self, email: str) -> Optional[int]:
+        with self._lock:
+            return self.store.latest_report_id(email)
+
+    def summary(
+        self,
+        report_id: int,
+        within_days: int = 10,
+        today: Optional[str] = None,
+        if_none_match: Optional[str] = None,
+    ) -> QueryResult:
+        """Precomputed aggregates plus deadlines and milestones due in the next `within_days`."""
+        start = datetime.strptime(today, "%Y-%m-%d").date() if today else datetime.utcnow().date()
+        end = str(start + timedelta(days=within_days))
+        with self._lock:
+            stored = self.store.get_summary(report_id)
+        if stored is None:
+            raise KeyError(f"Unknown report {report_id}")
+        report_etag, summary = stored
+        etag = _etag(report_etag, "summary", str(start), within_days)
+        if if_none_match == etag:
+            return QueryResult(304, etag)
+        body = {
+            "report_id": report_id,
+            "counts": summary["counts"],
+            "total_award_value": summary["total_award_value"],
+            "readiness": summary["readiness"],
+            "upcoming_deadlines": _within(summary["deadlines"], str(start), end),
+            "upcoming_milestones": _within(summary["milestones"], str(start), end),
+            "window": {"from": str(start), "to": end},
+        }
+        return QueryResult(200, etag, body)
+
+    def items(
+        self,
+        report_id: int,
+        collection: str,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: Optional[str] = None,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+        if_none_match: Optional[str] = None,
+    ) -> QueryResult:
+        """One page of `collection` rows, filtered and sorted server-side.
+
+        Filters are `field` or `field__op` keys (ops: eq, ne, gt, gte, lt,
+        lte, in, contains); `sort` is a comma list such as "-amount,deadline";
+        `fields` projects each row; `cursor` is the previous page's
+        `next_cursor` (keyset pagination, stable while the report is unchanged).
+        """
+        if collection not in COLLECTIONS:
+            raise QueryError(f"Unknown collection '{collection}'.")
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        report_etag, rows = self._flattened(report_id)
+        etag = _etag(
+            report_etag, collection, sorted((filters or {}).items()), sort, limit, cursor, fields
+        )
+        if if_none_match == etag:
+            return QueryResult(304, etag)
+
+        order = _parse_sort(sort)
+        view_key = (report_etag, collection, repr(sorted((filters or {}).items())), sort)
+        keyed, keys = self._views.get_or_compute(
+            view_key, lambda: self._view(rows[collection], collection, filters, sort, order)
+        )
+
+        start = 0
+        if cursor:
+            values, position = _decode_cursor(cursor)
+            if len(values) != len(order):
+                raise QueryError("Cursor does not match the requested sort.")
+            after = _sort_key(values, order, position)
+            start = bisect.bisect_right(keys, after)
+        page = keyed[start : start + limit]
+        next_cursor = None
+        if start + limit < len(keyed) and page:
+            _, position, row = page[-1]
+            next_cursor = _encode_cursor([row.get(name) for name, _ in order], position)
+        items = [
+            {name: row[name] for name in fields if name in row} if fields else row
+            for _, _, row in page
+        ]
+        body = {"items": items, "total": len(keyed), "next_cursor": next_cursor}
+        return QueryResult(200, etag, body)
+
+    @staticmethod
+    def _view(
+        rows: List[Dict[str, Any]],
+        collection: str,
+        filters: Optional[Dict[str, Any]],
+        sort: Optional[str],
+        order: List[Tuple[str, bool]],
+    ) -> Tuple[List[Tuple], List[Tuple]]:
+        """Filtered rows sorted by (sort key, position); cached so page walks reuse it."""
+        conditions = _parse_filters(filters)
+        matched = [
+            (position, row)
+            for position, row in enumerate(rows)
+            if all(_matches(row, field, op, value) for field, op, value in conditions)
+        ]
+        try:
+            keyed = sorted(
+                (_sort_key([row.get(name) for name, _ in order], order, position), position, row)
+                for position, row in matched
+            )
+        except TypeError:
+            raise QueryError(f"Cannot sort {collection} by '{sort}'.") from None
+        return keyed, [entry[0] for entry in keyed]
+
+    def _flattened(self, report_id: int) -> Tuple[str, Dict[str, List[Dict[str, Any]]]]:
+        cached = self._rows.get(report_id)
+        if cached is None:
+            with self._lock:
+                report = self.store.get_report(report_id)
+                stored = self.store.get_summary(report_id) if report is not None else None
+            if report is None or stored is None:
+                raise KeyError(f"Unknown report {report_id}")
+            cached = (stored[0], flatten_report(report))
+            self._rows.set(report_id, cached)
+        return cached
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, List, Optional
+
+try:  # Optional fast path; the stdlib backend is always available.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+class JsonSerializer:
+    """Stdlib `json` backend producing UTF-8 bytes."""
+
+    name = "json"
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+        return text.encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """`orjson` backend; several times faster than stdlib for large reports."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+
+def _default(obj: Any) -> Any:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+_BACKENDS = {"json": JsonSerializer, "orjson": OrjsonSerializer}
+
+
+def available_backends() -> List[str]:
+    return [name for name in _BACKENDS if name != "orjson" or orjson is not None]
+
+
+def get_serializer(name: Optional[str] = None):
+    """Return the named backend, or the fastest one installed when `name` is None."""
+    if name is None:
+        name = "orjson" if orjson is not None else "json"
+    if name not in available_backends():
+        raise ValueError(f"Serializer backend '{name}' is not available.")
+    return _BACKENDS[name]()
+
+
+_DEFAULT = get_serializer()
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    return _DEFAULT.dumps(obj, pretty=pretty)
+
+
+def loads(data: bytes | str) -> Any:
+    return _DEFAULT.loads(data)
+
+
+# -- report deduplication -----------------------------------------------------
+#
+# Orchestrator reports repeat the full scholarship payload in every stage
+# (seeker, matcher, ranker) and the university payload per recommendation.
+# A deduplicated report keeps one `catalog` section and replaces each embedded
+# record with its id string, so `entry["scholarship"]` becomes "RS-001".
+
+_EMBEDDED = {"scholarship": "scholarships", "university": "universities"}
+
+
+def dedupe_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Move repeated scholarship/university payloads into a shared catalog."""
+    if "catalog" in report:
+        return report
+    catalog: Dict[str, Dict[str, Any]] = {section: {} for section in _EMBEDDED.values()}
+    deduped = _collapse(report, catalog)
+    deduped["catalog"] = catalog
+    return deduped
+
+
+def expand_report(report: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of `dedupe_report`; returns reports without a catalog unchanged."""
+    if "catalog" not in report:
+        return report
+    catalog = report["catalog"]
+    expanded = _inflate({k: v for k, v in report.items() if k != "catalog"}, catalog)
+    return expanded
+
+
+def _collapse(value: Any, catalog: Dict[str, Dict[str, Any]]) -> Any:
+    if isinstance(value, list):
+        return [_collapse(item, catalog) for item in value]
+    if not isinstance(value, dict):
+        return value
+    collapsed: Dict[str, Any] = {}
+    for key, item in value.items():
+        if key in _EMBEDDED and isinstance(item, dict) and "id" in item:
+            catalog[_EMBEDDED[key]][item["id"]] = item
+            collapsed[key] = item["id"]
+        elif key in catalog and _is_record_list(item):
+            for record in item:
+                catalog[key][record["id"]] = record
+            collapsed[key] = [record["id"] for record in item]
+        else:
+            collapsed[key] = _collapse(item, catalog)
+    return collapsed
+
+
+def _inflate(value: Any, catalog: Dict[str, Dict[str, Any]]) -> Any:
+    if isinstance(value, list):
+        return [_inflate(item, catalog) for item in value]
+    if not isinstance(value, dict):
+        return value
+    inflated: Dict[str, Any] = {}
+    for key, item in value.items():
+        if key in _EMBEDDED and isinstance(item, str):
+            inflated[key] = catalog[_EMBEDDED[key]][item]
+        elif key in catalog and isinstance(item, list) and all(isinstance(i, str) for i in item):
+            inflated[key] = [catalog[key][record_id] for record_id in item]
+        else:
+            inflated[key] = _inflate(item, catalog)
+    return inflated
+
+
+def _is_record_list(value: Any) -> bool:
+    return (
+        isinstance(value, list)
+        and bool(value)
+        and all(isinstance(item, dict) and "id" in item for item in value)
+    )
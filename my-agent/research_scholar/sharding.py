@@ -0,0 +1,486 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import multiprocessing
+import threading
+import time
+import zlib
+from concurrent.futures import Future
+from concurrent.futures import wait as futures_wait
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import tools
+from .facets import parse_filter
+from .models import ScholarshipOpportunity, StudentProfile, UniversityProgram
+
+DEFAULT_SHARD_TIMEOUT = 2.0
+# Requests written to one shard's pipe before further ones wait in a backlog.
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# (global catalog position, record) pairs; positions let the coordinator merge
+# shard replies back into exactly the order a single process would produce.
+Placed = List[Tuple[int, Any]]
+
+
+class ShardError(RuntimeError):
+    """No shard answered a scatter-gather request."""
+
+
+def shard_of(record_id: str, shards: int) -> int:
+    """Stable shard assignment by record id (same on every run and process)."""
+    return zlib.crc32(record_id.encode("utf-8")) % shards
+
+
+def partition(records: Iterable[Any], shards: int) -> List[Placed]:
+    parts: List[Placed] = [[] for _ in range(shards)]
+    for position, record in enumerate(records):
+        parts[shard_of(record.id, shards)].append((position, record))
+    return parts
+
+
+# -- shard process ----------------------------------------------------------------
+
+
+class _ShardState:
+    """The catalog partition held by one shard process, served via `tools`."""
+
+    def __init__(self, scholarships: Placed, universities: Placed) -> None:
+        tools.set_catalog([record for _, record in scholarships], [u for _, u in universities])
+        self.positions = [position for position, _ in scholarships]
+        self.universities = universities
+        self.requests = 0
+
+    def ping(self) -> Dict[str, Any]:
+        return {
+            "scholarships": len(self.positions),
+            "universities": len(self.universities),
+            "requests": self.requests,
+        }
+
+    def search(self, query_terms, location, limit, filters) -> List[Tuple[int, Dict[str, Any]]]:
+        records = tools.catalog_facets().records
+        expr = parse_filter(filters) if filters else None
+        return [
+            (self.positions[local], records[local].to_payload())
+            for local in tools._search_positions(query_terms, location, limit, expr)
+        ]
+
+    def rank(self, query_terms, location, limit, filters, profile, exhaustive) -> List[Tuple]:
+        """(-score, position, scholarship, eligibility, ranked) for this shard's hits.
+
+        Seeker order keeps the first `limit` hits by position; `exhaustive`
+        scores every hit and keeps the local top `limit` by score instead.
+        """
+        hits = self.search(query_terms, location, None if exhaustive else limit, filters)
+        eligibility = tools._match_eligibility(
+            StudentProfile.from_dict(profile), [payload for _, payload in hits]
+        )
+        rows = []
+        for (position, payload), entry in zip(hits, eligibility):
+            ranked = tools._score_eligibility(entry)
+            rows.append((-ranked["score"], position, payload, entry, ranked))
+        if exhaustive and limit is not None:
+            rows = heapq.nsmallest(limit, rows, key=lambda row: row[:2])
+        return rows
+
+    def universities_top(self, profile, top_n) -> List[Tuple[int, int, Dict[str, Any]]]:
+        scored = tools._score_universities(
+            StudentProfile.from_dict(profile), (record for _, record in self.universities)
+        )
+        rows = [
+            (-entry["score"], position, entry)
+            for (position, _), entry in zip(self.universities, scored)
+        ]
+        return heapq.nsmallest(top_n, rows, key=lambda row: row[:2])
+
+
+def _shard_main(conn, scholarships: Placed, universities: Placed) -> None:
+    state = _ShardState(scholarships, universities)
+    handlers: Dict[str, Callable[..., Any]] = {
+        "ping": state.ping,
+        "search": state.search,
+        "rank": state.rank,
+        "universities": state.universities_top,
+    }
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        request_id, op, args = message
+        state.requests += 1
+        try:
+            reply = (request_id, True, handlers[op](**args))
+        except Exception as exc:  # noqa: BLE001 - reported to the coordinator
+            reply = (request_id, False, f"{type(exc).__name__}: {exc}")
+        try:
+            conn.send(reply)
+        except (BrokenPipeError, OSError):
+            break
+    conn.close()
+
+
+# -- coordinator ------------------------------------------------------------------
+
+
+@dataclass
+class ShardStatus:
+    shard: int
+    alive: bool
+    latency_ms: Optional[float] = None
+    scholarships: int = 0
+    universities: int = 0
+    requests: int = 0
+    error: Optional[str] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class _Channel:
+    """The coordinator's end of one shard process's pipe.
+
+    Any number of callers share the channel: a receiver thread reads every
+    reply and hands it to the caller's future by request id. At most
+    `max_in_flight` requests are written to the pipe at once; the rest wait
+    in a backlog and are sent as replies come back, so a stalled shard can
+    never fill its pipe and block a caller. A caller that times out cancels
+    its request; if it was already sent, its slot frees up once the late
+    reply arrives.
+    """
+
+    def __init__(self, conn: Any, name: str, max_in_flight: int) -> None:
+        self.conn = conn
+        self.max_in_flight = max_in_flight
+        self._lock = threading.Lock()
+        self._in_flight: Dict[int, Optional[Future]] = {}
+        self._backlog: Dict[int, Tuple[Any, Future]] = {}
+        self._closed = False
+        self._receiver = threading.Thread(target=self._receive, name=name, daemon=True)
+        self._receiver.start()
+
+    def submit(self, request_id: int, message: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                future.set_exception(ShardError("Shard pipe is closed."))
+            elif len(self._in_flight) < self.max_in_flight:
+                self._send(request_id, message, future)
+            else:
+                self._backlog[request_id] = (message, future)
+        return future
+
+    def cancel(self, request_id: int) -> None:
+        with self._lock:
+            self._backlog.pop(request_id, None)
+            if request_id in self._in_flight:
+                self._in_flight[request_id] = None  # keep the slot until the reply arrives
+
+    def _send(self, request_id: int, message: Any, future: Future) -> None:
+        # Called with the lock held; bounded by `max_in_flight`, so it never blocks for long.
+        try:
+            self.conn.send(message)
+        except (BrokenPipeError, OSError) as exc:
+            future.set_exception(ShardError(f"Shard pipe is broken: {exc}"))
+            return
+        self._in_flight[request_id] = future
+
+    def _receive(self) -> None:
+        while True:
+            try:
+                reply_id, ok, result = self.conn.recv()
+            except (EOFError, OSError):
+                break
+            received = time.monotonic()
+            with self._lock:
+                future = self._in_flight.pop(reply_id, None)
+                while self._backlog and len(self._in_flight) < self.max_in_flight:
+                    request_id = next(iter(self._backlog))
+                    self._send(request_id, *self._backlog.pop(request_id))
+            if future is not None:
+                future.set_result((ok, result, received))
+        with self._lock:
+            self._closed = True
+            orphans = [future for future in self._in_flight.values() if future is not None]
+            orphans += [future for _, future in self._backlog.values()]
+            self._in_flight.clear()
+            self._backlog.clear()
+        for future in orphans:
+            future.set_exception(ShardError("Shard process exited."))
+
+    def stop(self) -> None:
+        """Ask the shard to exit; safe to call on a dead shard."""
+        with self._lock:
+            try:
+                self.conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+
+    def close(self) -> None:
+        # The shard process has exited, so the receiver sees EOF and returns.
+        self._receiver.join()
+        self.conn.close()
+
+
+@dataclass
+class _Shard:
+    index: int
+    scholarships: Placed
+    universities: Placed
+    process: Any = None
+    channel: Optional[_Channel] = None
+
+
+@dataclass
+class _Gathered:
+    replies: Dict[int, Any]
+    missing: List[int]
+    latency: Dict[int, float]
+
+    def annotate(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.missing:
+            payload["partial"] = True
+            payload["missing_shards"] = self.missing
+        return payload
+
+
+class ShardedCatalog:
+    """Scholarship and university catalogs partitioned across shard processes.
+
+    Records are assigned to shards by a hash of their id. Each request is
+    scattered to every shard over a pipe and gathered with a top-k merge
+    keyed on (score, catalog position), so a full reply is identical to the
+    single-process tools. Shards that miss `timeout`, crashed, or raised are
+    left out: the reply then carries `partial: True` and `missing_shards`.
+    `ShardError` is raised only when no shard answers. Concurrent callers
+    share each shard's pipe (see `_Channel`), so requests from different
+    threads are in flight together instead of queueing behind one another.
+    """
+
+    def __init__(
+        self,
+        scholarships: Optional[Sequence[ScholarshipOpportunity]] = None,
+        universities: Optional[Sequence[UniversityProgram]] = None,
+        shards: int = 4,
+        timeout: float = DEFAULT_SHARD_TIMEOUT,
+        context: Optional[Any] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> None:
+        scholarships = tools.SCHOLARSHIP_DB if scholarships is None else scholarships
+        universities = tools.UNIVERSITY_DB if universities is None else universities
+        self.timeout = timeout
+        self.max_in_flight = max_in_flight
+        self._context = context or multiprocessing.get_context()
+        self._shards = [
+            _Shard(index, placed_scholarships, placed_universities)
+            for index, (placed_scholarships, placed_universities) in enumerate(
+                zip(partition(scholarships, shards), partition(universities, shards))
+            )
+        ]
+        self._ids = itertools.count(1)
+        # Guards starting, stopping and respawning shards; requests never take it.
+        self._lock = threading.Lock()
+
+    @property
+    def shards(self) -> int:
+        return len(self._shards)
+
+    def start(self) -> "ShardedCatalog":
+        with self._lock:
+            for shard in self._shards:
+                if shard.process is None:
+                    self._spawn(shard)
+        return self
+
+    def stop(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            for shard in self._shards:
+                if shard.process is None:
+                    continue
+                shard.channel.stop()
+                shard.process.join(timeout)
+                if shard.process.is_alive():
+                    shard.process.terminate()
+                    shard.process.join()
+                shard.channel.close()
+                shard.process = shard.channel = None
+
+    def __enter__(self) -> "ShardedCatalog":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def _spawn(self, shard: _Shard) -> None:
+        parent, child = self._context.Pipe()
+        process = self._context.Process(
+            target=_shard_main,
+            args=(child, shard.scholarships, shard.universities),
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        shard.process = process
+        shard.channel = _Channel(parent, f"shard-{shard.index}-receiver", self.max_in_flight)
+
+    # -- health ---------------------------------------------------------------
+
+    def health(self, timeout: Optional[float] = None) -> List[ShardStatus]:
+        """Ping every shard; a shard is healthy when it answers within `timeout`."""
+        gathered = self._scatter(
+            "ping", {}, self.timeout if timeout is None else timeout, require_any=False
+        )
+        statuses = []
+        for shard in self._shards:
+            reply = gathered.replies.get(shard.index)
+            if reply is None:
+                alive = shard.process is not None and shard.process.is_alive()
+                statuses.append(
+                    ShardStatus(shard.index, False, error="unresponsive" if alive else "down")
+                )
+                continue
+            statuses.append(
+                ShardStatus(
+                    shard.index,
+                    True,
+                    latency_ms=round(gathered.latency[shard.index] * 1000, 3),
+                    **reply,
+                )
+            )
+        return statuses
+
+    def restart_dead_shards(self) -> List[int]:
+        """Respawn shards whose process exited; returns their indexes."""
+        restarted = []
+        with self._lock:
+            for shard in self._shards:
+                if shard.process is not None and not shard.process.is_alive():
+                    shard.process.join()
+                    shard.channel.close()
+                    self._spawn(shard)
+                    restarted.append(shard.index)
+        return restarted
+
+    # -- scatter-gather -------------------------------------------------------
+
+    def _scatter(
+        self, op: str, args: Dict[str, Any], timeout: float, require_any: bool = True
+    ) -> _Gathered:
+        started = time.monotonic()
+        replies: Dict[int, Any] = {}
+        latency: Dict[int, float] = {}
+        missing: List[int] = []
+        requests: Dict[Future, Tuple[_Shard, _Channel, int]] = {}
+        for shard in self._shards:
+            channel = shard.channel
+            if channel is None:
+                missing.append(shard.index)  # never started
+                continue
+            request_id = next(self._ids)
+            requests[channel.submit(request_id, (request_id, op, args))] = (
+                shard,
+                channel,
+                request_id,
+            )
+        done, not_done = futures_wait(requests, max(0.0, started + timeout - time.monotonic()))
+        for future in not_done:
+            shard, channel, request_id = requests[future]
+            channel.cancel(request_id)
+            missing.append(shard.index)
+        for future in done:
+            shard = requests[future][0]
+            if future.exception() is not None:
+                missing.append(shard.index)  # the process died
+                continue
+            ok, result, received = future.result()
+            if ok:
+                replies[shard.index] = result
+                latency[shard.index] = received - started
+            else:
+                missing.append(shard.index)
+        if require_any and not replies:
+            raise ShardError(f"No shard answered '{op}' within {timeout}s.")
+        return _Gathered(replies, sorted(missing), latency)
+
+    @staticmethod
+    def _seeker_args(query: str, profile: Optional[Dict[str, Any]], filters) -> Dict[str, Any]:
+        # Same normalization as `tools.seeker_search_tool`.
+        query = tools._normalize(query)
+        return {
+            "query_terms": sorted({tools._normalize(term) for term in query.split() if term}),
+            "location": tools._normalize(profile.get("location", "")) if profile else "",
+            "filters": filters,
+        }
+
+    def search(
+        self,
+        query: str,
+        profile: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Sharded `seeker_search_tool`: the first `limit` hits in catalog order."""
+        gathered = self._scatter(
+            "search", {**self._seeker_args(query, profile, filters), "limit": limit},
+            self.timeout if timeout is None else timeout,
+        )
+        merged = heapq.merge(*gathered.replies.values(), key=lambda hit: hit[0])
+        return gathered.annotate(
+            {"scholarships": [payload for _, payload in itertools.islice(merged, limit)]}
+        )
+
+    def rank(
+        self,
+        query: str,
+        profile: StudentProfile,
+        limit: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+        exhaustive: bool = False,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Seeker, matcher and ranker stages in one scatter-gather round.
+
+        By default the result matches running the three tools in one process:
+        the first `limit` seeker hits, ranked. With `exhaustive=True` every
+        matching scholarship is scored and the best `limit` are kept.
+        """
+        payload = profile.to_payload()
+        gathered = self._scatter(
+            "rank",
+            {
+                **self._seeker_args(query, payload, filters),
+                "limit": limit,
+                "profile": payload,
+                "exhaustive": exhaustive,
+            },
+            self.timeout if timeout is None else timeout,
+        )
+        order = (lambda row: row[:2]) if exhaustive else (lambda row: row[1])
+        rows = list(itertools.islice(heapq.merge(*gathered.replies.values(), key=order), limit))
+        hits = sorted(rows, key=lambda row: row[1])
+        return gathered.annotate(
+            {
+                "scholarships": [row[2] for row in hits],
+                "eligibility": [row[3] for row in hits],
+                # Stable score sort over seeker order, like `ranker_score_tool`.
+                "ranked": [row[4] for row in sorted(rows, key=lambda row: row[:2])],
+            }
+        )
+
+    def universities(
+        self, profile: StudentProfile, top_n: int = 3, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """Sharded `university_match_tool`: a global top-n merge of per-shard top-n lists."""
+        gathered = self._scatter(
+            "universities", {"profile": profile.to_payload(), "top_n": top_n},
+            self.timeout if timeout is None else timeout,
+        )
+        merged = heapq.merge(*gathered.replies.values(), key=lambda row: row[:2])
+        return gathered.annotate(
+            {"recommendations": [row[2] for row in itertools.islice(merged, top_n)]}
+        )
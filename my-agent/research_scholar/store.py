@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from . import serialization
+from .models import StudentProfile
+from .report_query import summarize_report
+
+DEFAULT_STORE_PATH = Path("reports.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    email TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_email TEXT NOT NULL,
+    query TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rankings (
+    report_id INTEGER NOT NULL REFERENCES reports(id) ON DELETE CASCADE,
+    student_email TEXT NOT NULL,
+    scholarship_id TEXT NOT NULL,
+    rank INTEGER NOT NULL,
+    score REAL NOT NULL,
+    deadline TEXT NOT NULL,
+    PRIMARY KEY (report_id, scholarship_id)
+);
+CREATE TABLE IF NOT EXISTS report_summaries (
+    report_id INTEGER PRIMARY KEY REFERENCES reports(id) ON DELETE CASCADE,
+    etag TEXT NOT NULL,
+    payload BLOB NOT NULL
+);
+-- Last eligible set per scholarship that `ProfileIndex` notified students about.
+CREATE TABLE IF NOT EXISTS eligible_students (
+    scholarship_id TEXT NOT NULL,
+    student_email TEXT NOT NULL,
+    PRIMARY KEY (scholarship_id, student_email)
+);
+CREATE INDEX IF NOT EXISTS idx_reports_student ON reports(student_email, id);
+CREATE INDEX IF NOT EXISTS idx_rankings_scholarship_rank ON rankings(scholarship_id, rank);
+CREATE INDEX IF NOT EXISTS idx_rankings_deadline ON rankings(deadline);
+"""
+
+# Only the most recent report per student counts for cross-student queries.
+_LATEST_REPORTS = "SELECT MAX(id) FROM reports GROUP BY student_email"
+
+
+def _encode(payload: Any) -> bytes:
+    return serialization.dumps(payload)
+
+
+def _decode(blob: bytes) -> Any:
+    return serialization.loads(blob)
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat(timespec="seconds")
+
+
+class ReportStore:
+    """Embedded SQLite store for profiles, generated reports, and rankings."""
+
+    def __init__(self, path: Path | str = DEFAULT_STORE_PATH, check_same_thread: bool = True) -> None:
+        self.path = Path(path)
+        # Pass check_same_thread=False to share one store across a server's
+        # worker threads; callers must then serialize access themselves.
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=check_same_thread)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "ReportStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # -- writes -------------------------------------------------------------
+
+    def save_profile(self, profile: StudentProfile) -> str:
+        with self._conn:
+            self._upsert_profile(profile.to_payload())
+        return profile.email
+
+    def save_report(self, report: Dict[str, Any]) -> int:
+        return self.save_reports([report])[0]
+
+    def save_reports(self, reports: Iterable[Dict[str, Any]]) -> List[int]:
+        """Insert a batch of orchestrator reports in a single transaction."""
+        report_ids: List[int] = []
+        with self._conn:
+            for report in reports:
+                profile = report["profile"]
+                self._upsert_profile(profile)
+                payload = _encode(serialization.dedupe_report(report))
+                cursor = self._conn.execute(
+                    "INSERT INTO reports (student_email, query, created_at, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    (profile["email"], report.get("query", ""), _now(), payload),
+                )
+                report_id = cursor.lastrowid
+                self._save_summary(report_id, payload, report)
+                self._conn.executemany(
+                    "INSERT INTO rankings "
+                    "(report_id, student_email, scholarship_id, rank, score, deadline) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (
+                            report_id,
+                            profile["email"],
+                            entry["scholarship"]["id"],
+                            rank,
+                            entry["score"],
+                            entry["scholarship"]["deadline"],
+                        )
+                        for rank, entry in enumerate(report.get("ranker", {}).get("ranked", []), 1)
+                    ],
+                )
+                report_ids.append(report_id)
+        return report_ids
+
+    def _save_summary(self, report_id: int, payload: bytes, report: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO report_summaries (report_id, etag, payload) VALUES (?, ?, ?)",
+            (
+                report_id,
+                hashlib.sha256(payload).hexdigest()[:20],
+                _encode(summarize_report(report)),
+            ),
+        )
+
+    def _upsert_profile(self, payload: Dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT INTO profiles (email, name, payload, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(email) DO UPDATE SET name = excluded.name, "
+            "payload = excluded.payload, updated_at = excluded.updated_at",
+            (payload["email"], payload["name"], _encode(payload), _now()),
+        )
+
+    def update_eligible_students(self, scholarship_id: str, emails: Iterable[str]) -> Set[str]:
+        """Replace the stored eligible set of a scholarship; returns the newly added emails.
+
+        Runs under SQLite's write lock, so two processes re-matching the same
+        scholarship never both report a student as new.
+        """
+        emails = set(emails)
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            previous = {
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT student_email FROM eligible_students WHERE scholarship_id = ?",
+                    (scholarship_id,),
+                )
+            }
+            self._conn.executemany(
+                "DELETE FROM eligible_students WHERE scholarship_id = ? AND student_email = ?",
+                [(scholarship_id, email) for email in previous - emails],
+            )
+            self._conn.executemany(
+                "INSERT INTO eligible_students (scholarship_id, student_email) VALUES (?, ?)",
+                [(scholarship_id, email) for email in emails - previous],
+            )
+        return emails - previous
+
+    def forget_eligibility(
+        self, scholarship_id: Optional[str] = None, email: Optional[str] = None
+    ) -> None:
+        """Drop stored eligible sets for a scholarship and/or a student."""
+        with self._conn:
+            if scholarship_id is not None:
+                self._conn.execute(
+                    "DELETE FROM eligible_students WHERE scholarship_id = ?", (scholarship_id,)
+                )
+            if email is not None:
+                self._conn.execute(
+                    "DELETE FROM eligible_students WHERE student_email = ?", (email,)
+                )
+
+    # -- reads --------------------------------------------------------------
+
+    def get_profile(self, email: str) -> Optional[StudentProfile]:
+        row = self._conn.execute(
+            "SELECT payload FROM profiles WHERE email = ?", (email,)
+        ).fetchone()
+        return StudentProfile.from_dict(_decode(row["payload"])) if row else None
+
+    def iter_profiles(self) -> Iterator[StudentProfile]:
+        for row in self._conn.execute("SELECT payload FROM profiles ORDER BY email"):
+            yield StudentProfile.from_dict(_decode(row["payload"]))
+
+    def get_report(self, report_id: int) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT payload FROM reports WHERE id = ?", (report_id,)
+        ).fetchone()
+        return serialization.expand_report(_decode(row["payload"])) if row else None
+
+    def get_summary(self, report_id: int) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """(etag, dashboard aggregates) of a report, backfilled for older reports."""
+        row = self._conn.execute(
+            "SELECT etag, payload FROM report_summaries WHERE report_id = ?", (report_id,)
+        ).fetchone()
+        if row is None:
+            stored = self._conn.execute(
+                "SELECT payload FROM reports WHERE id = ?", (report_id,)
+            ).fetchone()
+            if stored is None:
+                return None
+            with self._conn:
+                self._save_summary(
+                    report_id,
+                    stored["payload"],
+                    serialization.expand_report(_decode(stored["payload"])),
+                )
+            return self.get_summary(report_id)
+        return row["etag"], _decode(row["payload"])
+
+    def latest_report_id(self, email: str) -> Optional[int]:
+        row = self._conn.execute(
+            "SELECT MAX(id) AS id FROM reports WHERE student_email = ?", (email,)
+        ).fetchone()
+        return row["id"] if row else None
+
+    def latest_report(self, email: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT payload FROM reports WHERE student_email = ? ORDER BY id DESC LIMIT 1",
+            (email,),
+        ).fetchone()
+        return serialization.expand_report(_decode(row["payload"])) if row else None
+
+    def top_ranked(self, scholarship_id: str, top_k: int = 3) -> List[Dict[str, Any]]:
+        """Students whose latest report ranks `scholarship_id` within the top `top_k`."""
+        rows = self._conn.execute(
+            "SELECT r.report_id, r.student_email, p.name, r.rank, r.score "
+            "FROM rankings r JOIN profiles p ON p.email = r.student_email "
+            f"WHERE r.scholarship_id = ? AND r.rank <= ? AND r.report_id IN ({_LATEST_REPORTS}) "
+            "ORDER BY r.rank, r.score DESC",
+            (scholarship_id, top_k),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def reports_with_deadlines_within(
+        self, within_days: int, today: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Latest reports containing a ranked scholarship due in the next `within_days`."""
+        start = datetime.strptime(today, "%Y-%m-%d").date() if today else datetime.utcnow().date()
+        end = start + timedelta(days=within_days)
+        rows = self._conn.execute(
+            "SELECT report_id, student_email, MIN(deadline) AS next_deadline, "
+            "COUNT(*) AS due_count FROM rankings "
+            f"WHERE deadline BETWEEN ? AND ? AND report_id IN ({_LATEST_REPORTS}) "
+            "GROUP BY report_id ORDER BY next_deadline",
+            (str(start), str(end)),
+        ).fetchall()
+        return [dict(row) for row in rows]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import random
+from datetime import date, timedelta
+from typing import Iterator, List
+
+from .models import ScholarshipOpportunity, StudentProfile, UniversityProgram
+
+# Vocabulary mirrors the demo catalog so synthetic records exercise the same
+# matching paths (majors, citizenship, "Any"/"global" wildcards, demographics).
+MAJORS = [
+    "computer science",
+    "engineering",
+    "data science",
+    "software engineering",
+    "international relations",
+    "public policy",
+    "biology",
+    "economics",
+    "information technology",
+    "product design",
+]
+COUNTRIES = [
+    "Australia",
+    "New Zealand",
+    "United States",
+    "Canada",
+    "Vietnam",
+    "India",
+    "Kenya",
+    "Brazil",
+    "Germany",
+    "Japan",
+]
+DEMOGRAPHICS = [
+    "women",
+    "first-generation",
+    "rural",
+    "pacific-islander",
+    "underrepresented-minority",
+    "low-income",
+]
+TOPICS = [
+    "STEM",
+    "Climate",
+    "Open Source",
+    "Health",
+    "Leadership",
+    "Research",
+    "Social Impact",
+    "AI Ethics",
+    "Education",
+    "Entrepreneurship",
+]
+AWARD_WORDS = ["Scholarship", "Grant", "Award", "Fellowship", "Bursary"]
+SPONSORS = ["Foundation", "Trust", "Institute", "Alliance", "Fund", "Society"]
+EFFORT_LEVELS = ["Low", "Medium", "High"]
+CURRENCIES = ["USD", "USD", "USD", "AUD", "EUR"]
+ACADEMIC_LEVELS = ["Undergraduate", "Graduate", "PhD"]
+# Fixed so seeded output (deadlines, hence urgency and ranking) is the same on
+# every day a benchmark baseline is compared against.
+SYNTHETIC_EPOCH = date(2026, 1, 1)
+
+
+def iter_scholarships(
+    count: int, seed: int = 0, start: date = SYNTHETIC_EPOCH
+) -> Iterator[ScholarshipOpportunity]:
+    """Yield `count` reproducible scholarships with deadlines in the year after `start`."""
+    rng = random.Random(seed)
+    for index in range(count):
+        topic = rng.choice(TOPICS)
+        region = rng.choice(COUNTRIES)
+        open_to_all = rng.random() < 0.4
+        yield ScholarshipOpportunity(
+            id=f"SYN-S{index:07d}",
+            title=f"{region} {topic} {rng.choice(AWARD_WORDS)}",
+            sponsor=f"{rng.choice(TOPICS)} {rng.choice(SPONSORS)}",
+            amount=rng.randrange(1000, 40000, 500),
+            currency=rng.choice(CURRENCIES),
+            deadline=str(start + timedelta(days=rng.randint(1, 365))),
+            eligibility={
+                "min_gpa": round(rng.uniform(2.5, 3.8), 1),
+                "majors": rng.sample(MAJORS, rng.randint(1, 4)),
+                "citizenship": ["Any"] if open_to_all else rng.sample(COUNTRIES, rng.randint(1, 3)),
+                "location": ["global"] if open_to_all else [region],
+                "demographics": rng.sample(DEMOGRAPHICS, rng.randint(0, 2)),
+            },
+            effort_level=rng.choice(EFFORT_LEVELS),
+            description=(
+                f"Supports {topic.lower()} students in {region} working on "
+                f"{rng.choice(TOPICS).lower()} projects."
+            ),
+            url=f"https://example.org/scholarships/syn-s{index:07d}",
+        )
+
+
+def iter_universities(count: int, seed: int = 0) -> Iterator[UniversityProgram]:
+    rng = random.Random(seed)
+    for index in range(count):
+        location = rng.choice(COUNTRIES + ["Global (Remote)"])
+        yield UniversityProgram(
+            id=f"SYN-U{index:07d}",
+            name=f"{rng.choice(TOPICS)} University {index}",
+            location=location,
+            programs=[major.title() for major in rng.sample(MAJORS, rng.randint(1, 4))],
+            demographics=rng.sample(DEMOGRAPHICS + ["any"], rng.randint(1, 3)),
+            highlights=[f"{rng.choice(TOPICS)} program", f"{rng.choice(TOPICS)} lab"],
+            website=f"https://example.edu/syn-u{index:07d}",
+            tuition_support=f"{rng.randint(10, 100)}% tuition waiver",
+        )
+
+
+def iter_profiles(count: int, seed: int = 0) -> Iterator[StudentProfile]:
+    rng = random.Random(seed)
+    for index in range(count):
+        country = rng.choice(COUNTRIES)
+        demographics = {"gender": rng.choice(["women", "men", "non-binary"])}
+        if rng.random() < 0.3:
+            demographics["first_generation"] = "first-generation"
+        if rng.random() < 0.2:
+            demographics["other"] = rng.choice(DEMOGRAPHICS)
+        yield StudentProfile(
+            name=f"Student {index}",
+            email=f"student{index}@example.org",
+            academic_level=rng.choice(ACADEMIC_LEVELS),
+            gpa=round(rng.uniform(2.0, 4.0), 2),
+            major=rng.choice(MAJORS),
+            location=country,
+            citizenship=country,
+            interests=rng.sample(TOPICS, 3),
+            demographics=demographics,
+            skills=rng.sample(["Python", "SQL", "React", "R", "Go", "Rust"], 2),
+            goals=f"Lead {rng.choice(TOPICS).lower()} initiatives.",
+            experiences=[f"{rng.choice(TOPICS)} volunteer", f"{rng.choice(TOPICS)} intern"],
+            preferred_countries=rng.sample(COUNTRIES, 2),
+        )
+
+
+def generate_scholarships(
+    count: int, seed: int = 0, start: date = SYNTHETIC_EPOCH
+) -> List[ScholarshipOpportunity]:
+    return list(iter_scholarships(count, seed, start))
+
+
+def generate_universities(count: int, seed: int = 0) -> List[UniversityProgram]:
+    return list(iter_universities(count, seed))
+
+
+def generate_profiles(count: int, seed: int = 0) -> List[StudentProfile]:
+    return list(iter_profiles(count, seed))
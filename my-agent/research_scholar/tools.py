@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import math
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from . import serialization
+from .cache import ResultCache
+from .facets import FacetIndex, Term, iter_positions, parse_filter
 from .data import load_demo_scholarships, load_demo_universities
 from .models import (
     ApplicationMaterial,
@@ -17,6 +21,98 @@ from .cv_parser import DEFAULT_CV_MODEL, parse_cv_to_json
 SCHOLARSHIP_DB = load_demo_scholarships()
 UNIVERSITY_DB = load_demo_universities()
 
+SEEKER_CACHE = ResultCache(maxsize=1024, ttl=3600)
+MATCHER_CACHE = ResultCache(maxsize=4096, ttl=3600)
+
+# (id(SCHOLARSHIP_DB), len(SCHOLARSHIP_DB), content hash) of the last fingerprint.
+_catalog_fingerprint: Optional[Tuple[int, int, str]] = None
+# (catalog version, index) of the last facet index built.
+_facet_index: Optional[Tuple[str, FacetIndex]] = None
+# (catalog version, {id: payload}) used to key matcher results on catalog ids.
+_catalog_payloads: Optional[Tuple[str, Dict[str, Dict[str, Any]]]] = None
+
+
+def set_catalog(
+    scholarships: Optional[Iterable[ScholarshipOpportunity]] = None,
+    universities: Optional[Iterable[UniversityProgram]] = None,
+) -> str:
+    """Replace the in-memory catalogs and return the new catalog version."""
+    global SCHOLARSHIP_DB, UNIVERSITY_DB, _catalog_fingerprint
+    if scholarships is not None:
+        SCHOLARSHIP_DB = list(scholarships)
+    if universities is not None:
+        UNIVERSITY_DB = list(universities)
+    _catalog_fingerprint = None
+    return catalog_version()
+
+
+def catalog_version() -> str:
+    """Content hash of the scholarship catalog used to key cached results.
+
+    Recomputed whenever the catalog list is replaced or resized; call
+    `set_catalog()` after editing records in place.
+    """
+    global _catalog_fingerprint
+    identity = (id(SCHOLARSHIP_DB), len(SCHOLARSHIP_DB))
+    if _catalog_fingerprint is None or _catalog_fingerprint[:2] != identity:
+        digest = hashlib.sha256(serialization.dumps(SCHOLARSHIP_DB)).hexdigest()[:16]
+        _catalog_fingerprint = (*identity, digest)
+    return _catalog_fingerprint[2]
+
+
+def catalog_facets() -> FacetIndex:
+    """Bitmap facet index over `SCHOLARSHIP_DB`, rebuilt when the catalog version changes."""
+    global _facet_index
+    version = catalog_version()
+    if _facet_index is None or _facet_index[0] != version:
+        _facet_index = (version, FacetIndex(SCHOLARSHIP_DB))
+    return _facet_index[1]
+
+
+def _copy_cached(value: Any) -> Any:
+    # Cached results are shared between callers; each caller gets its own
+    # copy to edit. They are JSON-shaped (the disk tier stores them as JSON),
+    # and a serializer round trip is several times faster than deepcopy.
+    return serialization.loads(serialization.dumps(value))
+
+
+def _scholarship_cache_key(payload: Dict[str, Any], catalog: Dict[str, Dict[str, Any]]) -> str:
+    # Unedited catalog records are keyed by id (the catalog version is in the
+    # matcher key); anything else, e.g. an edited or LLM-extracted record that
+    # reuses a catalog id, by a hash of its content.
+    if catalog.get(payload.get("id")) == payload:
+        return payload["id"]
+    return hashlib.sha256(serialization.dumps(payload)).hexdigest()
+
+
+def _catalog_payloads_by_id(version: str) -> Dict[str, Dict[str, Any]]:
+    global _catalog_payloads
+    if _catalog_payloads is None or _catalog_payloads[0] != version:
+        _catalog_payloads = (version, {opp.id: opp.to_payload() for opp in SCHOLARSHIP_DB})
+    return _catalog_payloads[1]
+
+
+def configure_result_caches(
+    maxsize: int = 1024, ttl: Optional[float] = 3600, directory: Optional[Path] = None
+) -> None:
+    """Rebuild the seeker/matcher caches, optionally persisting them under `directory`."""
+    global SEEKER_CACHE, MATCHER_CACHE
+    SEEKER_CACHE = ResultCache(
+        maxsize, ttl, directory / "seeker_cache.db" if directory else None
+    )
+    MATCHER_CACHE = ResultCache(
+        maxsize * 4, ttl, directory / "matcher_cache.db" if directory else None
+    )
+
+
+def clear_result_caches() -> None:
+    SEEKER_CACHE.clear()
+    MATCHER_CACHE.clear()
+
+
+def result_cache_stats() -> Dict[str, Dict[str, Any]]:
+    return {"seeker": SEEKER_CACHE.stats.to_payload(), "matcher": MATCHER_CACHE.stats.to_payload()}
+
 
 def _normalize(text: str) -> str:
     return text.lower().strip()
@@ -28,35 +124,101 @@ def _deadline_within(deadline: str, within_days: int) -> bool:
 
 
 def seeker_search_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Locate scholarships that mention the query keywords."""
+    """Locate scholarships that mention the query keywords.
+
+    An optional `filters` expression (see `facets.parse_filter`) narrows the
+    catalog through the facet index before any record is read.
+    """
     query = _normalize(payload.get("query", ""))
     limit = payload.get("limit", 10)
     profile = payload.get("profile", {})
+    filters = parse_filter(payload["filters"]) if payload.get("filters") else None
+
+    # Matching is "any term", so the term set (not order) determines results.
+    query_terms = sorted({_normalize(term) for term in query.split() if term})
+    location = _normalize(profile.get("location", "")) if profile else ""
+    key = (
+        tuple(query_terms),
+        location,
+        limit,
+        filters.key() if filters else None,
+        catalog_version(),
+    )
+    filtered = SEEKER_CACHE.get_or_compute(
+        key, lambda: _search_catalog(query_terms, location, limit, filters)
+    )
+    return {"scholarships": _copy_cached(filtered)}
+
+
+def _search_catalog(
+    query_terms: List[str], location: str, limit: int, filters=None
+) -> List[Dict[str, Any]]:
+    records = catalog_facets().records
+    return [
+        records[position].to_payload()
+        for position in _search_positions(query_terms, location, limit, filters)
+    ]
+
 
-    filtered: List[Dict[str, Any]] = []
-    query_terms = [_normalize(term) for term in query.split() if term]
-    for opp in SCHOLARSHIP_DB:
+def _search_positions(
+    query_terms: List[str], location: str, limit: Optional[int], filters=None
+) -> List[int]:
+    """Catalog positions of the first `limit` matches, in catalog order."""
+    index = catalog_facets()
+    candidates = index.evaluate(filters)
+    if location:
+        # Same rule as before: the student's location or an "any" listing.
+        candidates &= index.evaluate(Term("location", location))
+
+    found: List[int] = []
+    for position in iter_positions(candidates):
+        if limit is not None and 0 <= limit <= len(found):
+            break
+        opp = index.records[position]
         corpus = _normalize(f"{opp.title} {opp.description}")
         if query_terms and not any(term in corpus for term in query_terms):
             continue
+        found.append(position)
 
-        if profile:
-            location = _normalize(profile.get("location", ""))
-            eligible_locations = [_normalize(loc) for loc in opp.eligibility["location"]]
-            if "any" not in eligible_locations and location and location not in eligible_locations:
-                continue
+    return found[:limit]
 
-        filtered.append(opp.to_payload())
 
-    return {"scholarships": filtered[:limit]}
+def facet_counts_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Count catalog scholarships per facet value, optionally within a filter expression."""
+    index = catalog_facets()
+    filters = parse_filter(payload["filters"]) if payload.get("filters") else None
+    return {
+        "total": index.count(filters),
+        "facets": index.facet_counts(payload.get("facets"), where=filters),
+    }
 
 
 def matcher_filter_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Apply eligibility rules against the student profile."""
     profile = StudentProfile.from_dict(payload["profile"])
-    scholarships = [
-        ScholarshipOpportunity.from_dict(sch) for sch in payload.get("scholarships", [])
-    ]
+    scholarships = payload.get("scholarships", [])
+    # Only the facets the rules below read go into the key, so students who
+    # differ in name, skills, goals etc. share cached results.
+    version = catalog_version()
+    catalog = _catalog_payloads_by_id(version)
+    key = (
+        profile.gpa,
+        profile.major.lower(),
+        profile.citizenship.lower(),
+        tuple(sorted({_normalize(v) for v in profile.demographics.values() if isinstance(v, str)})),
+        version,
+        tuple(_scholarship_cache_key(payload, catalog) for payload in scholarships),
+    )
+    eligible = MATCHER_CACHE.get_or_compute(
+        key, lambda: _match_eligibility(profile, scholarships)
+    )
+    return {"eligibility": _copy_cached(eligible)}
+
+
+def _match_eligibility(
+    profile: StudentProfile, scholarship_payloads: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    scholarships = [ScholarshipOpportunity.from_dict(sch) for sch in scholarship_payloads]
 
     eligible: List[Dict[str, Any]] = []
     for opp in scholarships:
@@ -98,36 +260,35 @@ def matcher_filter_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
             }
         )
 
-    return {"eligibility": eligible}
+    return eligible
 
 
 def ranker_score_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Rank scholarships by weighted score (fit, award size, effort, urgency)."""
-    ranked: List[Dict[str, Any]] = []
-    for item in payload.get("eligibility", []):
-        scholarship = ScholarshipOpportunity.from_dict(item["scholarship"])
-        fit_penalty = 0 if item["fit_summary"].startswith("Strong") else 20
-        amount_score = min(math.ceil(scholarship.amount / 1000), 30)
-        effort_map = {"Low": 20, "Medium": 10, "High": 0}
-        effort_score = effort_map.get(scholarship.effort_level, 5)
-        urgency_bonus = 10 if _deadline_within(scholarship.deadline, 45) else 0
-        base = 60 - fit_penalty + amount_score + effort_score + urgency_bonus
-        score = max(0, min(100, round(base, 1)))
-        ranked.append(
-            {
-                "scholarship": scholarship.to_payload(),
-                "score": score,
-                "reasoning": (
-                    f"Fit penalty {fit_penalty}, amount {amount_score}, "
-                    f"effort {effort_score}, urgency {urgency_bonus}"
-                ),
-            }
-        )
-
+    ranked = [_score_eligibility(item) for item in payload.get("eligibility", [])]
     ranked.sort(key=lambda item: item["score"], reverse=True)
     return {"ranked": ranked}
 
 
+def _score_eligibility(item: Dict[str, Any]) -> Dict[str, Any]:
+    scholarship = ScholarshipOpportunity.from_dict(item["scholarship"])
+    fit_penalty = 0 if item["fit_summary"].startswith("Strong") else 20
+    amount_score = min(math.ceil(scholarship.amount / 1000), 30)
+    effort_map = {"Low": 20, "Medium": 10, "High": 0}
+    effort_score = effort_map.get(scholarship.effort_level, 5)
+    urgency_bonus = 10 if _deadline_within(scholarship.deadline, 45) else 0
+    base = 60 - fit_penalty + amount_score + effort_score + urgency_bonus
+    score = max(0, min(100, round(base, 1)))
+    return {
+        "scholarship": scholarship.to_payload(),
+        "score": score,
+        "reasoning": (
+            f"Fit penalty {fit_penalty}, amount {amount_score}, "
+            f"effort {effort_score}, urgency {urgency_bonus}"
+        ),
+    }
+
+
 def writer_materials_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Produce essay outlines, CV bullets, and LOR prompts."""
     profile = StudentProfile.from_dict(payload["profile"])
@@ -244,7 +405,15 @@ def university_match_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     profile = StudentProfile.from_dict(profile_dict)
     top_n = payload.get("top_n", 3)
+    recommendations = _score_universities(profile, UNIVERSITY_DB)
+    recommendations.sort(key=lambda entry: entry["score"], reverse=True)
+    return {"recommendations": recommendations[:top_n]}
+
 
+def _score_universities(
+    profile: StudentProfile, universities: Iterable[UniversityProgram]
+) -> List[Dict[str, Any]]:
+    """One scored recommendation per university, in catalog order."""
     profile_demographics = {
         key: str(value).lower()
         for key, value in profile.demographics.items()
@@ -253,7 +422,7 @@ def university_match_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
     profile_interests = [interest.lower() for interest in profile.interests]
 
     recommendations: List[Dict[str, Any]] = []
-    for uni in UNIVERSITY_DB:
+    for uni in universities:
         uni_record = UniversityProgram.from_dict(uni.to_payload())
         score = 50
         reasons: List[str] = []
@@ -288,6 +457,4 @@ def university_match_tool(payload: Dict[str, Any]) -> Dict[str, Any]:
             }
         )
 
-    recommendations.sort(key=lambda entry: entry["score"], reverse=True)
-    return {"recommendations": recommendations[:top_n]}
-
+    return recommendations
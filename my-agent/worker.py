@@ -0,0 +1,68 @@
+"""
+Job worker pool for queued CV parsing and report generation.
+
+Run `python worker.py --queue jobs.db --processes 4` next to any producer that
+enqueues jobs with `research_scholar.jobs.enqueue_cv_parse` / `enqueue_report`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import signal
+import threading
+from pathlib import Path
+
+from research_scholar.jobs import DEFAULT_QUEUE_PATH, JobQueue, WorkerPool
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Process queued ResearchScholar jobs.")
+    parser.add_argument(
+        "--queue",
+        type=Path,
+        default=DEFAULT_QUEUE_PATH,
+        help="SQLite database holding the job queue.",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=None,
+        help="Worker processes to start (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--visibility-timeout",
+        type=float,
+        default=300.0,
+        help="Seconds a claimed job stays leased without a heartbeat before it is retried.",
+    )
+    parser.add_argument(
+        "--drain",
+        action="store_true",
+        help="Exit once the queue is empty instead of waiting for new jobs.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    finished = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: finished.set())
+
+    pool = WorkerPool(args.queue, args.processes, visibility_timeout=args.visibility_timeout)
+    print(f"Starting {pool.processes} workers on {args.queue.resolve()}")
+    with pool:
+        try:
+            if args.drain:
+                pool.drain()
+            else:
+                finished.wait()
+        except KeyboardInterrupt:
+            pass
+
+    with JobQueue(args.queue) as queue:
+        print(json.dumps(queue.stats()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+AGENT_ROOT = PROJECT_ROOT / "my-agent"
+if str(AGENT_ROOT) not in sys.path:
+    sys.path.append(str(AGENT_ROOT))
+
+from research_scholar.models import StudentProfile  # noqa: E402
+from research_scholar.tools import (  # noqa: E402
+    matcher_filter_tool,
+    ranker_score_tool,
+    seeker_search_tool,
+    tracker_schedule_tool,
+)
+
+
+def make_student(**overrides: Any) -> StudentProfile:
+    data: Dict[str, Any] = {
+        "name": "Ada Nguyen",
+        "email": "ada@example.org",
+        "academic_level": "Undergraduate",
+        "gpa": 3.8,
+        "major": "Computer Science",
+        "location": "Australia",
+        "citizenship": "Australia",
+        "interests": ["Human-Centered AI", "Open Source"],
+        "demographics": {"gender": "women", "first_generation": "first-generation"},
+        "skills": ["Python", "React"],
+        "goals": "Build accessible AI tools for rural schools.",
+        "experiences": ["Maintainer of an OSS tutoring platform"],
+        "preferred_countries": ["Australia"],
+    }
+    data.update(overrides)
+    return StudentProfile.from_dict(data)
+
+
+def make_report(profile: StudentProfile, query: str = "") -> Dict[str, Any]:
+    """Run the deterministic tool chain without constructing LLM agents."""
+    seeker = seeker_search_tool({"query": query, "limit": 10, "profile": profile.to_payload()})
+    matcher = matcher_filter_tool(
+        {"profile": profile.to_payload(), "scholarships": seeker["scholarships"]}
+    )
+    ranker = ranker_score_tool(matcher)
+    tracker = tracker_schedule_tool({"ranked": ranker["ranked"], "top_n": 3})
+    return {
+        "query": query,
+        "profile": profile.to_payload(),
+        "seeker": seeker,
+        "matcher": matcher,
+        "ranker": ranker,
+        "tracker": tracker,
+    }
+
+
+@pytest.fixture
+def student() -> StudentProfile:
+    return make_student()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from research_scholar.agents import AgentPool
+from research_scholar.orchestrator import ResearchScholarOrchestrator
+
+
+@pytest.fixture
+def pool(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENONION_API_KEY", "test-key")
+    monkeypatch.chdir(tmp_path)  # agents write their logs under ./.co
+    return AgentPool()
+
+
+def test_orchestrator_builds_agents_lazily_from_pool(pool):
+    first = ResearchScholarOrchestrator(pool=pool)
+    second = ResearchScholarOrchestrator(pool=pool)
+    assert pool.built == 0
+
+    assert first.seeker_agent is second.seeker_agent
+    assert first.ranker_agent.llm is first.seeker_agent.llm
+    assert pool.built == 2
+
+
+def test_lease_hands_out_exclusive_agents(pool):
+    leased = []
+    barrier = threading.Barrier(3)
+
+    def worker():
+        with pool.lease("matcher") as agent:
+            leased.append(agent)
+            barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(agent) for agent in leased}) == 3
+    assert len({id(agent.llm) for agent in leased}) == 1
+    with pool.lease("matcher") as agent:
+        assert agent in leased
+    assert pool.built == 3
+
+
+def test_orchestrator_agents_are_per_thread(pool):
+    orchestrator = ResearchScholarOrchestrator(pool=pool)
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(orchestrator.seeker_agent))
+    thread.start()
+    thread.join()
+    assert seen[0] is not orchestrator.seeker_agent
+    assert seen[0].llm is orchestrator.seeker_agent.llm
+
+
+def test_lease_released_after_clear(pool):
+    with pool.lease("ranker") as agent:
+        pool.clear()
+    with pool.lease("ranker") as again:
+        assert again is agent
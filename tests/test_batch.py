@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import argparse
+
+from conftest import make_student
+
+from research_scholar import serialization
+from research_scholar.batch import BatchRunner, external_merge
+from research_scholar.orchestrator import ResearchScholarOrchestrator
+
+QUERY = "scholarships for women in computer science"
+
+
+def _cohort(size: int):
+    return [make_student(email=f"s{i:03d}@example.org", gpa=3.0 + i % 10 / 10) for i in range(size)]
+
+
+def test_rankings_match_in_memory_run(tmp_path):
+    cohort = _cohort(40)
+    runner = BatchRunner(memory_budget_mb=0.2, min_chunk=2, probe_every=1, merge_fan_in=3)
+    result = runner.run(iter(cohort), QUERY, limit=5, output_dir=tmp_path)
+
+    assert result.stats.reports == 40 and sum(result.stats.chunk_sizes) == 40
+    assert result.stats.chunks > 3 and result.stats.report_bytes_estimate > 0
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["rankings.jsonl", "reports.jsonl"]
+
+    orchestrator = ResearchScholarOrchestrator()
+    expected = sorted(
+        (entry["scholarship"]["id"], -entry["score"], rank, profile.email)
+        for profile in cohort
+        for rank, entry in enumerate(orchestrator.run(QUERY, profile, limit=5)["ranker"]["ranked"], 1)
+    )
+    rows = [
+        (row["scholarship_id"], -row["score"], row["rank"], row["student_email"])
+        for row in result.iter_rankings()
+    ]
+    assert rows == expected
+
+    groups = dict(result.iter_scholarship_applicants(top_k=3))
+    assert all(len(applicants) <= 3 for applicants in groups.values())
+    assert set(groups) == {row[0] for row in expected}
+
+
+def test_spilled_reports_round_trip_compressed(tmp_path):
+    cohort = _cohort(6)
+    result = BatchRunner(compress=True).run(cohort, QUERY, limit=3, output_dir=tmp_path)
+    assert result.reports_path.name == "reports.jsonl.gz"
+    reports = list(result.iter_reports())
+    assert [report["profile"]["email"] for report in reports] == [p.email for p in cohort]
+    assert reports[0] == ResearchScholarOrchestrator().run(QUERY, cohort[0], limit=3)
+
+
+def test_external_merge_multi_pass(tmp_path):
+    runs = []
+    for index in range(7):
+        path = tmp_path / f"run{index}.jsonl"
+        path.write_bytes(b"".join(serialization.dumps([n]) + b"\n" for n in range(index, 50, 7)))
+        runs.append(path)
+    output = external_merge(runs, tmp_path / "merged.jsonl", fan_in=2)
+    assert [serialization.loads(line)[0] for line in output.read_bytes().splitlines()] == list(
+        range(50)
+    )
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["merged.jsonl"]
+
+
+def test_cohort_cli_reports_rejected_rows(tmp_path, capsys):
+    import agent
+
+    rows = [make_student(email=f"c{i}@example.org").to_payload() for i in range(3)]
+    rows[1]["gpa"] = "n/a"
+    cohort = tmp_path / "cohort.jsonl"
+    cohort.write_bytes(b"".join(serialization.dumps(row) + b"\n" for row in rows))
+    args = argparse.Namespace(
+        cohort=cohort,
+        batch_dir=tmp_path / "out",
+        store=None,
+        memory_budget_mb=16.0,
+        query=QUERY,
+        limit=3,
+    )
+    agent.run_cohort(args)
+    out = capsys.readouterr().out
+    assert "Profiles loaded: 2, rejected: 1" in out
+    assert "line 2, gpa:" in out
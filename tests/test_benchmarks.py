@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from research_scholar.synthetic import SYNTHETIC_EPOCH, generate_profiles, generate_scholarships
+
+sys.path.append(str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+import run_benchmarks  # noqa: E402
+
+
+def test_synthetic_generators_are_seeded():
+    assert generate_scholarships(25, seed=3) == generate_scholarships(25, seed=3)
+    assert generate_profiles(25, seed=3) != generate_profiles(25, seed=4)
+    assert len({opp.id for opp in generate_scholarships(500)}) == 500
+    # Deadlines hang off a fixed epoch, not today's date.
+    deadlines = [opp.deadline for opp in generate_scholarships(50)]
+    assert min(deadlines) > str(SYNTHETIC_EPOCH)
+    shifted = generate_scholarships(50, start=date(2030, 1, 1))
+    assert min(opp.deadline for opp in shifted) > "2030-01-01"
+
+
+def test_harness_writes_results_and_flags_regressions(tmp_path):
+    output = tmp_path / "bench.json"
+    argv = ["--scale", "40", "--profiles", "3", "--repeat", "1", "--only", "tools."]
+    assert run_benchmarks.main(argv + ["--output", str(output)]) == 0
+
+    results = json.loads(output.read_text())["results"]
+    assert {entry["name"] for entry in results} >= {"tools.seeker_search", "tools.ranker_score"}
+
+    faster = [dict(entry, median_s=entry["median_s"] / 100) for entry in results]
+    assert run_benchmarks.find_regressions(results, faster, tolerance=0.2)
+    assert not run_benchmarks.find_regressions(results, results, tolerance=0.2)
+
+
+def test_benchmarks_clean_up_temporary_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    argv = ["--scale", "30", "--profiles", "2", "--repeat", "1", "--only", "reports."]
+    assert run_benchmarks.main(argv + ["--only", "profiles.", "--only", "llm.cv_extract.replay"]) == 0
+    assert list(tmp_path.iterdir()) == []
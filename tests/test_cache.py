@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from research_scholar import tools
+from research_scholar.cache import ResultCache
+from research_scholar.data import load_demo_scholarships
+
+
+def test_result_cache_lru_ttl_and_disk_tier(tmp_path):
+    now = [0.0]
+    cache = ResultCache(maxsize=2, ttl=10, path=tmp_path / "cache.db", clock=lambda: now[0])
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+    cache.get(("a",))
+    cache.set(("c",), 3)
+    assert len(cache) == 2 and cache.stats.evictions == 1
+
+    reopened = ResultCache(maxsize=2, ttl=10, path=tmp_path / "cache.db", clock=lambda: now[0])
+    assert reopened.get(("b",)) == 2 and reopened.stats.disk_hits == 1
+
+    now[0] = 11.0
+    assert cache.get(("a",)) is None
+    assert cache.stats.expirations == 1
+    assert 0 < cache.stats.hit_rate < 1
+
+
+def test_seeker_cache_is_order_insensitive_and_versioned(student):
+    tools.clear_result_caches()
+    hits_before = tools.SEEKER_CACHE.stats.hits
+    profile = student.to_payload()
+    first = tools.seeker_search_tool({"query": "open source impact", "profile": profile})
+    second = tools.seeker_search_tool({"query": "Impact  OPEN source", "profile": profile})
+    assert first == second
+    assert tools.SEEKER_CACHE.stats.hits == hits_before + 1
+
+    original = tools.SCHOLARSHIP_DB
+    version = tools.catalog_version()
+    try:
+        assert tools.set_catalog(original[:1]) != version
+        narrowed = tools.seeker_search_tool({"query": "open source impact", "profile": profile})
+        assert narrowed["scholarships"] == []
+    finally:
+        tools.set_catalog(load_demo_scholarships())
+    assert tools.catalog_version() == version
+
+
+def test_matcher_cache_keys_on_read_facets_only(student):
+    tools.clear_result_caches()
+    scholarships = [opp.to_payload() for opp in tools.SCHOLARSHIP_DB]
+    renamed = dict(student.to_payload(), name="Someone Else", skills=["Go"])
+    first = tools.matcher_filter_tool({"profile": student.to_payload(), "scholarships": scholarships})
+    second = tools.matcher_filter_tool({"profile": renamed, "scholarships": scholarships})
+    assert first == second
+    assert tools.MATCHER_CACHE.stats.hit_rate > 0
+
+
+def test_matcher_cache_sees_edited_payloads_with_the_same_id(student):
+    tools.clear_result_caches()
+    listing = tools.SCHOLARSHIP_DB[0].to_payload()
+    edited = dict(listing, amount=listing["amount"] + 500, deadline="2099-01-01")
+    profile = student.to_payload()
+    first = tools.matcher_filter_tool({"profile": profile, "scholarships": [listing]})
+    second = tools.matcher_filter_tool({"profile": profile, "scholarships": [edited]})
+    assert first["eligibility"][0]["scholarship"] == listing
+    assert second["eligibility"][0]["scholarship"] == edited
+
+
+def test_cached_results_are_copied_for_each_caller(student):
+    tools.clear_result_caches()
+    seeker_payload = {"query": "scholarship", "limit": 3}
+    result = tools.seeker_search_tool(seeker_payload)
+    title = result["scholarships"][0]["title"]
+    result["scholarships"][0]["title"] = "POISONED"
+    assert tools.seeker_search_tool(seeker_payload)["scholarships"][0]["title"] == title
+
+    listing = tools.SCHOLARSHIP_DB[0].to_payload()
+    matcher_payload = {"profile": student.to_payload(), "scholarships": [listing]}
+    eligibility = tools.matcher_filter_tool(matcher_payload)["eligibility"]
+    eligibility[0]["scholarship"]["title"] = "POISONED"
+    hits = tools.MATCHER_CACHE.stats.hits
+    again = tools.matcher_filter_tool(matcher_payload)["eligibility"]
+    assert again[0]["scholarship"] == listing
+    assert tools.MATCHER_CACHE.stats.hits == hits + 1  # keyed by catalog id, not content
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import pytest
+
+from research_scholar.data import aggregate_scholarships, load_demo_scholarships
+from research_scholar.dedup import MinHasher, ScholarshipDeduplicator, np, shingles
+from research_scholar.synthetic import generate_scholarships
+
+
+def _listing_from_partner_feed(opp):
+    return replace(
+        opp,
+        id=f"PARTNER-{opp.id}",
+        title=f"{opp.title} 2025",
+        description=opp.description.replace("Supports", "Supporting").replace("building", "who build"),
+        url="",
+    )
+
+
+def test_near_duplicates_merge_with_provenance():
+    demo = load_demo_scholarships()
+    deduplicator = ScholarshipDeduplicator()
+    deduplicator.add_many((opp, "demo") for opp in demo)
+    assert deduplicator.add(_listing_from_partner_feed(demo[0]), "partner") == "RS-001"
+    assert deduplicator.add(demo[0], "demo") == "RS-001"
+
+    merged = {entry.record.id: entry for entry in deduplicator.canonical()}
+    assert len(merged) == 3
+    assert [s["source"] for s in merged["RS-001"].sources] == ["demo", "partner"]
+    assert deduplicator.resolve("partner", "PARTNER-RS-001") == "RS-001"
+
+
+def test_similar_text_with_different_award_stays_distinct():
+    demo = load_demo_scholarships()
+    bigger = replace(_listing_from_partner_feed(demo[0]), amount=demo[0].amount * 3)
+    catalog = aggregate_scholarships({"demo": demo, "partner": [bigger]})
+    assert len(catalog.records) == 4 and catalog.merged() == {}
+
+
+def test_aggregate_keeps_provenance_of_merged_listings():
+    demo = load_demo_scholarships()
+    catalog = aggregate_scholarships({"demo": demo, "partner": [_listing_from_partner_feed(demo[0])]})
+    assert [record.id for record in catalog.records] == ["RS-001", "RS-002", "RS-003"]
+    assert [(s["source"], s["id"]) for s in catalog.merged()["RS-001"]] == [
+        ("demo", "RS-001"),
+        ("partner", "PARTNER-RS-001"),
+    ]
+
+
+def test_conflicting_eligibility_or_deadline_is_not_merged():
+    demo = load_demo_scholarships()
+    other_major = _listing_from_partner_feed(demo[0])
+    other_major.eligibility = {**demo[0].eligibility, "majors": ["biology"]}
+    later = replace(_listing_from_partner_feed(demo[0]), id="LATER", deadline="2025-06-30")
+    deduplicator = ScholarshipDeduplicator()
+    deduplicator.add_many((opp, "demo") for opp in demo)
+    assert deduplicator.add(other_major, "partner") != "RS-001"
+    assert deduplicator.add(later, "partner") != "RS-001"
+    assert deduplicator.canonical()[0].record.eligibility == demo[0].eligibility
+
+
+def test_distinct_synthetic_catalog_has_no_false_merges():
+    catalog = generate_scholarships(2000, seed=7)
+    deduplicator = ScholarshipDeduplicator()
+    deduplicator.add_many((opp, "synthetic") for opp in catalog)
+    assert len(deduplicator) == len(catalog)
+
+
+@pytest.mark.skipif(np is None, reason="numpy not installed")
+def test_vectorized_signatures_match_pure_python():
+    tokens = shingles("open source impact award code4good")
+    assert MinHasher(use_numpy=True).signature(tokens) == MinHasher(use_numpy=False).signature(tokens)
+
+
+def test_reingested_listing_with_new_terms_is_updated():
+    demo = load_demo_scholarships()
+    deduplicator = ScholarshipDeduplicator()
+    deduplicator.add_many((opp, "demo") for opp in demo)
+    deduplicator.add(_listing_from_partner_feed(demo[1]), "partner")
+
+    moved = replace(demo[0], deadline="2099-01-01", amount=demo[0].amount * 3)
+    assert deduplicator.add(moved, "demo") == "RS-001"
+    records = {record.id: record for record in deduplicator.canonical_records()}
+    assert (records["RS-001"].deadline, records["RS-001"].amount) == ("2099-01-01", moved.amount)
+    assert deduplicator.add(moved, "demo") == "RS-001" and len(deduplicator) == 3
+
+    # A merged source whose terms now conflict is split off; the rest keep the id.
+    changed = replace(demo[1], deadline="2099-01-01")
+    assert deduplicator.add(changed, "demo") == "demo:RS-002"
+    merged = {entry.record.id: entry for entry in deduplicator.canonical()}
+    assert [s["source"] for s in merged["RS-002"].sources] == ["partner"]
+    assert merged["RS-002"].record.deadline == demo[1].deadline
+    assert merged["demo:RS-002"].record.deadline == "2099-01-01"
+    assert deduplicator.resolve("demo", "RS-002") == "demo:RS-002"
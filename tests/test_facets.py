@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import pytest
+
+from research_scholar import tools
+from research_scholar.facets import Expr, FacetIndex, Range, Term, parse_filter
+from research_scholar.synthetic import generate_scholarships
+
+
+def _open_to(values, wanted):
+    lowered = [v.lower() for v in values]
+    return not lowered or "any" in lowered or wanted in lowered
+
+
+def test_expressions_match_a_record_scan():
+    catalog = generate_scholarships(500, seed=3)
+    index = FacetIndex(catalog, range_buckets=8)
+    expr = (
+        Term("effort_level", "Low")
+        & Term("citizenship", "Australia")
+        & Range("amount", 5000, 20000)
+        & ~Term("currency", "EUR")
+    ) | Term("major", "history", exact=True)
+
+    expected = [
+        opp.id
+        for opp in catalog
+        if (
+            opp.effort_level == "Low"
+            and _open_to(opp.eligibility.get("citizenship", []), "australia")
+            and 5000 <= opp.amount <= 20000
+            and opp.currency != "EUR"
+        )
+        or "history" in [m.lower() for m in opp.eligibility.get("majors", [])]
+    ]
+    assert [opp.id for opp in index.select(expr)] == expected
+    assert index.count(expr) == len(expected)
+    assert index.count(~expr) == len(catalog) - len(expected)
+
+
+def test_facet_counts_and_json_filters():
+    catalog = generate_scholarships(300, seed=5)
+    index = FacetIndex(catalog)
+    spec = {
+        "and": [
+            {"facet": "currency", "in": ["usd", "gbp"]},
+            {"not": {"facet": "effort_level", "value": "high"}},
+        ]
+    }
+    scope = [opp for opp in catalog if opp.currency in ("USD", "GBP") and opp.effort_level != "High"]
+
+    counts = index.facet_counts(["effort_level", "amount"], where=parse_filter(spec))
+    assert sum(counts["amount"].values()) == len(scope)
+    assert counts["effort_level"] == {
+        level.lower(): sum(1 for opp in scope if opp.effort_level == level)
+        for level in ("Low", "Medium")
+        if any(opp.effort_level == level for opp in scope)
+    }
+    assert parse_filter(spec).key() == parse_filter({"and": list(reversed(spec["and"]))}).key()
+
+
+def test_seeker_pre_filters_through_the_facet_index(student):
+    profile = student.to_payload()
+    unfiltered = tools.seeker_search_tool({"query": "", "limit": 50, "profile": profile})
+    filtered = tools.seeker_search_tool(
+        {
+            "query": "",
+            "limit": 50,
+            "profile": profile,
+            "filters": {"facet": "amount", "gte": 10000},
+        }
+    )
+    assert [s for s in unfiltered["scholarships"] if s["amount"] >= 10000] == filtered["scholarships"]
+    totals = tools.facet_counts_tool({"facets": ["currency"]})
+    assert totals["total"] == len(tools.SCHOLARSHIP_DB)
+    assert sum(totals["facets"]["currency"].values()) == totals["total"]
+
+
+def test_expressions_must_define_a_cache_key():
+    class Untyped(Expr):
+        pass
+
+    with pytest.raises(TypeError):
+        Untyped()
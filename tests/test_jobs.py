@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from research_scholar.jobs import (
+    JobQueue,
+    QueueFull,
+    Worker,
+    WorkerPool,
+    enqueue_report,
+    load_report,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_priority_retries_with_backoff_then_fails(tmp_path):
+    clock = FakeClock()
+    queue = JobQueue(tmp_path / "jobs.db", backoff_base=10.0, clock=clock)
+    low = queue.enqueue("flaky", {"n": 1}, max_attempts=2)
+    high = queue.enqueue("echo", {"n": 2}, priority=5)
+
+    calls = []
+
+    def flaky(payload):
+        calls.append(payload["n"])
+        raise RuntimeError("upstream 503")
+
+    worker = Worker(tmp_path / "jobs.db", "w1", handlers={"flaky": flaky, "echo": dict})
+    worker.queue.close()
+    worker.queue = queue
+    assert worker.run_once().id == high
+    assert queue.get(high).result == {"n": 2}
+
+    assert worker.run_once().id == low
+    assert queue.get(low).status == "queued"
+    assert worker.run_once() is None  # backing off for 10s
+    clock.now += 10
+    worker.run_once()
+    failed = queue.get(low)
+    assert (failed.status, failed.attempts, calls) == ("failed", 2, [1, 1])
+    assert "upstream 503" in failed.error
+
+
+def test_expired_lease_is_reclaimed_and_stale_worker_fenced(tmp_path):
+    clock = FakeClock()
+    queue = JobQueue(tmp_path / "jobs.db", clock=clock)
+    job_id = queue.enqueue("echo", {})
+    stale = queue.claim("w1", visibility_timeout=30)
+    assert queue.claim("w2", visibility_timeout=30) is None
+
+    clock.now += 31
+    fresh = queue.claim("w2", visibility_timeout=30)
+    assert (fresh.id, fresh.attempts) == (job_id, 2)
+    assert not queue.complete(stale, "late")
+    assert queue.complete(fresh, "ok")
+    assert queue.get(job_id).result == "ok"
+
+
+def test_depth_limit_applies_backpressure(tmp_path):
+    queue = JobQueue(tmp_path / "jobs.db", max_depth=2)
+    queue.enqueue("echo", {})
+    queue.enqueue("echo", {})
+    with pytest.raises(QueueFull):
+        queue.enqueue("echo", {})
+    with pytest.raises(QueueFull):
+        queue.enqueue("echo", {}, block=True, timeout=0.1)
+    queue.complete(queue.claim("w1"), None)
+    assert queue.enqueue("echo", {}) > 0
+
+
+def test_worker_pool_runs_report_jobs(tmp_path, student):
+    path = tmp_path / "jobs.db"
+    with JobQueue(path) as queue:
+        ids = [enqueue_report(queue, "computer science", student, limit=3) for _ in range(6)]
+        with WorkerPool(path, processes=2, poll_interval=0.01) as pool:
+            pool.drain(timeout=60)
+        jobs = [queue.get(job_id) for job_id in ids]
+        assert {job.status for job in jobs} == {"succeeded"}
+        assert jobs[0].result["profile"]["email"] == student.email
+        report = load_report(queue, ids)
+        assert report["jobs"] == 6 and report["status"]["succeeded"] == 6
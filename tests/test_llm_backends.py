@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from research_scholar.agents import AgentPool
+from research_scholar.cv_parser import ExtractedProfile, extract_profile_from_text
+from research_scholar.llm_backends import (
+    FakeLatencyLLM,
+    LatencyModel,
+    MissingRecordingError,
+    ReplayLLM,
+    register_llm,
+    unregister_llm,
+)
+
+
+def _profile_for(messages, schema):
+    return schema(name=messages[-1]["content"].splitlines()[0], gpa=3.9)
+
+
+def test_replay_llm_records_then_serves_offline(tmp_path):
+    delegate = FakeLatencyLLM(structured_responder=_profile_for)
+    recorder = ReplayLLM(tmp_path, delegate=delegate)
+    recorded = extract_profile_from_text("Ada Nguyen\nGPA 3.9", llm=recorder)
+    assert (recorder.misses, delegate.calls) == (1, 1)
+
+    replay = ReplayLLM(tmp_path, mode="replay", model=recorder.model)
+    assert extract_profile_from_text("Ada Nguyen\nGPA 3.9", llm=replay) == recorded
+    assert replay.hits == 1
+    with pytest.raises(MissingRecordingError):
+        extract_profile_from_text("Someone else", llm=replay)
+
+
+def test_replay_llm_records_concurrently(tmp_path):
+    delegate = FakeLatencyLLM(
+        latency=LatencyModel("constant", mean=0.01), structured_responder=_profile_for
+    )
+    recorder = ReplayLLM(tmp_path, delegate=delegate, mode="record")
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def worker():
+        barrier.wait()
+        try:
+            extract_profile_from_text("Ada Nguyen\nGPA 3.9", llm=recorder)
+        except Exception as exc:  # noqa: BLE001 - surfaced by the assert below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == [] and recorder.misses == 8
+    assert [path.suffix for path in tmp_path.iterdir()] == [".json"]
+
+
+def test_latency_models_are_seeded_and_non_negative():
+    samples = [LatencyModel("normal", mean=0.0, spread=1.0, seed=1).sample() for _ in range(3)]
+    assert samples == [samples[0]] * 3
+    model = LatencyModel("lognormal", mean=0.01, spread=0.5, seed=2)
+    assert all(model.sample() >= 0 for _ in range(100))
+    with pytest.raises(ValueError):
+        LatencyModel("bimodal")
+
+
+def test_registered_model_is_used_by_parser_and_agents(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    fake = FakeLatencyLLM(model="fake/gpt-4o-mini")
+    register_llm("fake/gpt-4o-mini", fake)
+    try:
+        profile = extract_profile_from_text("Any CV text", model="fake/gpt-4o-mini")
+        assert profile == ExtractedProfile()
+        assert AgentPool().get("seeker", "fake/gpt-4o-mini").llm is fake
+    finally:
+        unregister_llm("fake/gpt-4o-mini")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from conftest import make_student
+
+from research_scholar.profile_index import ProfileIndex
+from research_scholar.store import ReportStore
+from research_scholar.synthetic import generate_profiles, generate_scholarships
+from research_scholar.tools import matcher_filter_tool, seeker_search_tool
+
+
+def _forward_eligible(profiles, scholarship):
+    """Run the profile → scholarship pipeline tools one student at a time."""
+    eligible = set()
+    for profile in profiles:
+        payload = profile.to_payload()
+        found = seeker_search_tool({"query": "", "limit": 10_000, "profile": payload})
+        if scholarship.id not in {sch["id"] for sch in found["scholarships"]}:
+            continue
+        result = matcher_filter_tool({"profile": payload, "scholarships": [scholarship.to_payload()]})
+        if result["eligibility"][0]["fit_summary"].startswith("Strong"):
+            eligible.add(profile.email)
+    return eligible
+
+
+def test_reverse_match_agrees_with_forward_pipeline(monkeypatch):
+    from research_scholar import tools
+
+    profiles = generate_profiles(300, seed=5)
+    scholarships = generate_scholarships(40, seed=5)
+    monkeypatch.setattr(tools, "SCHOLARSHIP_DB", scholarships)
+    index = ProfileIndex(profiles)
+    for scholarship in scholarships:
+        assert index.eligible_students(scholarship) == _forward_eligible(profiles, scholarship)
+
+
+def test_upsert_notifies_only_newly_eligible(tmp_path, student):
+    scholarship = generate_scholarships(1, seed=1)[0]
+    scholarship.eligibility.update(
+        {"min_gpa": 3.5, "majors": ["computer science"], "citizenship": ["Any"], "location": ["any"]}
+    )
+    with ReportStore(tmp_path / "reports.db") as store:
+        store.save_profile(student)
+        store.save_profile(make_student(email="low@example.org", gpa=3.0))
+        index = ProfileIndex.from_store(store)
+
+    assert [n.student_email for n in index.upsert_scholarship(scholarship)] == [student.email]
+    assert index.upsert_scholarship(scholarship) == []
+
+    scholarship.eligibility["min_gpa"] = 2.5
+    assert [n.student_email for n in index.upsert_scholarship(scholarship)] == ["low@example.org"]
+
+    index.add(make_student(email="low@example.org", major="Biology"))
+    assert index.eligible_students(scholarship) == {student.email}
+
+
+def test_notified_sets_persist_across_processes(tmp_path, student):
+    scholarship = generate_scholarships(1, seed=2)[0]
+    scholarship.eligibility.update(
+        {"min_gpa": 2.0, "majors": [], "citizenship": ["Any"], "location": ["any"]}
+    )
+    path = tmp_path / "reports.db"
+    with ReportStore(path) as store:
+        store.save_profile(student)
+        first = ProfileIndex.from_store(store)
+    assert [n.student_email for n in first.upsert_scholarship(scholarship)] == [student.email]
+
+    # A fresh index over the same database stands in for the next nightly run.
+    with ReportStore(path) as store:
+        store.save_profile(make_student(email="new@example.org"))
+        second = ProfileIndex.from_store(store)
+    assert [n.student_email for n in second.upsert_scholarship(scholarship)] == ["new@example.org"]
+    assert second.upsert_scholarship(scholarship) == []
+
+    second.remove_scholarship(scholarship.id)
+    with ReportStore(path) as store:
+        third = ProfileIndex.from_store(store)
+    assert len(third.upsert_scholarship(scholarship)) == 2
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import csv
+import json
+import time
+
+import pytest
+from conftest import make_student
+
+from research_scholar.profile_loader import (
+    LoadReport,
+    ProfileValidationError,
+    iter_profile_chunks,
+    load_profile_index,
+    load_profiles,
+    parse_profile,
+)
+
+
+def test_jsonl_bad_rows_are_reported_without_aborting(tmp_path):
+    rows = [make_student(email=f"s{i}@example.org").to_payload() for i in range(25)]
+    rows[3]["gpa"] = "n/a"
+    del rows[7]["major"]
+    lines = [json.dumps(row) for row in rows]
+    lines.insert(12, '{"name": "truncated"')
+    path = tmp_path / "cohort.jsonl"
+    path.write_text("\n".join(lines) + "\n")
+
+    report = LoadReport()
+    profiles = load_profiles(path, chunk_size=10, report=report)
+    assert len(profiles) == report.loaded == 23
+    assert report.rejected == 3
+    assert [(e.line, e.field) for e in report.errors] == [(4, "gpa"), (8, "major"), (13, "<row>")]
+    assert profiles[-1].email == "s24@example.org"
+
+    index = load_profile_index(path, chunk_size=10)
+    assert len(index) == 23 and "s24@example.org" in index
+
+
+def test_load_time_excludes_the_consumer(tmp_path):
+    path = tmp_path / "cohort.jsonl"
+    path.write_text("".join(json.dumps(make_student().to_payload()) + "\n" for _ in range(6)))
+    report = LoadReport()
+    for _ in iter_profile_chunks(path, chunk_size=2, report=report):
+        time.sleep(0.1)
+    assert report.loaded == 6 and 0 < report.seconds < 0.1
+
+
+def test_csv_rows_split_list_and_demographic_cells(tmp_path):
+    payload = make_student().to_payload()
+    path = tmp_path / "cohort.csv"
+    with path.open("w", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=list(payload))
+        writer.writeheader()
+        row = {key: value for key, value in payload.items() if not isinstance(value, (list, dict))}
+        row.update(
+            interests="Human-Centered AI;Open Source",
+            skills='["Python", "React"]',
+            experiences="Maintainer of an OSS tutoring platform",
+            demographics="gender=women;first_generation=first-generation",
+            preferred_countries="",
+        )
+        writer.writerow(row)
+
+    profile = load_profiles(path)[0]
+    assert profile.gpa == 3.8
+    assert profile.to_payload() == {**payload, "preferred_countries": []}
+
+
+def test_parse_profile_names_every_bad_field():
+    with pytest.raises(ProfileValidationError, match="gpa.*email|email.*gpa"):
+        parse_profile({**make_student().to_payload(), "gpa": "high", "email": None})
+    assert parse_profile(json.dumps(make_student().to_payload())) == make_student()
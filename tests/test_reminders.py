@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import json
+
+from conftest import make_report
+
+from research_scholar.reminders import FileSink, ReminderScheduler
+
+
+def test_reminders_fire_in_batches_and_survive_restart(tmp_path, student):
+    report = make_report(student)
+    db = tmp_path / "reminders.db"
+    with ReminderScheduler(db) as scheduler:
+        total = scheduler.schedule_report(report)
+        assert total == 4 * len(report["tracker"]["schedules"])
+        first_due = min(r.due for r in scheduler.due("9999-12-31", limit=total))
+        sink = FileSink(tmp_path / "sent.jsonl")
+        assert scheduler.fire_due([sink], today=first_due, batch_size=1) >= 1
+
+    with ReminderScheduler(db) as scheduler:
+        fired = scheduler.fire_due([sink], today="9999-12-31", batch_size=2)
+        assert scheduler.pending_count() == 0
+
+    lines = (tmp_path / "sent.jsonl").read_text().splitlines()
+    assert len(lines) == total
+    assert len({json.loads(line)["id"] for line in lines}) == total
+    assert fired < total
+
+
+def test_regenerated_report_is_deduplicated(tmp_path, student):
+    report = make_report(student)
+    with ReminderScheduler(tmp_path / "reminders.db") as scheduler:
+        total = scheduler.schedule_report(report)
+        scheduler.fire_due([], today="9999-12-31")
+        scheduler.schedule_report(report)
+        assert scheduler.pending_count() == 0
+
+        moved = json.loads(json.dumps(report))
+        moved["tracker"]["schedules"][0]["milestones"][0]["due"] = "2099-01-01"
+        del moved["tracker"]["schedules"][1:]
+        scheduler.schedule_report(moved)
+        assert [r.due for r in scheduler.due("9999-12-31")] == ["2099-01-01"]
+        assert total > 4
+
+
+def test_regenerating_one_query_keeps_other_reports_reminders(tmp_path, student):
+    report = make_report(student)
+    other = json.loads(json.dumps(report))
+    other["query"] = "a different search"
+    with ReminderScheduler(tmp_path / "reminders.db") as scheduler:
+        total = scheduler.schedule_report(report)
+        scheduler.schedule_report(other)
+
+        trimmed = json.loads(json.dumps(report))
+        del trimmed["tracker"]["schedules"][1:]
+        scheduler.schedule_report(trimmed)
+        assert scheduler.pending_count() == total  # `other` still lists them
+
+        del other["tracker"]["schedules"][1:]
+        scheduler.schedule_report(other)
+        assert scheduler.pending_count() == len(trimmed["tracker"]["schedules"][0]["milestones"])
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from research_scholar import tools
+from research_scholar.api import create_app
+from research_scholar.orchestrator import ResearchScholarOrchestrator
+from research_scholar.report_query import QueryError, ReportQuery
+from research_scholar.store import ReportStore
+from research_scholar.synthetic import generate_scholarships
+
+
+@pytest.fixture
+def stored(tmp_path, student):
+    saved = tools.SCHOLARSHIP_DB
+    tools.set_catalog(generate_scholarships(300, seed=11))
+    try:
+        report = ResearchScholarOrchestrator().run("", student, limit=60)
+    finally:
+        tools.set_catalog(saved)
+    path = tmp_path / "reports.db"
+    with ReportStore(path) as store:
+        report_id = store.save_report(report)
+    return path, report_id, report
+
+
+def test_cursor_pages_follow_filtered_sort(stored):
+    path, report_id, report = stored
+    expected = sorted(
+        (
+            (-entry["scholarship"]["amount"], rank, entry["scholarship"]["id"])
+            for rank, entry in enumerate(report["ranker"]["ranked"])
+            if entry["scholarship"]["currency"] == "USD"
+        )
+    )
+    with ReportStore(path) as store:
+        query = ReportQuery(store)
+        seen, cursor = [], None
+        while True:
+            body = query.items(
+                report_id,
+                "scholarships",
+                filters={"currency": "USD"},
+                sort="-amount",
+                limit=7,
+                cursor=cursor,
+                fields=["id", "amount"],
+            ).body
+            assert all(set(item) == {"id", "amount"} for item in body["items"])
+            seen += [item["id"] for item in body["items"]]
+            cursor = body["next_cursor"]
+            if cursor is None:
+                break
+        assert body["total"] == len(expected) > 7
+        assert seen == [scholarship_id for _, _, scholarship_id in expected]
+
+        with pytest.raises(QueryError):
+            query.items(report_id, "scholarships", filters={"amount__near": 1})
+
+
+def test_summary_is_precomputed_and_conditional(stored):
+    path, report_id, report = stored
+    deadlines = sorted(entry["scholarship"]["deadline"] for entry in report["ranker"]["ranked"])
+    with ReportStore(path) as store:
+        query = ReportQuery(store)
+        first = query.summary(report_id, within_days=30, today=deadlines[0])
+        body = first.body
+        assert body["counts"]["scholarships"] == len(report["ranker"]["ranked"])
+        assert body["readiness"]["ready"] + body["readiness"]["not_ready"] == len(
+            report["verifier"]["qa_reports"]
+        )
+        assert sum(body["total_award_value"].values()) == sum(
+            entry["scholarship"]["amount"] for entry in report["ranker"]["ranked"]
+        )
+        assert body["upcoming_deadlines"][0]["date"] == deadlines[0]
+        assert all(entry["date"] <= body["window"]["to"] for entry in body["upcoming_deadlines"])
+
+        again = query.summary(report_id, 30, deadlines[0], if_none_match=first.etag)
+        assert (again.status, again.body) == (304, None)
+        assert query.summary(report_id, 31, deadlines[0], if_none_match=first.etag).status == 200
+
+
+def test_fastapi_endpoints_serve_etags(stored, student):
+    path, _, _ = stored
+    client = TestClient(create_app(path))
+    url = f"/students/{student.email}/scholarships"
+    params = {"amount__gte": "5000", "sort": "-score,deadline", "limit": "5", "fields": "id,score"}
+    response = client.get(url, params=params)
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 5
+    cached = client.get(url, params=params, headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+    assert client.get(f"/students/{student.email}/summary").status_code == 200
+    assert client.get(url, params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/students/nobody@example.org/summary").status_code == 404
+
+
+def test_university_rows_carry_fit_reasons(stored):
+    path, report_id, report = stored
+    with ReportStore(path) as store:
+        items = ReportQuery(store).items(report_id, "universities").body["items"]
+    assert items and all(item["reasons"] for item in items)
+    assert [item["reasons"] for item in items] == [
+        entry["fit_reasons"] for entry in report["universities"]["recommendations"]
+    ]
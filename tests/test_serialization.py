@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import pytest
+from conftest import make_report
+
+from research_scholar import serialization
+from research_scholar.tools import university_match_tool
+
+
+def test_dedupe_report_round_trip_shrinks_payload(student):
+    report = make_report(student)
+    report["universities"] = university_match_tool({"profile": student.to_payload(), "top_n": 3})
+
+    deduped = serialization.dedupe_report(report)
+    assert deduped["ranker"]["ranked"][0]["scholarship"] in deduped["catalog"]["scholarships"]
+    assert all(isinstance(sid, str) for sid in deduped["seeker"]["scholarships"])
+    assert isinstance(deduped["universities"]["recommendations"][0]["university"], str)
+    assert len(serialization.dumps(deduped)) < len(serialization.dumps(report))
+    assert serialization.expand_report(deduped) == report
+
+
+@pytest.mark.parametrize("backend", serialization.available_backends())
+def test_backends_are_compact_by_default(backend, student):
+    serializer = serialization.get_serializer(backend)
+    payload = student.to_payload()
+    compact = serializer.dumps(payload)
+    assert b"\n" not in compact
+    assert b"\n  " in serializer.dumps(payload, pretty=True)
+    assert serializer.loads(compact) == payload
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        serialization.get_serializer("yaml")
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from conftest import make_student
+
+from research_scholar import tools
+from research_scholar.orchestrator import ResearchScholarOrchestrator
+from research_scholar.sharding import ShardedCatalog, ShardError
+from research_scholar.synthetic import generate_profiles, generate_scholarships, generate_universities
+
+QUERY = "scholarships for women in computer science building social impact startups"
+
+
+@pytest.fixture
+def catalog():
+    scholarships, universities = generate_scholarships(3000, 5), generate_universities(300, 5)
+    previous = (tools.SCHOLARSHIP_DB, tools.UNIVERSITY_DB)
+    tools.set_catalog(scholarships, universities)
+    with ShardedCatalog(scholarships, universities, shards=3, timeout=5.0) as sharded:
+        yield sharded
+    tools.set_catalog(*previous)
+
+
+def test_sharded_results_match_single_process(catalog):
+    for profile in generate_profiles(8, 5):
+        payload = profile.to_payload()
+        seeker = tools.seeker_search_tool({"query": QUERY, "limit": 6, "profile": payload})
+        matcher = tools.matcher_filter_tool({"profile": payload, "scholarships": seeker["scholarships"]})
+        ranked = tools.ranker_score_tool(matcher)["ranked"]
+        assert seeker["scholarships"]
+        assert catalog.search(QUERY, payload, limit=6) == seeker
+        assert catalog.rank(QUERY, profile, limit=6) == {**seeker, **matcher, "ranked": ranked}
+        assert catalog.universities(profile, 4) == tools.university_match_tool(
+            {"profile": payload, "top_n": 4}
+        )
+
+    profile = make_student()
+    hits = tools.seeker_search_tool({"query": QUERY, "limit": None, "profile": profile.to_payload()})
+    everything = tools.ranker_score_tool(
+        tools.matcher_filter_tool({"profile": profile.to_payload(), **hits})
+    )["ranked"]
+    assert catalog.rank(QUERY, profile, limit=5, exhaustive=True)["ranked"] == everything[:5]
+
+    report = ResearchScholarOrchestrator(shards=catalog).run(QUERY, profile, limit=4)
+    assert report == ResearchScholarOrchestrator().run(QUERY, profile, limit=4)
+
+
+def test_timed_out_shard_yields_partial_results(catalog):
+    profile = make_student()
+    stalled = catalog._shards[1].process.pid
+    os.kill(stalled, signal.SIGSTOP)
+    try:
+        result = catalog.rank(QUERY, profile, limit=5, timeout=0.5)
+        assert result["partial"] is True and result["missing_shards"] == [1]
+        assert [status.alive for status in catalog.health(timeout=0.5)] == [True, False, True]
+    finally:
+        os.kill(stalled, signal.SIGCONT)
+    # The late replies are discarded; the next request sees the full catalog again.
+    assert "partial" not in catalog.rank(QUERY, profile, limit=5)
+
+
+def test_dead_shards_are_reported_and_restarted(catalog):
+    for shard in catalog._shards:
+        shard.process.terminate()
+        shard.process.join()
+    with pytest.raises(ShardError):
+        catalog.search(QUERY, limit=3)
+    assert [status.error for status in catalog.health(timeout=0.5)] == ["down"] * 3
+    assert catalog.restart_dead_shards() == [0, 1, 2]
+    assert all(status.alive for status in catalog.health())
+    assert catalog.search(QUERY, limit=3) == tools.seeker_search_tool({"query": QUERY, "limit": 3})
+
+
+def test_paused_shard_never_blocks_the_coordinator(catalog):
+    profile = make_student()
+    catalog.rank(QUERY, profile, limit=5)  # warm the shard indexes
+    stalled = catalog._shards[1].process.pid
+    os.kill(stalled, signal.SIGSTOP)
+    try:
+        # Far more requests than the paused shard's pipe buffer could hold.
+        for _ in range(400):
+            assert catalog.search(QUERY, limit=3, timeout=0.02)["missing_shards"] == [1]
+        for _ in range(20):
+            assert catalog.rank(QUERY, profile, limit=5, timeout=0.1)["missing_shards"] == [1]
+        assert [status.alive for status in catalog.health(timeout=0.1)] == [True, False, True]
+        catalog.timeout = 0.1
+        report = ResearchScholarOrchestrator(shards=catalog).run(QUERY, profile, limit=4)
+        assert report["partial"] is True and report["missing_shards"] == [1]
+        assert "partial" not in report["seeker"] and "partial" not in report["universities"]
+    finally:
+        os.kill(stalled, signal.SIGCONT)
+    assert "partial" not in catalog.rank(QUERY, profile, limit=5, timeout=5.0)
+
+
+def test_concurrent_callers_do_not_queue_behind_each_other(catalog):
+    profiles = generate_profiles(12, 9)
+    expected = [catalog.rank(QUERY, profile, limit=5) for profile in profiles]
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        assert list(pool.map(lambda p: catalog.rank(QUERY, p, limit=5), profiles)) == expected
+
+    stalled = catalog._shards[1].process.pid
+    os.kill(stalled, signal.SIGSTOP)
+    try:
+        slow = threading.Thread(target=catalog.search, args=(QUERY,), kwargs={"timeout": 3.0})
+        slow.start()
+        time.sleep(0.2)  # the slow caller is now waiting on the paused shard
+        began = time.monotonic()
+        assert catalog.search(QUERY, limit=3, timeout=0.2)["missing_shards"] == [1]
+        assert time.monotonic() - began < 1.0
+        slow.join()
+    finally:
+        os.kill(stalled, signal.SIGCONT)
+
+
+def test_zero_timeout_is_not_replaced_by_the_default(catalog):
+    stalled = catalog._shards[0].process.pid
+    os.kill(stalled, signal.SIGSTOP)
+    try:
+        began = time.monotonic()
+        assert not catalog.health(timeout=0)[0].alive
+        assert time.monotonic() - began < 1.0  # the default would wait catalog.timeout (5s)
+    finally:
+        os.kill(stalled, signal.SIGCONT)
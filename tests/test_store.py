@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from conftest import make_report, make_student
+
+from research_scholar.store import ReportStore
+
+
+def test_store_round_trip_and_top_ranked(tmp_path, student):
+    other = make_student(name="Lin Park", email="lin@example.org", location="Canada")
+    with ReportStore(tmp_path / "reports.db") as store:
+        ids = store.save_reports([make_report(student), make_report(other)])
+        assert len(ids) == 2
+        assert store.get_report(ids[0]) == make_report(student)
+        assert store.get_profile(other.email) == other
+
+        top = store.top_ranked("RS-003", top_k=3)
+        assert {row["student_email"] for row in top} == {student.email, other.email}
+        assert all(row["rank"] <= 3 for row in top)
+
+
+def test_store_queries_latest_report_only(tmp_path, student):
+    with ReportStore(tmp_path / "reports.db") as store:
+        store.save_report(make_report(student))
+        latest_id = store.save_report(make_report(student))
+        assert [row["report_id"] for row in store.top_ranked("RS-003")] == [latest_id]
+
+        due = store.reports_with_deadlines_within(10, today="2024-12-05")
+        assert [row["report_id"] for row in due] == [latest_id]
+        assert due[0]["next_deadline"] == "2024-12-10"
+        assert store.reports_with_deadlines_within(10, today="2026-01-01") == []